@@ -7,11 +7,16 @@
 
 import streamlit as st
 import datetime
-import os
-import importlib
 import time
-import sys
-from engine_core import GalacticCore
+import engine_streamlit
+import stylesheet
+from module_registry import ModuleRegistry, PluginCatalog
+from engine_streamlit import GalacticCore, thaw, SHARED_DB
+from engine_core import source_version
+from fragment_cache import FRAGMENTS
+from metrics import METRICS
+from profiler import ProfileSession, PROFILE_RERUNS, PROFILE_TOP_N
+from memory_diag import MemoryDiagnostics, start_tracing, stop_tracing
 
 # 1. SYSTEM INITIALISIERUNG
 st.set_page_config(
@@ -21,145 +26,247 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# 2. DESIGN ENGINE (CSS Injection)
-def inject_advanced_css():
-    st.markdown("""
-        <style>
-        /* --- FONTS --- */
-        @import url('https://fonts.googleapis.com/css2?family=Orbitron:wght@400;700&family=Rajdhani:wght@300;500;700&display=swap');
-
-        /* --- GLOBAL THEME --- */
-        .stApp {
-            background: radial-gradient(circle at 50% 10%, #1a1a2e 0%, #000000 90%);
-            color: #E0E0E0;
-            font-family: 'Rajdhani', sans-serif;
-        }
-
-        /* --- INPUT FIX (BRUTAL FORCE CONTRAST) --- */
-        /* Wir zwingen alle Eingabefelder auf hellen Hintergrund mit dunkler Schrift */
-        input {
-            background-color: #e0e0e0 !important; 
-            color: #000000 !important;
-            font-weight: bold !important;
-            border-radius: 4px !important;
-        }
-        /* Datum-Picker Icon */
-        div[data-baseweb="input"] {
-            background-color: #e0e0e0 !important;
-            border: 1px solid #fff !important;
-        }
-        /* Dropdown Menüs */
-        div[data-baseweb="select"] > div {
-            background-color: #222 !important;
-            color: #fff !important;
-        }
-
-        /* --- SIDEBAR STYLE --- */
-        [data-testid="stSidebar"] {
-            background-color: #050505;
-            border-right: 1px solid #333;
-        }
-        [data-testid="stSidebar"] h1, [data-testid="stSidebar"] h2, [data-testid="stSidebar"] h3, [data-testid="stSidebar"] label {
-            color: #eeeeee !important;
-        }
-        
-        /* --- MODULE CONTAINER --- */
-        .glass-container {
-            background: rgba(15, 15, 20, 0.85);
-            border: 1px solid rgba(255, 255, 255, 0.08);
-            box-shadow: 0 4px 20px rgba(0,0,0,0.5);
-            backdrop-filter: blur(15px);
-            border-radius: 12px;
-            padding: 20px;
-            margin-bottom: 20px;
-        }
-        
-        /* --- ERROR BOX --- */
-        .error-box { border: 1px solid #ff4b4b; background: rgba(50,0,0,0.5); }
-        </style>
-    """, unsafe_allow_html=True)
+# 2. DESIGN ENGINE (Ein Stylesheet für alles, Quellen: styles/)
+@st.cache_resource
+def get_stylesheet():
+    """Baut static/v21.min.css EINMAL pro Prozess (RELOAD ALL baut neu)."""
+    return stylesheet.build()
+
+def inject_stylesheet():
+    """
+    Pro Rerun nur ein <link>-Tag (identisches Markup -> der Browser behält das geladene
+    Stylesheet für die ganze Session). Ohne Static-Serving: minifiziertes CSS inline.
+    """
+    sheet = get_stylesheet()
+    if sheet.served and st.get_option("server.enableStaticServing"):
+        st.markdown(stylesheet.link_tag(sheet), unsafe_allow_html=True)
+    else:
+        st.markdown(stylesheet.style_tag(sheet), unsafe_allow_html=True)
 
 # 3. INFRASTRUKTUR
-def get_available_modules():
-    if not os.path.exists("modules"):
-        os.makedirs("modules")
-        return []
-    
-    files = [f[:-3] for f in os.listdir("modules") if f.startswith("mod_") and f.endswith(".py")]
-    
-    # Sortierung: Header & Dashboard zuerst
-    priority = ["mod_header", "mod_dashboard"]
-    sorted_files = [p for p in priority if p in files] + [f for f in files if f not in priority]
-    
-    return sorted_files
-
-def run_module_safely(mod_name, pulse, debug_mode):
+@st.cache_resource
+def get_plugin_catalog():
+    """EIN Manifest pro Prozess: neu gescannt nur, wenn sich modules/ ändert."""
+    return PluginCatalog("modules")
+
+@st.cache_resource
+def get_module_registry():
+    """EINE Registry pro Prozess: Module werden einmal importiert, Reload nur bei Änderung."""
+    return ModuleRegistry("modules")
+
+def session_profiler():
+    """Die cProfile-Sammlung dieser Session (liegt in st.session_state, überlebt Reruns)."""
+    profiler = st.session_state.get("_profiler")
+    if profiler is None:
+        profiler = st.session_state["_profiler"] = ProfileSession(PROFILE_RERUNS)
+    return profiler
+
+def session_memory():
+    """Die Speicher-Diagnose dieser Session (liegt in st.session_state, überlebt Reruns)."""
+    memory = st.session_state.get("_memory_diag")
+    if memory is None:
+        memory = st.session_state["_memory_diag"] = MemoryDiagnostics()
+    return memory
+
+def set_memory_tracing(enabled):
+    """tracemalloc an/aus. Gestoppt wird nur, was diese Session selbst gestartet hat."""
+    if enabled:
+        if start_tracing():
+            st.session_state["_memory_tracing"] = True
+    elif st.session_state.pop("_memory_tracing", False):
+        stop_tracing()
+        session_memory().reset()
+
+def call_probed(target, func, *args, profiler=None, memory=None):
+    """func(*args) unter den aktiven Diagnosen ausführen (Speicher außen, Profiler innen)."""
+    if profiler is not None:
+        func, args = profiler.run, (target, func) + args
+    if memory is not None:
+        return memory.measure(target, func, *args)
+    return func(*args)
+
+def run_module_safely(mod_name, pulse, debug_mode, dev_mode=False, profiler=None, memory=None):
     try:
-        start_time = time.time()
-        module_path = f"modules.{mod_name}"
-        
-        if module_path in sys.modules:
-            module = importlib.import_module(module_path)
-            importlib.reload(module)
-        else:
-            module = importlib.import_module(module_path)
+        # Import/Reload misst die Registry selbst (op "import"/"reload")
+        module = get_module_registry().get(mod_name, force_reload=dev_mode)
         
         if hasattr(module, "render"):
-            module.render(pulse)
-            duration = (time.time() - start_time) * 1000
+            start = time.perf_counter_ns()
+            call_probed(mod_name, module.render, pulse, profiler=profiler, memory=memory)
+            elapsed = time.perf_counter_ns() - start
+            METRICS.observe("render", mod_name, elapsed)
             if debug_mode:
-                st.caption(f"⏱️ [SYS] {mod_name}: {duration:.1f}ms")
+                st.caption(f"⏱️ [SYS] {mod_name}: {elapsed / 1e6:.1f}ms")
         else:
             st.error(f"⚠️ {mod_name}: Keine render()-Funktion!")
 
     except Exception as e:
         st.markdown(f"<div class='glass-container error-box'><h4>💥 Crash: {mod_name}</h4><p>{e}</p></div>", unsafe_allow_html=True)
 
+@st.fragment
+def module_fragment(mod_name, pulse, debug_mode, dev_mode=False, profiler=None, memory=None):
+    """
+    Jedes Modul in eigenem Fragment: Widgets in einem Modul rerunnen nur dieses Modul
+    (mit dem Pulse des letzten vollen Laufs) - nicht CSS, get_pulse & die übrigen Module.
+    """
+    run_module_safely(mod_name, pulse, debug_mode, dev_mode, profiler, memory)
+
+def render_memory_report(memory):
+    """Spitze/Behaltenes pro Ziel, Top-Stellen und Verlauf des getrackten Speichers."""
+    st.markdown("---")
+    st.subheader("🧠 Speicher-Diagnose (tracemalloc)")
+    st.caption(f"🧠 [SYS] {memory.summary()}")
+    for sample in memory.samples.values():
+        st.caption(f"{sample.target}: Spitze {sample.peak / 1024:.1f} KB • "
+                   f"behalten {sample.retained / 1024:+.1f} KB")
+        for site, size, count in sample.sites:
+            st.caption(f"  ↳ {site}: {size / 1024:+.1f} KB ({count:+d} Blöcke)")
+    with st.expander("Verlauf (getrackt / RSS pro Rerun)", expanded=False):
+        for r in list(memory.history)[-20:]:
+            rss = f" • RSS {r.rss / 1024 / 1024:.1f} MB" if r.rss is not None else ""
+            st.caption(f"Rerun {r.rerun}: {r.traced / 1024 / 1024:.2f} MB{rss}")
+    if memory.leaks:
+        with st.expander("Gewachsen seit Rerun 1 (Leak-Kandidaten)", expanded=True):
+            for site, size, count in memory.leaks:
+                st.caption(f"{site}: {size / 1024:+.1f} KB ({count:+d} Blöcke)")
+
+def render_profile_report(profiler):
+    """Top-N Funktionen (kumulierte Zeit) pro Ziel + .pstats-Download."""
+    st.markdown("---")
+    st.subheader("🔥 Profiler (cProfile)")
+    st.caption(f"🔥 [SYS] {profiler.summary()} • Zeiten unter Profiler (langsamer als sonst)")
+    if not profiler.stats:
+        return
+    st.download_button("⬇️ Alle Ziele (.pstats)", data=profiler.dump(), file_name="v21_profile.pstats",
+                       mime="application/octet-stream", key="profile_dump_all",
+                       help="Auswerten mit: python profiler.py v21_profile.pstats | snakeviz | flameprof")
+    for target in profiler.targets():
+        with st.expander(f"{target} • {profiler.total_ms(target):.1f}ms gesamt", expanded=False):
+            st.dataframe(profiler.top(target, PROFILE_TOP_N), hide_index=True)
+            st.download_button(f"⬇️ {target}.pstats", data=profiler.dump(target),
+                               file_name=f"v21_profile_{target}.pstats",
+                               mime="application/octet-stream", key=f"profile_dump_{target}")
+
 # ------------------------------------------------------------------------------
 # 4. MAIN COCKPIT
 # ------------------------------------------------------------------------------
 def main():
-    inject_advanced_css()
+    inject_stylesheet()
 
     with st.sidebar:
         st.header("🛸 V21 MISSION CONTROL")
-        
-        st.subheader("1. Zeit-Koordinate")
-        # Datumseingabe - jetzt lesbar!
-        target_date = st.date_input("Datum wählen", datetime.date.today(), 
-                                    min_value=datetime.date(1700, 1, 1), 
-                                    max_value=datetime.date(2300, 12, 31))
-        
-        st.divider()
-        
-        st.subheader("2. Module")
-        avail = get_available_modules()
-        active_mods = st.multiselect("Aktivierte Systeme", options=avail, default=avail)
-        
-        st.divider()
+        catalog = get_plugin_catalog()
+
+        # Ein Formular: Änderungen werden gesammelt und mit EINEM Rerun übernommen
+        # (statt einem vollen Rerun pro Datum, Modul-Klick oder Schalter)
+        with st.form("mission_control", border=False):
+            st.subheader("1. Zeit-Koordinate")
+            # Datumseingabe - jetzt lesbar!
+            target_date = st.date_input("Datum wählen", datetime.date.today(), 
+                                        min_value=datetime.date(1700, 1, 1), 
+                                        max_value=datetime.date(2300, 12, 31))
+            
+            st.divider()
+            
+            st.subheader("2. Module")
+            load_mode = st.toggle("Last-Modus (teure Module überspringen)", value=False)
+            avail = catalog.names(max_cost="medium" if load_mode else "heavy")
+            active_mods = st.multiselect("Aktivierte Systeme", options=avail, default=avail,
+                                         format_func=lambda m: (catalog.get(m) or {}).get("name", m))
+            
+            st.divider()
+
+            st.subheader("3. System-Kern")
+            debug_mode = st.toggle("Ingenieur-Modus (Debug)", value=False)
+            dev_mode = st.toggle("Dev-Modus (Module immer neu laden)", value=False)
+            profile_mode = st.toggle("Profiler (cProfile pro Modul)", value=False)
+            memory_mode = st.toggle("Speicher-Diagnose (tracemalloc)", value=False)
+            st.form_submit_button("🚀 Übernehmen", type="primary", width="stretch")
 
-        st.subheader("3. System-Kern")
-        debug_mode = st.toggle("Ingenieur-Modus (Debug)", value=False)
+        # Abhängige Bedienelemente & Buttons liegen außerhalb (Buttons sind im Formular nicht erlaubt)
+        if profile_mode:
+            profiler = session_profiler()
+            profiler.reruns = st.number_input("Reruns sammeln", min_value=1, max_value=200,
+                                              value=PROFILE_RERUNS, step=1)
+            if st.button("🔁 Profil neu starten"):
+                profiler.reset()
+        set_memory_tracing(memory_mode)
+        memory = session_memory() if memory_mode else None
+        if memory is not None:
+            targets = ["get_pulse", *active_mods, "inspector"]
+            memory.site_target = st.selectbox("Top-Stellen für (kostet Snapshots)", ["-", *targets])
+            if st.button("🔎 Leak-Stellen seit Rerun 1"):
+                memory.compare_leaks()
         
         if st.button("♻️ RELOAD ALL"):
             st.cache_data.clear()
+            st.cache_resource.clear()
+            GalacticCore.pulse_cache.clear()
+            engine_streamlit.session_pulse_cache().clear()
+            FRAGMENTS.clear()
             st.rerun()
 
     # --- ENGINE ---
+    # Nur die Sektionen vorab auflösen, die die aktiven Module deklarieren
+    needed = catalog.required_sections(active_mods)
+    copied_before = GalacticCore.cache.stats["bytes_copied"]
+    # Profiler: nur solange noch Reruns gesammelt werden, sonst ungebremst
+    active_profiler = profiler if profile_mode and profiler.begin_rerun() else None
     with st.spinner("Lade Daten-Puls..."):
-        pulse = GalacticCore.get_pulse(target_date)
+        pulse = call_probed("get_pulse", engine_streamlit.get_pulse, target_date, needed,
+                            profiler=active_profiler, memory=memory)
+    # Neue DB-Version -> gecachte HTML-Fragmente verwerfen
+    FRAGMENTS.sync(source_version())
+    copied_bytes = GalacticCore.cache.stats["bytes_copied"] - copied_before
 
     # --- RENDER PIPELINE ---
     for mod_name in active_mods:
-        run_module_safely(mod_name, pulse, debug_mode)
+        module_fragment(mod_name, pulse, debug_mode, dev_mode, active_profiler, memory)
+
+    if profile_mode:
+        render_profile_report(profiler)
         
     # --- PULSE INSPECTOR (Integriert!) ---
     # Das wolltest du sehen: Den nackten Puls.
     if debug_mode:
         st.markdown("---")
         st.subheader("🔍 Core Pulse Inspector")
+        # VOR dem Inspector festhalten - der liest den ganzen Pulse
+        touched = pulse.touched
+        resolved = pulse.resolved
+        st.caption(f"📋 [SYS] Benötigte Pulse-Sektionen: {', '.join(needed) or '-'} • Manifest-Scans: {catalog.scans}")
+        for meta in catalog.manifest():
+            if meta["error"]:
+                st.caption(f"⚠️ [SYS] Plugin {meta['id']}: {meta['error']}")
+        st.caption(f"🧩 [SYS] Angefasste Sektionen: {', '.join(touched) or '-'} • Aufgelöst: {', '.join(resolved) or '-'}")
+        reload_stats = get_module_registry().summary()
+        total_reloads = sum(r[2] for r in reload_stats)
+        total_ms = sum(r[3] for r in reload_stats)
+        st.caption(f"🔁 [SYS] Modul-Reloads (Prozess): {total_reloads} • Import/Reload-Zeit gesamt: {total_ms:.1f}ms")
+        with st.expander("Modul-Registry", expanded=False):
+            for name, imports, reloads, ms in reload_stats:
+                st.caption(f"{name}: {imports}× importiert • {reloads}× neu geladen • {ms:.1f}ms")
+        st.caption(f"⚡ [SYS] Pulse-Cache Prozess: {GalacticCore.pulse_cache.summary()}")
+        st.caption(f"⚡ [SYS] Pulse-Cache Session: {engine_streamlit.session_pulse_cache().summary()}")
+        st.caption(f"🧱 [SYS] Fragment-Cache (Prozess): {FRAGMENTS.summary()}")
+        with st.expander("Fragment-Cache pro Modul", expanded=False):
+            for name, hits, misses, rate in FRAGMENTS.module_summary():
+                st.caption(f"{name}: {hits} Hits / {misses} Misses ({rate:.0f}%)")
+        with st.expander("Laufzeit-Metriken (Prozess, p50/p95/p99)", expanded=False):
+            for row in METRICS.snapshot():
+                st.caption(f"{row['op']} {row['name']}: {row['count']}× • p50 {row['p50_ms']:.2f}ms • "
+                           f"p95 {row['p95_ms']:.2f}ms • p99 {row['p99_ms']:.2f}ms")
+        store = GalacticCore.persistent_cache()
+        if store is not None:
+            st.caption(f"💽 [SYS] Pulse-Cache Platte (alle Worker): {store.summary()}")
+        mode = "geteilt (read-only)" if SHARED_DB else "Kopie pro Aufruf"
+        st.caption(f"💾 [SYS] DB-Kopien in diesem Rerun: {copied_bytes / 1024:.1f} KB • Modus: {mode}")
         with st.expander("JSON Datenstrom ansehen (Raw Pulse)", expanded=True):
-            st.json(pulse)
+            call_probed("inspector", lambda: st.json(thaw(pulse)), memory=memory)
+
+    if memory is not None:
+        memory.end_rerun()
+        render_memory_report(memory)
 
 if __name__ == "__main__":
     main()
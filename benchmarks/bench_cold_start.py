@@ -0,0 +1,63 @@
+# ==============================================================================
+# ⏱️ BENCHMARK: KALTSTART (JSON vs. Snapshot)
+# ------------------------------------------------------------------------------
+# Misst in frischen Prozessen die Zeit bis zur geladenen Datenbank und bis zum
+# ersten Pulse - einmal über JSON, einmal über den Hash-geprüften Snapshot.
+# Aufruf (aus dem Verzeichnis mit den DB-Dateien, meist Repo-Root):
+#     python benchmarks/bench_cold_start.py
+# ==============================================================================
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import json, time, datetime
+t0 = time.perf_counter()
+import engine_core
+engine_core.USE_SNAPSHOT = {use_snapshot}
+from engine_core import GalacticCore
+t1 = time.perf_counter()
+GalacticCore.load_databases()
+t2 = time.perf_counter()
+GalacticCore.get_pulse(datetime.date(2024, 3, 1))
+t3 = time.perf_counter()
+print(json.dumps({{"import": t1 - t0, "load": t2 - t1, "first_pulse": t3 - t0}}))
+"""
+
+def measure(use_snapshot, runs=5):
+    """Startet `runs` frische Interpreter. Rückgabe: Mediane in ms."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [REPO_ROOT, os.environ.get("PYTHONPATH")])))
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", PROBE.format(use_snapshot=use_snapshot)],
+            cwd=os.getcwd(), env=env, capture_output=True, text=True, check=True
+        )
+        samples.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    return {key: statistics.median(s[key] for s in samples) * 1000 for key in samples[0]}
+
+def main():
+    import db_snapshot
+    from engine_core import DB_PATH_TZOLKIN, DB_PATH_MOON, share_subtrees
+
+    print("═" * 60)
+    print("⏱️  KALTSTART-BENCHMARK")
+    print("═" * 60)
+    try:
+        db_snapshot.build_snapshot([DB_PATH_TZOLKIN, DB_PATH_MOON], transform=share_subtrees)
+    except FileNotFoundError as e:
+        print(f"❌ Datenbank fehlt: {e.filename} (im Verzeichnis mit den DB-Dateien starten)")
+        return
+
+    for label, use_snapshot in (("JSON", False), ("Snapshot", True)):
+        r = measure(use_snapshot)
+        print(f"   {label:<9} Laden {r['load']:7.1f} ms | erster Pulse (inkl. Import) {r['first_pulse']:7.1f} ms")
+
+if __name__ == "__main__":
+    sys.path.insert(0, REPO_ROOT)
+    main()
@@ -0,0 +1,72 @@
+# ==============================================================================
+# 🎨 BENCHMARK: CSS-NUTZLAST PRO RERUN
+# ------------------------------------------------------------------------------
+# Rendert die App headless (streamlit.testing AppTest) und zählt, wie viele Bytes
+# Markdown/HTML pro Rerun an den Browser gehen - und wie viel davon CSS ist
+# (<style>-Blöcke + <link>-Tags). Der erste Lauf lädt das Stylesheet zusätzlich
+# einmal als statische Datei (siehe stylesheet.py), Reruns nicht mehr.
+# Aufruf:   python benchmarks/bench_css_payload.py [pfad/zur/app.py]
+#           Läuft im Verzeichnis der App (DB-Dateien & modules/ wie bei `streamlit run`).
+#           Vergleich mit einem älteren Stand: dessen app.py als Argument übergeben.
+# ==============================================================================
+
+import datetime
+import os
+import re
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CSS_TAGS = re.compile(r"<style>.*?</style>|<link[^>]*>", re.S)
+
+def payload(at):
+    """(Bytes gesamt, davon CSS) aller Markdown-Elemente des letzten Laufs."""
+    total = css = 0
+    for element in at.markdown:
+        body = element.value
+        total += len(body.encode("utf-8"))
+        css += sum(len(m.encode("utf-8")) for m in CSS_TAGS.findall(body))
+    return total, css
+
+def submit(at):
+    """Das Datum liegt im Sidebar-Formular -> erst der Submit-Button löst den Lauf aus."""
+    buttons = [b for b in at.sidebar.button if "Übernehmen" in str(b.label)]
+    if buttons:
+        buttons[0].click()
+    at.run()
+
+def run(app_path, static, reruns=3):
+    from streamlit import config
+    from streamlit.testing.v1 import AppTest
+
+    config.set_option("server.enableStaticServing", static)
+    at = AppTest.from_file(app_path, default_timeout=60)
+    at.run()
+    results = []
+    for i in range(reruns):
+        # Anderes Datum -> andere Farben/Variablen, wie beim echten Blättern
+        at.sidebar.date_input[0].set_value(datetime.date(2024, 1, 1) + datetime.timedelta(days=i * 7))
+        submit(at)
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+        results.append(payload(at))
+    total = sum(r[0] for r in results) / len(results)
+    css = sum(r[1] for r in results) / len(results)
+    return total, css
+
+def main():
+    app_path = os.path.abspath(sys.argv[1] if len(sys.argv) > 1 else os.path.join(REPO_ROOT, "app.py"))
+    print("═" * 60)
+    print(f"🎨 CSS-NUTZLAST PRO RERUN ({os.path.relpath(app_path)})")
+    os.chdir(os.path.dirname(app_path))
+    print("═" * 60)
+    print(f"   {'Modus':<22} {'Markdown':>10} {'davon CSS':>10}")
+    for label, static in (("Static-Serving (link)", True), ("ohne (inline)", False)):
+        total, css = run(app_path, static)
+        print(f"   {label:<22} {total:8.0f} B {css:8.0f} B")
+
+    stylesheet_path = os.path.join(os.path.dirname(app_path), "static", "v21.min.css")
+    if os.path.exists(stylesheet_path):
+        print(f"   -> einmalig pro Session: {os.path.getsize(stylesheet_path)} B static/v21.min.css")
+
+if __name__ == "__main__":
+    main()
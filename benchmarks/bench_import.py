@@ -0,0 +1,53 @@
+# ==============================================================================
+# ⏱️ BENCHMARK: IMPORT-ZEIT (Kern vs. Streamlit-Adapter)
+# ------------------------------------------------------------------------------
+# Misst in frischen Prozessen, wie lange der Import dauert und ob Streamlit
+# mitgeladen wird. Aufruf (aus dem Repo-Root):  python benchmarks/bench_import.py
+# ==============================================================================
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import sys, time, json
+t = time.perf_counter()
+import {module}
+dt = time.perf_counter() - t
+print(json.dumps({{"seconds": dt, "streamlit_loaded": "streamlit" in sys.modules}}))
+"""
+
+def measure_import(module, runs=5):
+    """Importiert `module` in `runs` frischen Interpretern. Rückgabe: Median & Streamlit-Flag."""
+    samples = []
+    streamlit_loaded = False
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", PROBE.format(module=module)],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        )
+        result = json.loads(out.stdout.strip().splitlines()[-1])
+        samples.append(result["seconds"])
+        streamlit_loaded = streamlit_loaded or result["streamlit_loaded"]
+    return {"module": module, "median_ms": statistics.median(samples) * 1000,
+            "streamlit_loaded": streamlit_loaded}
+
+def main():
+    print("═" * 60)
+    print("⏱️  IMPORT-BENCHMARK")
+    print("═" * 60)
+    for module in ("math_engine", "engine_core", "engine_streamlit"):
+        try:
+            r = measure_import(module)
+        except subprocess.CalledProcessError as e:
+            print(f"   {module:<18} ❌ Import fehlgeschlagen: {e.stderr.strip().splitlines()[-1]}")
+            continue
+        flag = "⚠️ lädt Streamlit" if r["streamlit_loaded"] else "✅ ohne Streamlit"
+        print(f"   {module:<18} {r['median_ms']:8.1f} ms   {flag}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# ==============================================================================
+# 🧠 BENCHMARK: SPEICHER DER DATENBANKEN (vorher / nachher Normalisierung)
+# ------------------------------------------------------------------------------
+# Misst per tracemalloc den dauerhaft belegten Speicher der geladenen DBs:
+#   - roh (json.load, dict/list)
+#   - eingefroren ohne Normalisierung (freeze)
+#   - eingefroren & normalisiert (freeze mit Pool: geteilte Teilbäume, interned Strings)
+# Aufruf (aus dem Verzeichnis mit den DB-Dateien):  python benchmarks/bench_memory.py
+# ==============================================================================
+
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def retained_bytes(build):
+    """Speicher, der nach build() dauerhaft belegt bleibt (Ergebnis wird gehalten)."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = build()
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return size, result
+
+def load_raw(paths):
+    data = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            data.append(json.load(f))
+    return data
+
+def main():
+    from engine_core import DB_PATH_TZOLKIN, DB_PATH_MOON, freeze
+
+    paths = [DB_PATH_TZOLKIN, DB_PATH_MOON]
+    missing = [p for p in paths if not os.path.exists(p)]
+    if missing:
+        print(f"❌ Datenbank fehlt: {', '.join(missing)} (im Verzeichnis mit den DB-Dateien starten)")
+        return
+
+    raw_size, _ = retained_bytes(lambda: load_raw(paths))
+    frozen_size, _ = retained_bytes(lambda: [freeze(db) for db in load_raw(paths)])
+
+    def normalized():
+        pool = {}
+        return [freeze(db, pool) for db in load_raw(paths)]
+    norm_size, (tzolkin, _) = retained_bytes(normalized)
+
+    seals = {id(r["identity"]["seal"]) for r in tzolkin}
+    tones = {id(r["identity"]["tone"]) for r in tzolkin}
+
+    print("═" * 60)
+    print("🧠 SPEICHER-REPORT (Tzolkin + 13-Monde)")
+    print("═" * 60)
+    print(f"   roh (json.load)            {raw_size / 1024 / 1024:7.2f} MB")
+    print(f"   eingefroren                {frozen_size / 1024 / 1024:7.2f} MB")
+    print(f"   eingefroren + normalisiert {norm_size / 1024 / 1024:7.2f} MB  "
+          f"({100 * (1 - norm_size / frozen_size):.0f}% weniger)")
+    print(f"   -> {len(tzolkin)} Kin-Records teilen sich {len(seals)} Siegel- & {len(tones)} Ton-Records")
+
+if __name__ == "__main__":
+    sys.path.insert(0, REPO_ROOT)
+    main()
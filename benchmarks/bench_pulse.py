@@ -0,0 +1,116 @@
+# ==============================================================================
+# 🧬 BENCHMARK: PULSE-OBJEKT vs. DICT-VERTRAG
+# ------------------------------------------------------------------------------
+# Simuliert einen Rerun: Pulse bauen + die Felder lesen, die die Module brauchen
+# (Kin, Siegel-ID, Ton-ID, Farbe, Wellen-Start, Schloss, Schalttag).
+#   - dict:   alter Vertrag (verschachtelte dicts, .get-Ketten, Skalare pro Modul neu berechnet)
+#   - Pulse:  __slots__-Objekt mit vorberechneten Skalaren (engine_core.Pulse)
+# Gemessen: Zeit pro Rerun und allozierte Bytes pro Rerun (tracemalloc).
+# Aufruf (aus dem Verzeichnis mit den DB-Dateien):  python benchmarks/bench_pulse.py
+# ==============================================================================
+
+import datetime
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def dict_pulse(target_date, kin_num, db_tzolkin, moon_index, hunab_ku):
+    """Der alte, eager gebaute dict-Pulse (Referenz)."""
+    tzolkin_data = hunab_ku if kin_num == 0 else db_tzolkin[(kin_num - 1) % 260]
+    moon_data = moon_index.get((target_date.day, target_date.month)) or {}
+    return {
+        "metadata": {
+            "date_object": target_date,
+            "date_str": target_date.strftime("%d.%m.%Y"),
+            "kin": kin_num,
+            "is_leap_day": kin_num == 0,
+            "is_day_out_of_time": moon_data.get("special_markers", {}).get("is_day_out_of_time", False)
+        },
+        "tzolkin": tzolkin_data,
+        "moon": moon_data
+    }
+
+def read_dict(pulse):
+    """Zugriffsmuster der Module auf den dict-Vertrag."""
+    meta = pulse["metadata"]
+    kin = meta["kin"]
+    identity = pulse["tzolkin"].get("identity", {})
+    seal_id = identity.get("seal", {}).get("id", 0)
+    tone_id = identity.get("tone", {}).get("id", 0)
+    color = identity.get("seal", {}).get("color", "Weiß")
+    wave_start = kin - tone_id + 1 if kin else 0
+    castle = (kin - 1) // 52 + 1 if kin else 0
+    return kin, seal_id, tone_id, color, wave_start, castle, meta["is_leap_day"]
+
+def read_object(pulse):
+    """Dasselbe über Attribute: Record einmal holen, dann nur noch Slots lesen."""
+    record = pulse.record
+    return (pulse.kin, record.seal_id, record.tone_id, record.color,
+            record.wave_start, record.castle, pulse.kin == 0)
+
+def run(build, read, work):
+    """Zeit (µs) und allozierte Bytes pro Rerun über alle Tage in `work`."""
+    for args in work[:500]:
+        read(build(*args))  # Aufwärmen (Record-Memos füllen)
+
+    t = time.perf_counter()
+    for args in work:
+        read(build(*args))
+    us = (time.perf_counter() - t) / len(work) * 1e6
+
+    gc.collect()
+    tracemalloc.start()
+    held = [build(*args) for args in work]
+    for pulse in held:
+        read(pulse)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return us, allocated / len(work)
+
+def main():
+    from engine_core import GalacticCore, HUNAB_KU_RECORD, CoreError
+    from math_engine import MathEngine
+
+    try:
+        db_tzolkin, _, moon_index = GalacticCore.load_databases()
+    except CoreError as e:
+        print(f"❌ {e} (im Verzeichnis mit den DB-Dateien starten)")
+        return
+
+    start = datetime.date(2000, 1, 1)
+    dates = [start + datetime.timedelta(days=i) for i in range(20000)]
+    work = [(d, MathEngine.get_kin(d.day, d.month, d.year), db_tzolkin, moon_index) for d in dates]
+
+    dict_us, dict_bytes = run(lambda *a: dict_pulse(*a, HUNAB_KU_RECORD), read_dict, work)
+    obj_us, obj_bytes = run(GalacticCore._assemble_pulse, read_object, work)
+
+    # Reiner Feldzugriff auf bereits gebaute Pulse
+    d = dict_pulse(*work[100], HUNAB_KU_RECORD)
+    o = GalacticCore._assemble_pulse(*work[100])
+    read_object(o)
+    loops = 200000
+    t = time.perf_counter()
+    for _ in range(loops):
+        read_dict(d)
+    dict_read = (time.perf_counter() - t) / loops * 1e9
+    t = time.perf_counter()
+    for _ in range(loops):
+        read_object(o)
+    obj_read = (time.perf_counter() - t) / loops * 1e9
+
+    print("═" * 60)
+    print(f"🧬 PULSE-BENCHMARK ({len(work)} Tage)")
+    print("═" * 60)
+    print(f"   {'':<8} {'Rerun':>10} {'Bytes/Rerun':>12} {'7 Felder lesen':>16}")
+    print(f"   {'dict':<8} {dict_us:8.2f}µs {dict_bytes:12.0f} {dict_read:14.0f}ns")
+    print(f"   {'Pulse':<8} {obj_us:8.2f}µs {obj_bytes:12.0f} {obj_read:14.0f}ns")
+    print(f"   -> Rerun {100 * (1 - obj_us / dict_us):.0f}% schneller, "
+          f"{100 * (1 - obj_bytes / dict_bytes):.0f}% weniger Allokation")
+
+if __name__ == "__main__":
+    sys.path.insert(0, REPO_ROOT)
+    main()
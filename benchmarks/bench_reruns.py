@@ -0,0 +1,126 @@
+# ==============================================================================
+# 🔁 BENCHMARK: SKRIPT-LÄUFE PRO NUTZER-INTERAKTION
+# ------------------------------------------------------------------------------
+# Startet die App headless (wie load_test.py) und spielt typische Abläufe über den
+# Websocket nach - mit der Frontend-Logik für Formulare & Fragmente:
+#   - Widget außerhalb eines Formulars geändert -> sofort ein voller Rerun
+#   - Widget in einem st.form geändert          -> wartet auf den Submit-Button
+#   - Widget in einem st.fragment               -> Rerun nur dieses Fragments
+# ABLÄUFE:
+#   sidebar  - Datum ändern, ein Modul abwählen, Debug an (drei Änderungen)
+#   module   - Interaktion in einem Modul (Rerun des Modul-Fragments; ohne Fragmente
+#              ein voller Rerun) - gemessen für jedes Modul reihum
+# Gezählt: Skript-Läufe (voll / Fragment) pro Ablauf und die Serverzeit dafür.
+# Aufruf:   python benchmarks/bench_reruns.py [pfad/zur/app.py ...] [--repeat 5]
+#           Mehrere app.py (z.B. ein älterer Stand) -> Vergleich nebeneinander.
+# BENÖTIGT: websockets (pip install -r requirements-dev.txt) - sonst Abbruch mit Hinweis.
+# ==============================================================================
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from load_test import (DEBUG_LABEL, DATE_LABEL, MODULES_LABEL, REPO_ROOT, Session,
+                       free_port, start_worker, stop_worker)
+
+FRAGMENT_STATUS = 3  # ForwardMsg.FINISHED_FRAGMENT_RUN_SUCCESSFULLY
+
+class Journey:
+    """Zählt die Skript-Läufe eines Ablaufs (voll / Fragment) und ihre Dauer."""
+
+    def __init__(self, session):
+        self.session = session
+        self.full = 0
+        self.fragment = 0
+        self.seconds = 0.0
+
+    async def run(self, fragment_id=""):
+        self.seconds += await self.session.rerun(fragment_id)
+        if self.session.last_status == FRAGMENT_STATUS:
+            self.fragment += 1
+        else:
+            self.full += 1
+
+    async def changed(self, label):
+        """Nach einer Widget-Änderung: sofort rerunnen - außer das Widget liegt in einem Formular."""
+        if not self.session.in_form(label):
+            await self.run()
+
+    async def submit(self):
+        """Submit-Button der geänderten Formulare klicken (nichts geändert = kein Lauf)."""
+        if self.session.dirty_forms:
+            await self.run()
+
+async def sidebar_journey(session):
+    journey = Journey(session)
+    session.set_date(session.random_date())
+    await journey.changed(DATE_LABEL)
+    session.toggle_modules()
+    await journey.changed(MODULES_LABEL)
+    session.set_toggle(DEBUG_LABEL, not session._state(DEBUG_LABEL).bool_value)
+    await journey.changed(DEBUG_LABEL)
+    await journey.submit()
+    return journey
+
+async def module_journey(session, index):
+    """Eine Interaktion im index-ten Modul: sein Fragment rerunnen, ohne Fragmente die ganze App."""
+    journey = Journey(session)
+    fragment_ids = list(session.fragments)
+    await journey.run(fragment_ids[index % len(fragment_ids)] if fragment_ids else "")
+    return journey
+
+async def measure(port, repeat, seed):
+    import websockets
+
+    url = f"ws://127.0.0.1:{port}/_stcore/stream"
+    async with websockets.connect(url, subprotocols=["streamlit"], origin=f"http://127.0.0.1:{port}",
+                                  max_size=None) as ws:
+        session = Session(ws, random.Random(seed))
+        await session.rerun()  # Erster Seitenaufruf
+        results = {"sidebar": [], "module": []}
+        for i in range(repeat):
+            results["sidebar"].append(await sidebar_journey(session))
+            if session.last_status == FRAGMENT_STATUS:
+                await session.rerun()  # Fragment-IDs stammen aus vollen Läufen
+            results["module"].append(await module_journey(session, i))
+        return results, len(session.fragments), session.errors
+
+def main():
+    parser = argparse.ArgumentParser(description="V21 Skript-Läufe pro Interaktion")
+    parser.add_argument("apps", nargs="*", default=[os.path.join(REPO_ROOT, "app.py")])
+    parser.add_argument("--repeat", type=int, default=5, help="Wiederholungen pro Ablauf (Standard: %(default)s)")
+    parser.add_argument("--seed", type=int, default=21)
+    args = parser.parse_args()
+
+    try:
+        import websockets  # noqa: F401
+    except ImportError:
+        print("❌ Der Benchmark braucht das Paket `websockets` (pip install -r requirements-dev.txt)")
+        sys.exit(1)
+
+    print("═" * 60)
+    print(f"🔁 SKRIPT-LÄUFE PRO INTERAKTION ({args.repeat} Wiederholungen)")
+    print("═" * 60)
+    print(f"   {'App':<28} {'Ablauf':<8} {'voll':>5} {'Fragm.':>6} {'Zeit (Median)':>14} {'Fehler':>6}")
+    for app in args.apps:
+        app_path = os.path.abspath(app)
+        port = free_port()
+        proc = start_worker(app_path, port)
+        try:
+            results, fragments, errors = asyncio.run(measure(port, args.repeat, args.seed))
+        finally:
+            stop_worker(proc)
+        name = os.path.relpath(app_path)
+        for kind, journeys in results.items():
+            full = statistics.mean(j.full for j in journeys)
+            fragment = statistics.mean(j.fragment for j in journeys)
+            ms = statistics.median(j.seconds for j in journeys) * 1e3
+            print(f"   {name[-28:]:<28} {kind:<8} {full:5.1f} {fragment:6.1f} {ms:12.0f}ms {errors:>6}")
+        print(f"   {'':<28} ({fragments} Fragmente im vollen Lauf)")
+
+if __name__ == "__main__":
+    main()
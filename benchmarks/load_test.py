@@ -0,0 +1,315 @@
+# ==============================================================================
+# 👥 LASTTEST: GLEICHZEITIGE SESSIONS GEGEN EINEN STREAMLIT-WORKER
+# ------------------------------------------------------------------------------
+# Startet die App headless (`streamlit run`, ein Prozess = ein Worker) und spielt
+# N Browser-Sessions über den Websocket (/_stcore/stream) nach: Rerun anfordern,
+# auf script_finished warten, nächste Aktion. Jede Aktion setzt Widgets wie ein
+# Nutzer (Datum, Module an/aus, Debug) - gemessen wird die echte Rerun-Latenz
+# inkl. Protobuf & Websocket.
+# SZENARIEN (jeweils frischer Worker, damit Caches & RSS vergleichbar sind):
+#   today    - alle Sessions auf heute          -> Pulse-/Fragment-Cache-Treffer
+#   uniform  - Zufallsdaten 1700-2300          -> Cache-Misses, LRU-Evictions
+#   debug    - wie uniform + Ingenieur-Modus    -> Pulse-Inspector (st.json), Metriken
+# Formulare: Widgets in einem st.form schickt das Frontend erst mit dem Submit-Button
+# - die Session löst ihn deshalb beim nächsten Rerun mit aus (eine Aktion = ein Lauf).
+# Gemessen: Latenz p50/p95/p99/max, Durchsatz (Reruns/s), CPU & RSS des Workers
+# (alle 0.5 s aus /proc, Linux). Ergebnis zusätzlich als JSON (--out).
+# Aufruf:   python benchmarks/load_test.py [pfad/zur/app.py] [--sessions 8]
+#               [--reruns 20] [--scenario today|uniform|debug|all] [--out last.json]
+#           Läuft im Verzeichnis der App (DB-Dateien & modules/ wie bei `streamlit run`).
+# BENÖTIGT: websockets (pip install -r requirements-dev.txt) - sonst Abbruch mit Hinweis.
+# ==============================================================================
+
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCENARIOS = ("today", "uniform", "debug")
+MODULE_TOGGLE_RATE = 0.2  # Anteil der Aktionen, die die Modul-Auswahl ändern
+SAMPLE_SECONDS = 0.5
+RERUN_TIMEOUT = 60
+QUANTILES = (0.5, 0.95, 0.99)
+
+DATE_LABEL = "Datum wählen"
+MODULES_LABEL = "Aktivierte Systeme"
+DEBUG_LABEL = "Ingenieur-Modus (Debug)"
+
+# ==============================================================================
+# 🖥 WORKER (streamlit run als Kindprozess)
+# ==============================================================================
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def start_worker(app_path, port):
+    cmd = [sys.executable, "-m", "streamlit", "run", os.path.basename(app_path),
+           "--server.headless", "true", "--server.port", str(port),
+           "--server.address", "127.0.0.1", "--browser.gatherUsageStats", "false"]
+    proc = subprocess.Popen(cmd, cwd=os.path.dirname(app_path),
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"Worker beendet (Exit {proc.returncode})")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1):
+                return proc
+        except OSError:
+            time.sleep(0.2)
+    proc.kill()
+    raise RuntimeError("Worker nicht erreichbar (Timeout)")
+
+def stop_worker(proc):
+    proc.terminate()
+    try:
+        proc.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+
+def process_stats(pid):
+    """(CPU-Sekunden user+system, RSS in Bytes) eines Prozesses aus /proc (Linux)."""
+    with open(f"/proc/{pid}/stat", "r") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    cpu = (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    with open(f"/proc/{pid}/statm", "r") as f:
+        rss = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    return cpu, rss
+
+# ==============================================================================
+# 🧑‍🚀 SESSION (ein simulierter Browser-Tab)
+# ==============================================================================
+class Session:
+    """Hält die Widget-Zustände wie das Frontend und schickt sie mit jedem Rerun mit."""
+
+    def __init__(self, ws, rng):
+        self.ws = ws
+        self.rng = rng
+        self.widgets = {}   # Label -> Widget-Proto aus dem letzten Lauf
+        self.states = {}    # Widget-ID -> WidgetState (gesendete Werte)
+        self.submitters = {}    # Formular-ID -> Submit-Button-Proto
+        self.dirty_forms = set()  # Formulare mit geänderten, noch nicht abgeschickten Widgets
+        self.fragments = {}     # Fragment-ID -> Anzahl Elemente (aus dem letzten vollen Lauf)
+        self.last_status = None  # script_finished-Status des letzten Laufs
+        self.errors = 0
+
+    def in_form(self, label):
+        """True = Änderungen an diesem Widget warten auf den Submit-Button."""
+        return bool(self.widgets[label].form_id)
+
+    async def rerun(self, fragment_id=""):
+        """
+        Rerun anfordern (fragment_id = nur dieses Fragment) und bis script_finished lesen.
+        Geänderte Formulare werden dabei abgeschickt. Rückgabe: Latenz in Sekunden.
+        """
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        msg.rerun_script.page_script_hash = ""
+        msg.rerun_script.fragment_id = fragment_id
+        msg.rerun_script.widget_states.widgets.extend(self.states.values())
+        msg.rerun_script.widget_states.widgets.extend(
+            WidgetState(id=self.submitters[form_id].id, trigger_value=True)
+            for form_id in self.dirty_forms if form_id in self.submitters
+        )
+        self.dirty_forms.clear()
+        if not fragment_id:
+            self.fragments.clear()
+        start = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+        while True:
+            forward = ForwardMsg()
+            forward.ParseFromString(await asyncio.wait_for(self.ws.recv(), RERUN_TIMEOUT))
+            kind = forward.WhichOneof("type")
+            if kind == "delta" and forward.delta.WhichOneof("type") == "new_element":
+                if forward.delta.fragment_id and not fragment_id:
+                    self.fragments[forward.delta.fragment_id] = self.fragments.get(forward.delta.fragment_id, 0) + 1
+                element = forward.delta.new_element
+                element_type = element.WhichOneof("type")
+                if element_type == "exception":
+                    self.errors += 1
+                elif element_type in ("date_input", "multiselect", "checkbox"):
+                    proto = getattr(element, element_type)
+                    self.widgets[proto.label] = proto
+                elif element_type == "button" and element.button.is_form_submitter:
+                    self.submitters[element.button.form_id] = element.button
+            elif kind == "script_finished":
+                self.last_status = forward.script_finished
+                return time.perf_counter() - start
+
+    def _state(self, label):
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        proto = self.widgets[label]
+        if proto.form_id:
+            self.dirty_forms.add(proto.form_id)
+        widget_id = proto.id
+        state = self.states.get(widget_id)
+        if state is None:
+            state = self.states[widget_id] = WidgetState(id=widget_id)
+        return state
+
+    def set_date(self, date):
+        self._state(DATE_LABEL).string_array_value.data[:] = [date.isoformat()]
+
+    def set_toggle(self, label, value):
+        self._state(label).bool_value = value
+
+    def toggle_modules(self):
+        """Ein zufälliges Modul abwählen - oder (jedes zweite Mal) wieder alle an."""
+        options = list(self.widgets[MODULES_LABEL].options)
+        state = self._state(MODULES_LABEL)
+        current = list(state.string_array_value.data) or options  # noch nie gesetzt = Vorgabe (alle)
+        if len(current) < len(options) and self.rng.random() < 0.5:
+            state.string_array_value.data[:] = options
+        else:
+            dropped = self.rng.choice(options)
+            state.string_array_value.data[:] = [o for o in options if o != dropped]
+
+    def random_date(self):
+        proto = self.widgets[DATE_LABEL]
+        low = datetime.date.fromisoformat(proto.min.replace("/", "-"))
+        high = datetime.date.fromisoformat(proto.max.replace("/", "-"))
+        return low + datetime.timedelta(days=self.rng.randrange((high - low).days + 1))
+
+async def run_session(url, origin, scenario, reruns, think, seed, latencies, counter):
+    import websockets
+
+    rng = random.Random(seed)
+    async with websockets.connect(url, subprotocols=["streamlit"], origin=origin, max_size=None) as ws:
+        session = Session(ws, rng)
+        await session.rerun()  # Erster Seitenaufruf (zählt nicht zur Latenz)
+        if scenario == "debug":
+            session.set_toggle(DEBUG_LABEL, True)
+            await session.rerun()
+        for _ in range(reruns):
+            if rng.random() < MODULE_TOGGLE_RATE:
+                session.toggle_modules()
+            elif scenario == "today":
+                session.set_date(datetime.date.today())
+            else:
+                session.set_date(session.random_date())
+            latencies.append(await session.rerun())
+            counter[0] += 1
+            if think:
+                await asyncio.sleep(rng.uniform(0, 2 * think))
+        return session.errors
+
+async def sample(pid, counter, timeline, stop):
+    start = time.perf_counter()
+    last_cpu, _ = process_stats(pid)
+    last_t, last_done = start, 0
+    while not stop.is_set():
+        try:
+            await asyncio.wait_for(stop.wait(), SAMPLE_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+        now = time.perf_counter()
+        cpu, rss = process_stats(pid)
+        timeline.append({
+            "t": round(now - start, 2),
+            "cpu_pct": round(100 * (cpu - last_cpu) / (now - last_t), 1),
+            "rss_mb": round(rss / 1024 / 1024, 1),
+            "reruns_per_s": round((counter[0] - last_done) / (now - last_t), 1),
+        })
+        last_cpu, last_t, last_done = cpu, now, counter[0]
+
+async def run_scenario(port, pid, scenario, sessions, reruns, think, seed):
+    url = f"ws://127.0.0.1:{port}/_stcore/stream"
+    origin = f"http://127.0.0.1:{port}"
+    latencies, timeline, counter = [], [], [0]
+    stop = asyncio.Event()
+    _, rss_start = process_stats(pid)
+    sampler = asyncio.create_task(sample(pid, counter, timeline, stop))
+    start = time.perf_counter()
+    errors = await asyncio.gather(*(
+        run_session(url, origin, scenario, reruns, think, seed + i, latencies, counter)
+        for i in range(sessions)
+    ))
+    wall = time.perf_counter() - start
+    stop.set()
+    await sampler
+    return summarize(scenario, sessions, latencies, wall, sum(errors), rss_start, timeline)
+
+# ==============================================================================
+# 📋 AUSWERTUNG
+# ==============================================================================
+def percentile(ordered, q):
+    """Nearest-Rank wie metrics.Series.quantiles."""
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+def summarize(scenario, sessions, latencies, wall, errors, rss_start, timeline):
+    ordered = sorted(latencies)
+    cpu = [s["cpu_pct"] for s in timeline] or [0.0]
+    rss = [s["rss_mb"] for s in timeline] or [rss_start / 1024 / 1024]
+    result = {
+        "scenario": scenario, "sessions": sessions, "reruns": len(latencies), "errors": errors,
+        "seconds": round(wall, 2), "throughput": round(len(latencies) / wall, 2) if wall else 0.0,
+        "max_ms": round(ordered[-1] * 1e3, 1) if ordered else 0.0,
+        "cpu_avg_pct": round(statistics.mean(cpu), 1), "cpu_max_pct": max(cpu),
+        "rss_start_mb": round(rss_start / 1024 / 1024, 1), "rss_max_mb": max(rss), "rss_end_mb": rss[-1],
+        "timeline": timeline,
+    }
+    for q in QUANTILES:
+        result[f"p{int(q * 100)}_ms"] = round(percentile(ordered, q) * 1e3, 1)
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description="V21 Lasttest (gleichzeitige Sessions)")
+    parser.add_argument("app", nargs="?", default=os.path.join(REPO_ROOT, "app.py"))
+    parser.add_argument("--sessions", type=int, default=8, help="gleichzeitige Sessions (Standard: %(default)s)")
+    parser.add_argument("--reruns", type=int, default=20, help="Reruns pro Session (Standard: %(default)s)")
+    parser.add_argument("--think", type=float, default=0.0, help="mittlere Denkpause in s (0 = Dauerlast)")
+    parser.add_argument("--scenario", choices=SCENARIOS + ("all",), default="all")
+    parser.add_argument("--seed", type=int, default=21)
+    parser.add_argument("--out", default=None, help="Ergebnis-JSON inkl. Zeitverlauf")
+    args = parser.parse_args()
+
+    try:
+        import websockets  # noqa: F401
+    except ImportError:
+        print("❌ Der Lasttest braucht das Paket `websockets` (pip install -r requirements-dev.txt)")
+        sys.exit(1)
+
+    app_path = os.path.abspath(args.app)
+    scenarios = SCENARIOS if args.scenario == "all" else (args.scenario,)
+    print("═" * 60)
+    print(f"👥 LASTTEST ({os.path.relpath(app_path)}): {args.sessions} Sessions × {args.reruns} Reruns")
+    print("═" * 60)
+    print(f"   {'Szenario':<9} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8} {'Reruns/s':>9} "
+          f"{'CPU ø':>6} {'RSS max':>8} {'Fehler':>6}")
+    results = []
+    for scenario in scenarios:
+        port = free_port()
+        proc = start_worker(app_path, port)
+        try:
+            r = asyncio.run(run_scenario(port, proc.pid, scenario, args.sessions,
+                                         args.reruns, args.think, args.seed))
+        finally:
+            stop_worker(proc)
+        results.append(r)
+        print(f"   {scenario:<9} {r['p50_ms']:6.0f}ms {r['p95_ms']:6.0f}ms {r['p99_ms']:6.0f}ms "
+              f"{r['max_ms']:6.0f}ms {r['throughput']:9.1f} {r['cpu_avg_pct']:5.0f}% "
+              f"{r['rss_max_mb']:6.0f}MB {r['errors']:>6}")
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump({"sessions": args.sessions, "reruns": args.reruns, "think": args.think,
+                       "results": results}, f, indent=2)
+        print(f"   -> {os.path.relpath(args.out)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,324 @@
+# ==============================================================================
+# 📊 BENCHMARK-SUITE (Regressions-Check für Kern & Render-Pfad)
+# ------------------------------------------------------------------------------
+# Misst die Hot-Paths mit timeit (nur stdlib) und schreibt maschinenlesbares JSON:
+#   - MathEngine.get_kin (nahe & ferne Daten), get_oracle_kin_ids
+#   - GalacticCore.load_databases (kalt & warm), get_pulse (ein Datum, ein Jahr)
+#   - render() jedes Plugins aus modules/ gegen ein Stub-`st` (ohne Streamlit-
+#     Overhead; Fragment-Cache aus = reine Build-Kosten) + alle Module mit Cache
+# Gemessen wird reihum in Runden (jeder Fall einmal pro Runde), verglichen das
+# Minimum pro Fall mit benchmarks/baseline.json - der Median schwankt auf geteilten
+# Hosts um ×1.5. Langsamer als Baseline × Schwelle -> Exit-Code 1 (für CI).
+# Die Baseline gilt nur für die Maschine, auf der sie angelegt wurde: sie ist NICHT
+# eingecheckt, sondern wird auf dem Ziel-Host angelegt (in CI: mit dem Basis-Commit
+# --save-baseline, dann mit dem neuen Stand vergleichen). Passt der Host-Fingerabdruck
+# (CPU, Kerne, Python) nicht zur Baseline, wird der Vergleich übersprungen.
+# Aufruf (aus dem Verzeichnis mit den DB-Dateien, meist Repo-Root):
+#     python benchmarks/suite.py [--out ergebnis.json] [--threshold 1.25]
+#                                [--save-baseline] [--filter core.] [--rounds 9]
+# Die übrigen bench_*.py bleiben Einzel-Vergleiche (vorher/nachher einer Änderung).
+# ==============================================================================
+
+import argparse
+import collections
+import datetime
+import gc
+import importlib
+import json
+import os
+import platform
+import statistics
+import sys
+import timeit
+import types
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_PATH = os.path.join(REPO_ROOT, "benchmarks", "baseline.json")
+RESULTS_PATH = "bench_results.json"
+THRESHOLD = 1.25  # 25% langsamer als die Baseline = Regression
+ROUNDS = 9
+
+# Ein Fall: factory() liefert (stmt, setup). setup() stellt den Zustand des Falls her
+# (DB geladen, Caches gefüllt/geleert) und läuft vor JEDER Runde; stmt() läuft dann
+# `number`-mal und erledigt pro Aufruf `ops` Operationen.
+Case = collections.namedtuple("Case", ["name", "factory", "number", "ops", "needs_db"])
+
+CASES = []
+
+def case(name, number=1, ops=1, needs_db=False):
+    """Registriert eine Fabrik - gebaut wird erst beim Lauf (Importe, DB-Load)."""
+    def register(factory):
+        CASES.append(Case(name, factory, number, ops, needs_db))
+        return factory
+    return register
+
+def _noop():
+    pass
+
+# ==============================================================================
+# 🎭 STUB-STREAMLIT (Module rendern ohne Laufzeit, Deltas & Protobuf)
+# ==============================================================================
+class _Block:
+    """Container-Attrappe: Kontextmanager, jede Methode ist ein No-op, der wieder einen Block liefert."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __call__(self, *args, **kwargs):
+        return self
+
+    def __getattr__(self, name):
+        return self
+
+def _columns(spec, **kwargs):
+    return [_Block() for _ in range(spec if isinstance(spec, int) else len(spec))]
+
+def install_stub_streamlit():
+    """Ersetzt `streamlit` in sys.modules (muss VOR dem Import der Module passieren)."""
+    stub = types.ModuleType("streamlit")
+    stub.__getattr__ = lambda name: _Block()
+    stub.columns = _columns
+    sys.modules["streamlit"] = stub
+    return stub
+
+# ==============================================================================
+# 🧪 FÄLLE
+# ==============================================================================
+NEAR_DATES = [datetime.date(2024, 1, 1) + datetime.timedelta(days=i) for i in range(366)]
+FAR_DATES = [datetime.date(1700, 1, 1) + datetime.timedelta(days=i * 601) for i in range(366)]
+YEAR = (datetime.date(2024, 1, 1), datetime.date(2024, 12, 31))
+RENDER_DATES = [datetime.date(2024, 3, 1) + datetime.timedelta(days=i * 11) for i in range(28)]
+
+@case("math.get_kin.near", number=20, ops=len(NEAR_DATES))
+def _get_kin_near():
+    from math_engine import MathEngine
+    get_kin = MathEngine.get_kin
+    return lambda: [get_kin(d.day, d.month, d.year) for d in NEAR_DATES], _noop
+
+@case("math.get_kin.far", number=20, ops=len(FAR_DATES))
+def _get_kin_far():
+    from math_engine import MathEngine
+    get_kin = MathEngine.get_kin
+    return lambda: [get_kin(d.day, d.month, d.year) for d in FAR_DATES], _noop
+
+@case("math.get_oracle_kin_ids", number=20, ops=260)
+def _oracle_ids():
+    from math_engine import MathEngine
+    oracle = MathEngine.get_oracle_kin_ids
+    return lambda: [oracle(kin) for kin in range(1, 261)], _noop
+
+def _reset_core():
+    """Alle Prozess-Caches des Kerns leeren (DB, Pulse, Record-Sichten)."""
+    import engine_core
+    engine_core.GalacticCore.cache.clear()
+    engine_core.GalacticCore.pulse_cache.clear()
+    engine_core._KIN_RECORDS.clear()
+    engine_core._MOON_RECORDS.clear()
+
+@case("core.load_databases.cold", needs_db=True)
+def _load_cold():
+    from engine_core import GalacticCore
+    return GalacticCore.load_databases, _reset_core
+
+@case("core.load_databases.warm", number=10000, needs_db=True)
+def _load_warm():
+    from engine_core import GalacticCore
+    return GalacticCore.load_databases, GalacticCore.load_databases
+
+@case("core.get_pulse.single", number=200, needs_db=True)
+def _pulse_single():
+    from engine_core import GalacticCore
+    target = datetime.date(2024, 3, 1)
+
+    def stmt():
+        # Ohne Pulse-Cache: Kin rechnen + Pulse bauen + Sektionen auflösen
+        GalacticCore.pulse_cache.clear()
+        GalacticCore.get_pulse(target, ("metadata", "tzolkin", "moon"))
+    return stmt, GalacticCore.load_databases
+
+@case("core.get_pulse.cached", number=2000, needs_db=True)
+def _pulse_cached():
+    from engine_core import GalacticCore
+    target = datetime.date(2024, 3, 1)
+    return lambda: GalacticCore.get_pulse(target), lambda: GalacticCore.get_pulse(target)
+
+@case("core.get_pulse.year", ops=366, needs_db=True)
+def _pulse_year():
+    from engine_core import GalacticCore
+    dates = [YEAR[0] + datetime.timedelta(days=i) for i in range((YEAR[1] - YEAR[0]).days + 1)]
+
+    def setup():
+        GalacticCore.load_databases()
+        GalacticCore.pulse_cache.clear()
+
+    def stmt():
+        for d in dates:
+            GalacticCore.get_pulse(d, ("metadata", "tzolkin", "moon"))
+    return stmt, setup
+
+@case("core.iter_pulses.year", ops=366, needs_db=True)
+def _iter_year():
+    from engine_core import GalacticCore
+    return lambda: [p.materialize() for p in GalacticCore.iter_pulses(*YEAR)], GalacticCore.load_databases
+
+def _render_pulses():
+    from engine_core import GalacticCore
+    return [GalacticCore.get_pulse(d) for d in RENDER_DATES]
+
+def _plugin_names():
+    from module_registry import PluginCatalog
+    return PluginCatalog(os.path.join(REPO_ROOT, "modules")).names()
+
+def _register_render_cases():
+    """Ein Fall pro Plugin (Fragment-Cache aus) + alle Plugins mit warmem Fragment-Cache."""
+    from fragment_cache import FRAGMENTS, FRAGMENT_CACHE_SIZE
+
+    for name in _plugin_names():
+        def factory(name=name):
+            module = importlib.import_module(f"modules.{name}")
+            pulses = _render_pulses()
+            return lambda: [module.render(p) for p in pulses], lambda: FRAGMENTS.resize(0)
+        CASES.append(Case(f"render.{name}", factory, 10, len(RENDER_DATES), True))
+
+    def all_cached():
+        modules = [importlib.import_module(f"modules.{n}") for n in _plugin_names()]
+        pulses = _render_pulses()
+
+        def stmt():
+            for p in pulses:
+                for module in modules:
+                    module.render(p)
+
+        def setup():
+            FRAGMENTS.resize(FRAGMENT_CACHE_SIZE)
+            stmt()  # Cache füllen
+        return stmt, setup
+    CASES.append(Case("render.all.cached", all_cached, 10, len(RENDER_DATES), True))
+
+# ==============================================================================
+# ▶️ LAUF & VERGLEICH
+# ==============================================================================
+def run_cases(cases, rounds=ROUNDS):
+    """
+    Misst alle Fälle REIHUM (Runde für Runde statt Fall für Fall): Schwankungen des
+    Hosts treffen so alle Fälle gleich, das Minimum jedes Falls stammt aus der ganzen Laufzeit.
+    Rückgabe: Liste von dicts mit Minimum & Median pro Operation (µs).
+    """
+    built = [(c, *c.factory()) for c in cases]
+    samples = {c.name: [] for c in cases}
+    for _ in range(rounds):
+        for c, stmt, setup in built:
+            setup()
+            gc.collect()
+            seconds = timeit.Timer(stmt).timeit(number=c.number)
+            samples[c.name].append(seconds / (c.number * c.ops) * 1e6)
+    return [{"name": c.name, "min_us": min(samples[c.name]), "median_us": statistics.median(samples[c.name]),
+             "rounds": rounds, "number": c.number, "ops": c.ops} for c in cases]
+
+def host_fingerprint():
+    """Was absolute Zeiten vergleichbar macht: CPU-Modell, Kerne, Architektur, Python."""
+    cpu = platform.processor()
+    try:
+        with open("/proc/cpuinfo", "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    cpu = line.split(":", 1)[1].strip()
+                    break
+    except OSError:
+        pass
+    return {
+        "cpu": cpu,
+        "cpus": os.cpu_count(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+        "python": f"{platform.python_implementation()} {platform.python_version()}",
+    }
+
+def compare(results, baseline, threshold):
+    """[(name, aktuell, baseline, faktor, regression?)] für alle Fälle mit Baseline (Minimum)."""
+    known = {r["name"]: r for r in baseline.get("results", [])}
+    rows = []
+    for r in results:
+        base = known.get(r["name"])
+        if base is None or not base["min_us"]:
+            continue
+        factor = r["min_us"] / base["min_us"]
+        rows.append((r["name"], r["min_us"], base["min_us"], factor, factor > threshold))
+    return rows
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="V21 Benchmark-Suite")
+    parser.add_argument("--out", default=RESULTS_PATH, help="Ergebnis-JSON (Standard: %(default)s)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Baseline-JSON zum Vergleich")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="erlaubter Faktor (Standard: %(default)s)")
+    parser.add_argument("--save-baseline", action="store_true", help="Ergebnis als neue Baseline speichern")
+    parser.add_argument("--filter", default="", help="nur Fälle, deren Name damit beginnt")
+    parser.add_argument("--rounds", type=int, default=ROUNDS, help="Runden pro Fall (Standard: %(default)s)")
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, REPO_ROOT)
+    install_stub_streamlit()
+    _register_render_cases()
+
+    from engine_core import DB_PATH_TZOLKIN, DB_PATH_MOON
+    has_db = all(os.path.exists(p) for p in (DB_PATH_TZOLKIN, DB_PATH_MOON))
+
+    print("═" * 60)
+    print("📊 BENCHMARK-SUITE (pro Operation)")
+    print("═" * 60)
+    selected = [c for c in CASES if c.name.startswith(args.filter)]
+    skipped = [c.name for c in selected if c.needs_db and not has_db]
+    results = run_cases([c for c in selected if c.name not in skipped], args.rounds)
+    for r in results:
+        print(f"   {r['name']:<30} min {r['min_us']:10.2f} µs   (Median {r['median_us']:.2f})")
+    if skipped:
+        print(f"   ⚠️ {len(skipped)} Fälle ohne DB übersprungen (im Verzeichnis mit den DB-Dateien starten)")
+
+    report = {
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "fingerprint": host_fingerprint(),
+        "results": results,
+    }
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"   -> {os.path.relpath(args.out)}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"✅ Neue Baseline: {os.path.relpath(args.baseline)}")
+        return 0
+
+    try:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    except (OSError, ValueError):
+        print("   (keine Baseline - auf diesem Host mit --save-baseline anlegen)")
+        return 0
+    if baseline.get("fingerprint") != report["fingerprint"]:
+        theirs = baseline.get("fingerprint") or {}
+        diff = [f"{k}: {theirs.get(k)!r} -> {v!r}" for k, v in report["fingerprint"].items() if theirs.get(k) != v]
+        print("   ⚠️ Baseline stammt von einem anderen Host/Python - Vergleich übersprungen")
+        for line in diff:
+            print(f"      {line}")
+        print("      (auf diesem Host mit --save-baseline neu anlegen)")
+        return 0
+
+    rows = compare(results, baseline, args.threshold)
+    regressions = [row for row in rows if row[4]]
+    print("─" * 60)
+    print(f"   Vergleich mit Baseline ({baseline.get('created', '?')}, Schwelle ×{args.threshold:.2f})")
+    for name, current, base, factor, regressed in rows:
+        flag = "❌" if regressed else "✅"
+        print(f"   {flag} {name:<28} {base:9.2f} -> {current:9.2f} µs  (×{factor:.2f})")
+    if regressions:
+        print(f"❌ {len(regressions)} Regression(en)")
+        return 1
+    print("✅ Keine Regression")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
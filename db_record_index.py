@@ -0,0 +1,226 @@
+# ==============================================================================
+# 🗂️ DB RECORD INDEX (Random Access ohne Voll-Parse)
+# ------------------------------------------------------------------------------
+# ZWECK:    Für CLI-Abfragen & kurzlebige Worker: Ein Sidecar-Index speichert die
+#           Byte-Range jedes Records im JSON-Array. Gelesen wird per mmap, dekodiert
+#           wird NUR der angefragte Record.
+# SIDECAR:  <datei>.idx.json  (wird bei Größen- oder mtime-Änderung neu gebaut)
+# AKTUALITÄT: Vor jedem Zugriff ein os.stat - wurde die Quelle ersetzt oder in-place
+#           neu geschrieben, werden Index & mmap neu aufgebaut (nie alte Offsets).
+# ==============================================================================
+
+import json
+import mmap
+import os
+import threading
+from collections.abc import Sequence
+
+INDEX_VERSION = 1
+INDEX_SUFFIX = ".idx.json"
+
+def _source_stamp(path):
+    stat = os.stat(path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+def build_record_index(path, key_field=None):
+    """
+    Scannt das Top-Level-Array einer JSON-Datei und liefert die Byte-Ranges aller Records.
+    Trick: latin-1 bildet jedes Byte auf genau ein Zeichen ab -> Zeichen- = Byte-Position.
+    Rückgabe: {"version", "source", "ranges": [[start, end], ...], "keys": {key: position}}
+    """
+    with open(path, "rb") as f:
+        text = f.read().decode("latin-1")
+
+    decoder = json.JSONDecoder(strict=False)
+    ranges = []
+    keys = {}
+
+    pos = text.index("[") + 1
+    while True:
+        # Whitespace & Kommas zwischen den Records überspringen
+        while text[pos] in " \t\r\n,":
+            pos += 1
+        if text[pos] == "]":
+            break
+        record, end = decoder.raw_decode(text, pos)
+        if key_field is not None and isinstance(record, dict) and key_field in record:
+            # Schlüssel sind ASCII (Kin-Nummer, "DD.MM") und daher latin-1-sicher
+            keys[str(record[key_field])] = len(ranges)
+        ranges.append([pos, end])
+        pos = end
+
+    return {"version": INDEX_VERSION, "source": _source_stamp(path), "ranges": ranges, "keys": keys}
+
+def load_record_index(path, key_field=None):
+    """
+    Lädt den Sidecar-Index. Fehlt er oder passen Größe/mtime der Quelle nicht,
+    wird er neu gebaut und (falls möglich) gespeichert.
+    """
+    index_path = path + INDEX_SUFFIX
+    try:
+        with open(index_path, "r", encoding="utf-8") as f:
+            index = json.load(f)
+        if index.get("version") == INDEX_VERSION and index.get("source") == _source_stamp(path):
+            return index
+    except (OSError, ValueError):
+        pass
+
+    index = build_record_index(path, key_field)
+    try:
+        tmp_path = index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f)
+        os.replace(tmp_path, index_path)
+    except OSError:
+        pass  # Schreibgeschütztes Verzeichnis: Index nur im Speicher
+    return index
+
+class _IndexView:
+    """Ein konsistenter Stand: Index, mmap & dekodierte Records derselben Datei-Version."""
+
+    __slots__ = ("stamp", "ranges", "keys", "mm", "records")
+
+    def __init__(self, path, key_field):
+        index = load_record_index(path, key_field)
+        self.stamp = index["source"]
+        self.ranges = index["ranges"]
+        self.keys = index["keys"]
+        self.records = {}
+        with open(path, "rb") as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+class IndexedJsonArray(Sequence):
+    """
+    Read-only Sicht auf ein JSON-Array: arr[i] und arr.get(key) dekodieren nur
+    den einen Record (per mmap) und merken ihn sich. `wrap` z.B. engine_core.freeze.
+    Nicht dekodierbare Records werfen `error` (z.B. engine_core.DatabaseCorruptError).
+    """
+
+    def __init__(self, path, key_field=None, wrap=None, error=ValueError):
+        self.path = path
+        self.key_field = key_field
+        self._wrap = wrap
+        self._error = error
+        self._lock = threading.Lock()
+        self._view = _IndexView(path, key_field)
+        self.rebuilds = 0
+
+    @property
+    def stamp(self):
+        """Größe & mtime der Quelle, zu der Index & mmap gehören."""
+        return self._view.stamp
+
+    def _current(self):
+        """Aktueller Stand; bei geänderter Quelle Index & mmap neu (alte Views bleiben gültig)."""
+        view = self._view
+        try:
+            stamp = _source_stamp(self.path)
+        except OSError:
+            return view  # Datei weg/gesperrt: die gemappte alte Version bleibt lesbar
+        if stamp != view.stamp:
+            with self._lock:
+                if stamp != self._view.stamp:
+                    try:
+                        self._view = _IndexView(self.path, self.key_field)
+                    except (ValueError, IndexError) as e:
+                        raise self._error(f"{self.path}: Index nicht neu aufbaubar ({e})") from e
+                    self.rebuilds += 1
+                view = self._view
+        return view
+
+    def __len__(self):
+        return len(self._current().ranges)
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(len(self)))]
+        view = self._current()
+        if position < 0:
+            position += len(view.ranges)
+        return self._record(view, position)
+
+    def _record(self, view, position):
+        record = view.records.get(position)
+        if record is None:
+            start, end = view.ranges[position]
+            try:
+                record = json.loads(view.mm[start:end].decode("utf-8"))
+            except ValueError as e:  # JSONDecodeError & UnicodeDecodeError
+                raise self._error(f"{self.path}: Record {position} nicht lesbar ({e})") from e
+            if self._wrap is not None:
+                record = self._wrap(record)
+            with self._lock:
+                record = view.records.setdefault(position, record)
+        return record
+
+    def get(self, key, default=None):
+        """Record über den Schlüssel (key_field), z.B. "01.03" für die Monde-DB."""
+        view = self._current()
+        position = view.keys.get(str(key))
+        if position is None:
+            return default
+        return self._record(view, position)
+
+    @property
+    def decoded_count(self):
+        """Wie viele Records wurden bisher tatsächlich dekodiert?"""
+        return len(self._view.records)
+
+    def close(self):
+        self._view.mm.close()
+
+class DayMonthIndex:
+    """Adapter: (Tag, Monat) -> Record, gleiche Schnittstelle wie der Moon-Index des Kerns."""
+
+    def __init__(self, records):
+        self._records = records
+        self._day_out_of_time = False  # False = noch nicht gesucht
+
+    @property
+    def day_out_of_time(self):
+        """
+        (Tag, Monat) mit special_markers.is_day_out_of_time. Einmal pro Index gesucht
+        (dekodiert dabei alle Records), danach gemerkt.
+        """
+        if self._day_out_of_time is False:
+            found = None
+            for record in self._records:
+                if (record.get("special_markers") or {}).get("is_day_out_of_time"):
+                    day, month = map(int, record.get("date_gregorian", "").split("."))
+                    found = (day, month)
+                    break
+            self._day_out_of_time = found
+        return self._day_out_of_time
+
+    def get(self, day_month, default=None):
+        day, month = day_month
+        return self._records.get(f"{day:02d}.{month:02d}", default)
+
+    def __getitem__(self, day_month):
+        record = self.get(day_month)
+        if record is None:
+            raise KeyError(day_month)
+        return record
+
+    def __contains__(self, day_month):
+        return self.get(day_month) is not None
+
+# ==============================================================================
+# 🛠 TERMINAL: Index bauen & Einzel-Lookup testen
+# ==============================================================================
+if __name__ == "__main__":
+    import time
+    from engine_core import DB_PATH_TZOLKIN, DB_PATH_MOON
+
+    for source, key_field in ((DB_PATH_TZOLKIN, "kin"), (DB_PATH_MOON, "date_gregorian")):
+        if not os.path.exists(source):
+            print(f"⚠️ {source} fehlt - übersprungen.")
+            continue
+        t = time.perf_counter()
+        records = IndexedJsonArray(source, key_field)
+        t_open = (time.perf_counter() - t) * 1000
+        t = time.perf_counter()
+        records[0]
+        t_one = (time.perf_counter() - t) * 1000
+        print(f"✅ {source}: {len(records)} Records | Öffnen {t_open:.1f} ms | 1 Record {t_one:.2f} ms")
+        records.close()
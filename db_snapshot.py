@@ -0,0 +1,106 @@
+# ==============================================================================
+# 📦 DB SNAPSHOT (Binärer Kaltstart-Cache)
+# ------------------------------------------------------------------------------
+# ZWECK:    Kompiliert die JSON-Datenbanken in einen versionierten marshal-Snapshot.
+#           Der Loader bevorzugt den Snapshot, prüft aber IMMER den Inhalts-Hash
+#           der Quell-JSONs. Weicht er ab -> Fallback auf JSON.
+# BUILD:    python db_snapshot.py
+# ------------------------------------------------------------------------------
+# FORMAT:   MAGIC (8 Bytes) + marshal({"version", "python", "source_hash", "data"})
+#           marshal ist an die Python-Version gebunden -> wird mitgeprüft.
+#           Geteilte Teilbäume (siehe engine_core.share_subtrees) speichert marshal
+#           per Referenz nur einmal - und liefert sie beim Laden wieder geteilt.
+# ==============================================================================
+
+import hashlib
+import json
+import marshal
+import os
+import sys
+
+SNAPSHOT_PATH = "db_snapshot_v21.bin"
+SNAPSHOT_VERSION = 2
+MAGIC = b"V21SNAP\x00"
+
+def source_hash(paths):
+    """SHA-256 über Namen & Inhalt aller Quell-Dateien (Reihenfolge zählt)."""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(os.path.basename(path).encode("utf-8") + b"\x00")
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def build_snapshot(source_paths, snapshot_path=SNAPSHOT_PATH, transform=None):
+    """
+    Liest alle Quell-JSONs und schreibt den Snapshot (atomar via Temp-Datei).
+    `transform` wird auf jede Datenbank angewendet (z.B. Normalisierung).
+    Rückgabe: Hash der Quellen.
+    """
+    data = []
+    for path in source_paths:
+        with open(path, "r", encoding="utf-8") as f:
+            db = json.load(f)
+        data.append(transform(db) if transform else db)
+
+    payload = {
+        "version": SNAPSHOT_VERSION,
+        "python": list(sys.version_info[:2]),
+        "source_hash": source_hash(source_paths),
+        "data": tuple(data),
+    }
+    tmp_path = snapshot_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(marshal.dumps(payload))
+    os.replace(tmp_path, snapshot_path)
+    return payload["source_hash"]
+
+def load_snapshot(source_paths, snapshot_path=SNAPSHOT_PATH, expected_hash=None):
+    """
+    Lädt den Snapshot, wenn er zu den aktuellen Quell-Dateien passt.
+    `expected_hash`: bereits berechnetes source_hash(source_paths) (z.B. die DB-Version
+    des Kerns) - dann werden die Quellen nicht ein zweites Mal gelesen & gehasht.
+    Rückgabe: Tupel der Datenbanken (Reihenfolge wie source_paths) oder None
+    (kein Snapshot, andere Version/Python, Hash weicht ab, Datei beschädigt).
+    """
+    try:
+        with open(snapshot_path, "rb") as f:
+            raw = f.read()
+        if not raw.startswith(MAGIC):
+            return None
+        # marshal.loads auf dem Puffer ist deutlich schneller als marshal.load(f)
+        payload = marshal.loads(memoryview(raw)[len(MAGIC):])
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+    if not isinstance(payload, dict):
+        return None
+    if payload.get("version") != SNAPSHOT_VERSION:
+        return None
+    if payload.get("python") != list(sys.version_info[:2]):
+        return None
+    if expected_hash is None:
+        expected_hash = source_hash(source_paths)
+    if payload.get("source_hash") != expected_hash:
+        return None
+    return payload.get("data")
+
+# ==============================================================================
+# 🛠 BUILD-SCHRITT
+# ==============================================================================
+if __name__ == "__main__":
+    from engine_core import DB_PATH_TZOLKIN, DB_PATH_MOON, share_subtrees
+
+    sources = [DB_PATH_TZOLKIN, DB_PATH_MOON]
+    try:
+        digest = build_snapshot(sources, transform=share_subtrees)
+    except FileNotFoundError as e:
+        print(f"❌ Quelle fehlt: {e.filename}")
+        sys.exit(1)
+
+    size_json = sum(os.path.getsize(p) for p in sources)
+    size_snap = os.path.getsize(SNAPSHOT_PATH)
+    print(f"✅ Snapshot geschrieben: {SNAPSHOT_PATH}")
+    print(f"   -> Quellen: {size_json / 1024:.0f} KB JSON | Snapshot: {size_snap / 1024:.0f} KB")
+    print(f"   -> Hash:    {digest[:16]}…")
@@ -8,13 +8,26 @@
 # HIER GILT DAS GESETZ DER TRENNUNG:
 # Strang A (Tzolkin) = Berechnet via MathEngine
 # Strang B (13 Moon) = Nachgeschlagen via JSON Lookup
+#
+# REINER KERN: Kein Streamlit-Import! Nutzbar in Cronjobs, CLIs & Workern.
+# Die UI-Anbindung (Caching via st.cache_resource, st.error) liegt in
+# engine_streamlit.py.
 # ==============================================================================
 
 import json
 import datetime
-import streamlit as st
+import os
+import sys
+import threading
+import time
+import types
+from collections import OrderedDict
+from collections.abc import Mapping
 from pathlib import Path
 from math_engine import MathEngine  # Wir importieren deinen existierenden Rechner
+import db_snapshot
+import db_record_index
+from metrics import METRICS
 
 # ------------------------------------------------------------------------------
 # KONFIGURATION & PFADE
@@ -22,99 +35,814 @@ from math_engine import MathEngine  # Wir importieren deinen existierenden Rechn
 DB_PATH_TZOLKIN = "db_tzolkin_v21_enriched_FINAL.json"
 DB_PATH_MOON = "db_13moon_v22_enriched_FINAL.json"
 
+# Binärer Snapshot (Build: python db_snapshot.py). Wird nur genutzt, wenn der
+# Inhalts-Hash zu den JSON-Dateien passt - sonst Fallback auf JSON.
+USE_SNAPSHOT = True
+SNAPSHOT_PATH = db_snapshot.SNAPSHOT_PATH
+
+# Lade-Modus:
+# "eager"   = Beide DBs komplett laden (Snapshot/JSON). Standard für die App.
+# "indexed" = Sidecar-Index + mmap: Nur angefragte Records werden dekodiert
+#             (CLI-Lookups, kurzlebige Worker). Siehe db_record_index.py.
+LOAD_MODE = "eager"
+
+# Prozessweiter LRU-Cache für fertige Pulse (Anzahl Tage). 0 = aus.
+PULSE_CACHE_SIZE = 512
+
+# Persistenter Pulse-Cache (sqlite3, von allen Workern des Hosts geteilt, überlebt
+# Neustarts). None = aus. Siehe pulse_store.py.
+PERSISTENT_PULSE_CACHE_PATH = None  # z.B. "pulse_cache_v21.sqlite3"
+
+# ------------------------------------------------------------------------------
+# FEHLER-TYPEN (statt st.error / st.stop)
+# ------------------------------------------------------------------------------
+class CoreError(Exception):
+    """Basisklasse aller Fehler der Engine."""
+
+class DatabaseNotFoundError(CoreError):
+    """Eine Datenbank-Datei fehlt."""
+
+class DatabaseCorruptError(CoreError):
+    """Eine Datenbank-Datei ist kein gültiges JSON."""
+
+# ------------------------------------------------------------------------------
+# CACHE-BACKENDS (austauschbar via GalacticCore.set_cache_backend)
+# ------------------------------------------------------------------------------
+class MemoryCache:
+    """
+    Standard-Backend: Ein prozessweites Dict. Werte werden geteilt, nicht kopiert.
+    Interface für eigene Backends: get_or_load(key, loader), clear(), stats.
+    """
+    shared = True
+
+    def __init__(self):
+        self._store = {}
+        self._lock = threading.Lock()
+        self.stats = {"calls": 0, "loads": 0, "bytes_copied": 0}
+
+    def get_or_load(self, key, loader):
+        self.stats["calls"] += 1
+        with self._lock:
+            if key in self._store:
+                return self._store[key]
+        value = loader()
+        with self._lock:
+            if key not in self._store:
+                self.stats["loads"] += 1
+            return self._store.setdefault(key, value)
+
+    def clear(self):
+        with self._lock:
+            self._store.clear()
+
+# ------------------------------------------------------------------------------
+# READ-ONLY HILFSFUNKTIONEN
+# ------------------------------------------------------------------------------
+def freeze(obj, pool=None):
+    """
+    Friert JSON-Strukturen rekursiv ein: dict -> MappingProxyType, list -> tuple.
+    Ergebnis ist unveränderlich und kann ohne Kopie zwischen Sessions geteilt werden.
+
+    Mit `pool` (ein dict) wird zusätzlich normalisiert: Gleiche Teilbäume werden
+    nur EINMAL gespeichert und per Referenz geteilt (z.B. 20 Siegel-, 13 Ton-Records
+    statt 260 Kopien), Strings werden interniert (Farben, Familien, Clans, Keys).
+    """
+    if pool is None:
+        if isinstance(obj, dict):
+            return types.MappingProxyType({k: freeze(v) for k, v in obj.items()})
+        if isinstance(obj, (list, tuple)):
+            return tuple(freeze(v) for v in obj)
+        return obj
+    return _freeze_pooled(obj, pool, {})
+
+def _freeze_pooled(obj, pool, seen):
+    """
+    Normalisierendes Einfrieren. `seen` (id -> Ergebnis, nur für diesen Aufruf) sorgt
+    dafür, dass bereits geteilte Eingaben (z.B. aus dem Snapshot) nur einmal besucht werden.
+    """
+    if isinstance(obj, str):
+        return sys.intern(obj)
+    if not isinstance(obj, (dict, list, tuple)):
+        return obj
+    frozen = seen.get(id(obj))
+    if frozen is not None:
+        return frozen
+
+    if isinstance(obj, dict):
+        items = {sys.intern(k) if isinstance(k, str) else k: _freeze_pooled(v, pool, seen)
+                 for k, v in obj.items()}
+        # Kinder sind bereits kanonisch -> ihre Identität reicht als Schlüssel
+        key = ("d",) + tuple((k, _pool_key(v)) for k, v in items.items())
+        frozen = pool.get(key)
+        if frozen is None:
+            frozen = pool.setdefault(key, types.MappingProxyType(items))
+    else:
+        items = tuple(_freeze_pooled(v, pool, seen) for v in obj)
+        key = ("l",) + tuple(_pool_key(v) for v in items)
+        frozen = pool.get(key)
+        if frozen is None:
+            frozen = pool.setdefault(key, items)
+
+    seen[id(obj)] = frozen
+    return frozen
+
+def _pool_key(value):
+    """Schlüssel-Baustein für freeze(pool=...): Container per Identität, Skalare per Typ & Wert."""
+    if isinstance(value, (types.MappingProxyType, tuple)):
+        return id(value)
+    # Typ mitnehmen: True == 1 darf nicht zusammenfallen
+    return (type(value), value)
+
+def thaw(obj, memo=None):
+    """
+    Gegenstück zu freeze(): Liefert eine normale dict/list-Kopie (z.B. für st.json).
+    Mit `memo` (ein dict) bleiben geteilte Teilbäume auch in der Kopie geteilt.
+    """
+    if memo is not None:
+        copied = memo.get(id(obj))
+        if copied is not None:
+            return copied
+    if isinstance(obj, MoonIndex):
+        # Bleibt ein MoonIndex (Tag außerhalb der Zeit), nur die Records werden aufgetaut
+        copied = MoonIndex({k: thaw(v, memo) for k, v in obj.items()})
+    elif isinstance(obj, (dict, types.MappingProxyType, Pulse)):
+        copied = {k: thaw(v, memo) for k, v in obj.items()}
+    elif isinstance(obj, (list, tuple)):
+        copied = [thaw(v, memo) for v in obj]
+    else:
+        return obj
+    if memo is not None:
+        memo[id(obj)] = copied
+    return copied
+
+def share_subtrees(data):
+    """
+    Normalisiert rohe JSON-Daten, bleibt aber bei dict/list (z.B. für den Snapshot):
+    Gleiche Teilbäume sind danach dasselbe Objekt - marshal speichert sie nur einmal.
+    """
+    return thaw(freeze(data, {}), {})
+
+def build_moon_index(moon_db):
+    """
+    Baut den Lookup-Index für die 13-Monde-DB: (Tag, Monat) -> Eintrag.
+    Einmalig beim Laden, danach O(1) statt linearem Scan über 366 Einträge.
+    """
+    index = {}
+    for item in moon_db:
+        try:
+            day, month = map(int, item.get("date_gregorian", "").split("."))
+        except ValueError:
+            continue
+        # Erster Treffer gewinnt (wie beim früheren next(...)-Scan)
+        index.setdefault((day, month), item)
+    return index
+
+def find_day_out_of_time(moon_index):
+    """(Tag, Monat) des Eintrags mit special_markers.is_day_out_of_time - oder None."""
+    for day_month, item in moon_index.items():
+        if (item.get("special_markers") or {}).get("is_day_out_of_time"):
+            return day_month
+    return None
+
+class MoonIndex(Mapping):
+    """
+    Read-only (Tag, Monat) -> Monde-Record. Trägt den beim Laden aus der DB ermittelten
+    Tag außerhalb der Zeit mit - so braucht "metadata" keinen Mond-Lookup pro Pulse.
+    """
+
+    __slots__ = ("_data", "get", "day_out_of_time")
+
+    def __init__(self, data):
+        self._data = data
+        self.get = data.get  # direkt dict.get: kein Python-Frame pro Lookup
+        self.day_out_of_time = find_day_out_of_time(data)
+
+    def __getitem__(self, day_month):
+        return self._data[day_month]
+
+    def __contains__(self, day_month):
+        return day_month in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+# Platzhalter-Record für den Schalttag (damit die App nicht crasht).
+# Einmal eingefroren und von allen Pulsen geteilt.
+HUNAB_KU_RECORD = freeze({
+    "kin": 0,
+    "identity": {
+        "name": "Hunab Ku (0.0)", 
+        "seal": {"name": "Hunab Ku", "color": "Grün"},
+        "tone": {"name": "Null", "id": 0}
+    },
+    "oracle": None, # Kein Orakel am Schalttag
+    "message": "Der Tag außerhalb der Zeitmatrix."
+})
+
+# ------------------------------------------------------------------------------
+# RECORD-OBJEKTE (__slots__, häufige Skalare vorberechnet)
+# ------------------------------------------------------------------------------
+class KinRecord:
+    """
+    Typisierte Sicht auf einen Tzolkin-Record. Die Skalare, die fast jedes Modul
+    braucht, liegen direkt als Attribut vor; der volle Record bleibt in `raw`.
+    Eine Instanz pro Kin und Datenbank (siehe kin_record), von allen Pulsen geteilt.
+    """
+
+    __slots__ = ("kin", "name", "seal_id", "tone_id", "color", "family", "wave_start", "castle", "raw")
+
+    def __init__(self, raw):
+        identity = raw.get("identity") or {}
+        seal = identity.get("seal") or {}
+        tone = identity.get("tone") or {}
+        self.kin = raw.get("kin", 0)
+        self.name = identity.get("name", "")
+        self.seal_id = seal.get("id", 0)
+        self.tone_id = tone.get("id", 0)
+        self.color = seal.get("color", "Weiß")
+        self.family = seal.get("family", "")
+        # Welle & Schloss aus der Zyklus-Tabelle (Kin 0 hat weder noch)
+        structure = MathEngine.get_structure(self.kin)
+        self.wave_start = structure.wave_start if structure else 0
+        self.castle = structure.castle if structure else 0
+        self.raw = raw
+
+    def to_dict(self):
+        return self.raw
+
+    def __repr__(self):
+        return f"KinRecord(kin={self.kin}, name={self.name!r})"
+
+class MoonRecord:
+    """Typisierte Sicht auf einen 13-Monde-Record (Tag im Jahr, Mond, Marker)."""
+
+    __slots__ = ("date_key", "day_of_year", "moon_id", "moon_name", "day_of_moon",
+                 "is_day_out_of_time", "is_leap_day", "raw")
+
+    def __init__(self, raw):
+        moon = raw.get("moon") or {}
+        markers = raw.get("special_markers") or {}
+        self.date_key = raw.get("date_gregorian", "")
+        self.day_of_year = raw.get("day_of_year")
+        self.moon_id = moon.get("id", 0)
+        self.moon_name = moon.get("name", "")
+        self.day_of_moon = raw.get("day_of_moon", 0)
+        self.is_day_out_of_time = markers.get("is_day_out_of_time", False)
+        self.is_leap_day = markers.get("is_leap_day", False)
+        self.raw = raw
+
+    def to_dict(self):
+        return self.raw
+
+    def __repr__(self):
+        return f"MoonRecord({self.date_key!r}, moon={self.moon_id}, day={self.day_of_moon})"
+
+# Memo: Schlüssel -> (Quell-Record, typisiertes Objekt). Passt der Quell-Record nicht
+# mehr (DB neu geladen), wird neu gebaut - so bleibt der Memo für jeden Lade-Modus gültig.
+_KIN_RECORDS = {}
+_MOON_RECORDS = {}
+
+def kin_record(raw):
+    """Geteiltes KinRecord-Objekt für einen (eingefrorenen) Tzolkin-Record."""
+    key = raw.get("kin", 0)
+    cached = _KIN_RECORDS.get(key)
+    if cached is not None and cached[0] is raw:
+        return cached[1]
+    record = KinRecord(raw)
+    _KIN_RECORDS[key] = (raw, record)
+    return record
+
+def moon_record(raw):
+    """Geteiltes MoonRecord-Objekt für einen (eingefrorenen) Monde-Record."""
+    key = raw.get("date_gregorian")
+    cached = _MOON_RECORDS.get(key)
+    if cached is not None and cached[0] is raw:
+        return cached[1]
+    record = MoonRecord(raw)
+    if key is not None:
+        _MOON_RECORDS[key] = (raw, record)
+    return record
+
+# ------------------------------------------------------------------------------
+# PULSE (__slots__, Sektionen werden erst beim ersten Zugriff aufgelöst)
+# ------------------------------------------------------------------------------
+PULSE_SECTIONS = ("metadata", "tzolkin", "moon")
+
+class Pulse(Mapping):
+    """
+    Der Pulse als kompaktes Objekt:
+      pulse.kin, pulse.seal_id, pulse.color, pulse.record.name, pulse.moon_record.moon_id ...
+    Kompatibel zum alten dict-Vertrag: pulse['tzolkin']['identity'] ... bzw. to_dict().
+    Sektionen werden beim ersten Zugriff nachgeschlagen und gemerkt.
+    `touched` = Sektionen, die von außen gelesen wurden (für den Debug-Modus).
+    """
+
+    __slots__ = ("date", "kin", "_db_tzolkin", "_moon_index", "_record", "_moon", "_metadata", "_touched")
+
+    # Bit pro Sektion (touched als int statt set: ein Rerun alloziert nur das Objekt selbst)
+    _BITS = {"metadata": 1, "tzolkin": 2, "moon": 4}
+
+    def __init__(self, target_date, kin_num, db_tzolkin, moon_index):
+        self.date = target_date
+        self.kin = kin_num
+        self._db_tzolkin = db_tzolkin
+        self._moon_index = moon_index
+        self._record = None
+        self._moon = None
+        self._metadata = None
+        self._touched = 0
+
+    # --- Typisierte Sicht -----------------------------------------------------
+    def _kin_record(self):
+        if self._record is None:
+            # Sonderfall Hunab Ku (Kin 0): geteilte, read-only Notfall-Daten
+            raw = HUNAB_KU_RECORD if self.kin == 0 else self._db_tzolkin[(self.kin - 1) % 260]
+            self._record = kin_record(raw)
+        return self._record
+
+    def _moon_record(self):
+        if self._moon is None:
+            raw = self._moon_index.get((self.date.day, self.date.month))
+            if not raw:
+                # Fallback, falls DB unvollständig
+                search_key = f"{self.date.day:02d}.{self.date.month:02d}"
+                raw = {"error": f"Kein Eintrag für {search_key} gefunden."}
+            self._moon = moon_record(raw)
+        return self._moon
+
+    @property
+    def record(self):
+        """KinRecord des Tages (Hunab Ku: Kin 0)."""
+        self._touched |= 2
+        return self._record or self._kin_record()
+
+    @property
+    def moon_record(self):
+        """MoonRecord des Tages."""
+        self._touched |= 4
+        return self._moon or self._moon_record()
+
+    # Vorberechnete Skalare des Kin-Records (ein Attribut-Zugriff statt .get-Kette)
+    seal_id = property(lambda self: self.record.seal_id)
+    tone_id = property(lambda self: self.record.tone_id)
+    color = property(lambda self: self.record.color)
+    wave_start = property(lambda self: self.record.wave_start)
+    castle = property(lambda self: self.record.castle)
+
+    @property
+    def structure(self):
+        """KinStructure (Welle, Schloss, Harmonik, Familie ...) - reine Mathematik, kein DB-Zugriff."""
+        return MathEngine.get_structure(self.kin)
+
+    @property
+    def is_leap_day(self):
+        return self.kin == 0
+
+    @property
+    def is_day_out_of_time(self):
+        if self._moon_index is None:
+            # Aus dem persistenten Cache: der Mond-Record liegt schon aufgelöst vor
+            return self._moon.is_day_out_of_time
+        # Beim DB-Load ermittelt (MoonIndex/DayMonthIndex) -> kein Mond-Lookup
+        return (self.date.day, self.date.month) == self._moon_index.day_out_of_time
+
+    @property
+    def date_str(self):
+        return self.date.strftime("%d.%m.%Y")
+
+    # --- dict-Vertrag (Kompatibilität) ----------------------------------------
+    def _resolve(self, section):
+        if section == "tzolkin":
+            return self._kin_record().raw
+        if section == "moon":
+            return self._moon_record().raw
+        if section == "metadata":
+            if self._metadata is None:
+                # Read-only wie die DB: der Pulse wird über fork() & den LRU geteilt
+                self._metadata = types.MappingProxyType({
+                    "date_object": self.date,
+                    "date_str": self.date_str,
+                    "kin": self.kin,
+                    "is_leap_day": self.kin == 0,
+                    "is_day_out_of_time": self.is_day_out_of_time
+                })
+            return self._metadata
+        raise KeyError(section)
+
+    def __getitem__(self, section):
+        value = self._resolve(section)
+        self._touched |= self._BITS[section]
+        return value
+
+    def __iter__(self):
+        return iter(PULSE_SECTIONS)
+
+    def __len__(self):
+        return len(PULSE_SECTIONS)
+
+    def materialize(self, sections=PULSE_SECTIONS):
+        """Löst die gegebenen Sektionen vorab auf (ohne sie als 'touched' zu zählen)."""
+        for section in sections:
+            self._resolve(section)
+        return self
+
+    def fork(self):
+        """
+        Neue Sicht auf denselben Pulse: teilt alle aufgelösten Sektionen, hat aber
+        ein eigenes `touched` (für gecachte Pulse, die mehrere Reruns/Sessions lesen).
+        """
+        clone = Pulse.__new__(Pulse)
+        clone.date = self.date
+        clone.kin = self.kin
+        clone._db_tzolkin = self._db_tzolkin
+        clone._moon_index = self._moon_index
+        clone._record = self._record
+        clone._moon = self._moon
+        clone._metadata = self._metadata
+        clone._touched = 0
+        return clone
+
+    def to_plain(self):
+        """Voll aufgelöster Pulse nur aus dict/list/str/int (für den persistenten Cache)."""
+        data = thaw(self.to_dict())
+        data["metadata"]["date_object"] = self.date.isoformat()
+        return data
+
+    @staticmethod
+    def from_plain(data):
+        """Gegenstück zu to_plain(): Pulse ohne Datenbank-Anbindung (alles aufgelöst)."""
+        metadata = dict(data["metadata"])
+        target_date = datetime.date.fromisoformat(metadata["date_object"])
+        metadata["date_object"] = target_date
+        pulse = Pulse(target_date, metadata["kin"], None, None)
+        pulse._record = KinRecord(freeze(data["tzolkin"]))
+        pulse._moon = MoonRecord(freeze(data["moon"]))
+        pulse._metadata = types.MappingProxyType(metadata)
+        return pulse
+
+    @property
+    def touched(self):
+        """Von außen gelesene Sektionen (in Vertrags-Reihenfolge)."""
+        return tuple(s for s in PULSE_SECTIONS if self._touched & self._BITS[s])
+
+    @property
+    def resolved(self):
+        """Bisher aufgelöste Sektionen (in Vertrags-Reihenfolge)."""
+        done = {"metadata": self._metadata is not None, "tzolkin": self._record is not None,
+                "moon": self._moon is not None}
+        return tuple(s for s in PULSE_SECTIONS if done[s])
+
+    def to_dict(self):
+        """Voll aufgelöster Pulse als normales dict (alter Daten-Vertrag)."""
+        return {section: self._resolve(section) for section in PULSE_SECTIONS}
+
+    def __repr__(self):
+        return f"Pulse({self.date.isoformat()}, kin={self.kin}, resolved={self.resolved})"
+
+# ------------------------------------------------------------------------------
+# DB-VERSION (Inhalts-Hash der Quellen, neu berechnet nur bei geänderter Datei)
+# ------------------------------------------------------------------------------
+_source_version = {"stamp": None, "hash": None}
+_source_version_lock = threading.Lock()
+
+def stamp_version(stamps):
+    """Version aus Größe & mtime der Quellen (Index-Stempel, ohne die Dateien zu lesen)."""
+    return "stat:" + ",".join(f"{s['size']}-{s['mtime_ns']}" for s in stamps)
+
+def source_version():
+    """
+    Inhalts-Hash beider JSON-Datenbanken. Pro Aufruf nur zwei os.stat; gehasht
+    wird erst, wenn sich Größe oder mtime einer Datei ändern.
+    Im Modus "indexed" wird nie gehasht (das würde beide Dateien komplett lesen):
+    die Version ist dann der Stempel (Größe, mtime) - wie bei den Sidecar-Indizes.
+    """
+    paths = (DB_PATH_TZOLKIN, DB_PATH_MOON)
+    try:
+        stamp = tuple((st.st_size, st.st_mtime_ns) for st in map(os.stat, paths))
+    except FileNotFoundError as e:
+        raise DatabaseNotFoundError(f"Datenbank nicht gefunden: {e.filename}") from e
+    if LOAD_MODE == "indexed":
+        return stamp_version({"size": size, "mtime_ns": mtime} for size, mtime in stamp)
+    with _source_version_lock:
+        if stamp != _source_version["stamp"]:
+            _source_version["hash"] = db_snapshot.source_hash(paths)
+            _source_version["stamp"] = stamp
+        return _source_version["hash"]
+
+# ------------------------------------------------------------------------------
+# PULSE-CACHE (LRU nach Datum, prozessweit & pro Session)
+# ------------------------------------------------------------------------------
+class _InFlight:
+    """Ein laufender Build: Wartende blockieren auf `done` und übernehmen `pulse`."""
+
+    __slots__ = ("done", "pulse")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.pulse = None
+
+class PulseCache:
+    """
+    Begrenzter LRU-Cache Datum -> fertiger Pulse.
+    Gleiche Kins teilen sich ohnehin denselben Tzolkin-Record (siehe kin_record),
+    der Cache spart zusätzlich Mond-Lookup & Metadaten pro Datum.
+    Einträge mit anderer DB-Version (source_version) gelten als Miss.
+    """
+
+    def __init__(self, maxsize=PULSE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._store = OrderedDict()
+        self._inflight = {}   # (Datum, Version) -> _InFlight
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get_or_build(self, target_date, version, build):
+        """
+        Pulse aus dem Cache oder über build(). Gebaut wird AUSSERHALB des Locks (ein kalter
+        Build mit DB-Load/sqlite blockiert keine Treffer anderer Sessions); gleichzeitige
+        Misses auf dasselbe Datum warten auf den laufenden Build -> EIN Build pro Datum.
+        """
+        key = (target_date, version)
+        while True:
+            with self._lock:
+                entry = self._store.get(target_date)
+                if entry is not None and entry[0] == version:
+                    self._store.move_to_end(target_date)
+                    self.stats["hits"] += 1
+                    return entry[1]
+                flight = self._inflight.get(key)
+                if flight is None:
+                    self.stats["misses"] += 1
+                    flight = self._inflight[key] = _InFlight()
+                    break
+            flight.done.wait()
+            if flight.pulse is not None:
+                with self._lock:
+                    self.stats["hits"] += 1
+                return flight.pulse
+            # Build fehlgeschlagen -> selbst versuchen (bzw. auf den nächsten warten)
+
+        try:
+            pulse = flight.pulse = build()
+        finally:
+            with self._lock:
+                del self._inflight[key]
+                if flight.pulse is not None and self.maxsize > 0:
+                    self._store[target_date] = (version, flight.pulse)
+                    self._store.move_to_end(target_date)
+                    while len(self._store) > self.maxsize:
+                        self._store.popitem(last=False)
+                        self.stats["evictions"] += 1
+            flight.done.set()
+        return pulse
+
+    def resize(self, maxsize):
+        """Neue Maximalgröße; überzählige (älteste) Einträge fliegen sofort raus."""
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._store) > max(maxsize, 0):
+                self._store.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._store.clear()
+
+    def __len__(self):
+        return len(self._store)
+
+    def summary(self):
+        """Kurzreport für den Debug-Modus."""
+        total = self.stats["hits"] + self.stats["misses"]
+        rate = 100 * self.stats["hits"] / total if total else 0.0
+        return (f"{self.stats['hits']} Hits / {self.stats['misses']} Misses ({rate:.0f}%) • "
+                f"{self.stats['evictions']} Evictions • {len(self)}/{self.maxsize}")
+
 class GalacticCore:
     """
     Der Maschinenraum. Lädt Datenbanken und erstellt den 'Pulse'.
     """
 
+    # Austauschbares Cache-Backend (Standard: prozessweites Dict)
+    cache = MemoryCache()
+
+    # Prozessweiter LRU für fertige Pulse (alle Sessions teilen ihn)
+    pulse_cache = PulseCache(PULSE_CACHE_SIZE)
+
+    # Persistenter Cache (siehe persistent_cache) & DB-Version der geladenen Daten
+    _persistent = None
+    _loaded_version = None
+    # Cache-Schlüssel der aktuell geladenen DBs (enthält die DB-Version)
+    _db_key = None
+    _db_key_lock = threading.Lock()
+
+    @staticmethod
+    def set_cache_backend(backend):
+        """Tauscht das Cache-Backend aus (z.B. Streamlit-Adapter, eigener Worker-Cache)."""
+        GalacticCore.cache = backend
+
     @staticmethod
-    @st.cache_data
-    def load_databases():
+    def _read_databases(version=None):
         """
-        Lädt die JSON-Akasha-Chroniken in den Speicher.
-        Nutzt Streamlit-Caching für maximale Performance.
+        Liest beide Datenbanken. Bevorzugt den Snapshot (Hash-geprüft), sonst JSON.
+        `version`: bereits berechneter Inhalts-Hash (source_version) - der Snapshot wird
+        dagegen geprüft, statt die Quellen erneut zu hashen.
+        Wirft DatabaseNotFoundError / DatabaseCorruptError.
         """
         try:
+            if USE_SNAPSHOT:
+                snapshot = db_snapshot.load_snapshot([DB_PATH_TZOLKIN, DB_PATH_MOON], SNAPSHOT_PATH,
+                                                     expected_hash=version)
+                if snapshot is not None:
+                    tzolkin_db, moon_db = snapshot
+                    return tzolkin_db, moon_db
+
             with open(DB_PATH_TZOLKIN, 'r', encoding='utf-8') as f:
                 tzolkin_db = json.load(f)
-            
+
             with open(DB_PATH_MOON, 'r', encoding='utf-8') as f:
                 moon_db = json.load(f)
-                
-            return tzolkin_db, moon_db
-            
+
         except FileNotFoundError as e:
-            st.error(f"❌ KRITISCHER FEHLER: Datenbank nicht gefunden! {e}")
-            st.stop()
+            raise DatabaseNotFoundError(f"Datenbank nicht gefunden: {e.filename}") from e
         except json.JSONDecodeError as e:
-            st.error(f"❌ SYNTAX FEHLER: JSON ist beschädigt. {e}")
-            st.stop()
+            raise DatabaseCorruptError(f"JSON ist beschädigt: {e}") from e
+
+        return tzolkin_db, moon_db
+
+    @staticmethod
+    def _load_frozen(version=None):
+        """
+        Lädt, normalisiert, friert ein und indiziert. Eine Instanz pro Prozess & DB-Version.
+        Gleiche Teilbäume (Siegel, Töne, Wellen-Psychologie, Orakel-Kurzrecords)
+        werden über einen gemeinsamen Pool nur einmal gehalten.
+        """
+        start = time.perf_counter_ns()
+        version = source_version() if version is None else version
+        tzolkin_db, moon_db = GalacticCore._read_databases(version)
+        pool = {}
+        tzolkin_db = freeze(tzolkin_db, pool)
+        moon_db = freeze(moon_db, pool)
+        # Index erst NACH dem Einfrieren bauen, damit er auf dieselben Objekte zeigt
+        moon_index = MoonIndex(build_moon_index(moon_db))
+        GalacticCore._loaded_version = version
+        METRICS.observe("db_load", "eager", time.perf_counter_ns() - start)
+        return tzolkin_db, moon_db, moon_index
+
+    @staticmethod
+    def _load_indexed():
+        """
+        Random-Access-Modus: Liefert dieselben Strukturen wie _load_frozen, dekodiert
+        aber erst beim Zugriff (tzolkin_db[i], moon_index.get((Tag, Monat))).
+        Ändert sich eine Datei, bauen die Arrays Index & mmap beim nächsten Zugriff neu.
+        """
+        start = time.perf_counter_ns()
+        pool = {}
+        normalize = lambda record: freeze(record, pool)
+        try:
+            tzolkin_db = db_record_index.IndexedJsonArray(DB_PATH_TZOLKIN, "kin", wrap=normalize,
+                                                          error=DatabaseCorruptError)
+            moon_db = db_record_index.IndexedJsonArray(DB_PATH_MOON, "date_gregorian", wrap=normalize,
+                                                       error=DatabaseCorruptError)
+        except FileNotFoundError as e:
+            raise DatabaseNotFoundError(f"Datenbank nicht gefunden: {e.filename}") from e
+        except (ValueError, IndexError) as e:
+            raise DatabaseCorruptError(f"JSON ist beschädigt: {e}") from e
+        # Version = Stempel der Indizes (kein Voll-Hash wie im Modus "eager")
+        GalacticCore._loaded_version = stamp_version((tzolkin_db.stamp, moon_db.stamp))
+        METRICS.observe("db_load", "indexed", time.perf_counter_ns() - start)
+        return tzolkin_db, moon_db, db_record_index.DayMonthIndex(moon_db)
+
+    @staticmethod
+    def load_databases(version=None):
+        """
+        Lädt die JSON-Akasha-Chroniken in den Speicher (über das Cache-Backend).
+        Rückgabe: (tzolkin_db, moon_db, moon_index), read-only und geteilt.
+        Der (Tag, Monat)-Index der Monde-DB wird mitgecacht.
+        Der Cache-Schlüssel enthält die DB-Version (source_version): ändert sich eine
+        Datei, wird neu geladen und der alte Stand aus dem Backend geworfen.
+        """
+        version = source_version() if version is None else version
+        if LOAD_MODE == "indexed":
+            key, loader = f"databases:indexed:{version}", GalacticCore._load_indexed
+        else:
+            key, loader = f"databases:{version}", lambda: GalacticCore._load_frozen(version)
+        if key != GalacticCore._db_key:
+            with GalacticCore._db_key_lock:
+                if key != GalacticCore._db_key:
+                    if GalacticCore._db_key is not None:
+                        GalacticCore.cache.clear()
+                    GalacticCore._db_key = key
+        return GalacticCore.cache.get_or_load(key, loader)
+
+    @staticmethod
+    def _assemble_pulse(target_date, kin_num, db_tzolkin, moon_index):
+        """
+        Baut den Pulse aus bereits berechnetem Kin (gemeinsam für get_pulse & iter_pulses).
+        Daten-Vertrag: {"metadata", "tzolkin" (Strang A, Mathematik), "moon" (Strang B, Lookup)}
+        - die Sektionen werden erst beim Zugriff aufgelöst (siehe Pulse).
+        """
+        return Pulse(target_date, kin_num, db_tzolkin, moon_index)
+
+    @staticmethod
+    def persistent_cache():
+        """Der persistente Pulse-Cache (lazy angelegt) oder None, wenn abgeschaltet."""
+        if PERSISTENT_PULSE_CACHE_PATH is None:
+            return None
+        store = GalacticCore._persistent
+        if store is None or store.path != PERSISTENT_PULSE_CACHE_PATH:
+            import pulse_store  # sqlite3 nur laden, wenn der Cache genutzt wird
+            store = GalacticCore._persistent = pulse_store.PersistentPulseCache(PERSISTENT_PULSE_CACHE_PATH)
+        return store
 
     @staticmethod
-    def get_pulse(target_date: datetime.date):
+    def _build_pulse(target_date, version):
+        """Pulse neu bauen - oder aus dem persistenten Cache holen (dann ohne DB-Load)."""
+        start = time.perf_counter_ns()
+        store = GalacticCore.persistent_cache()
+        date_key = target_date.isoformat()
+        if store is not None:
+            data = store.get(date_key, version)
+            if data is not None:
+                pulse = Pulse.from_plain(data)
+                METRICS.observe("pulse_build", "disk", time.perf_counter_ns() - start)
+                return pulse
+
+        db_tzolkin, db_moon, moon_index = GalacticCore.load_databases(version)
+        kin_num = MathEngine.get_kin(target_date.day, target_date.month, target_date.year)
+        pulse = GalacticCore._assemble_pulse(target_date, kin_num, db_tzolkin, moon_index)
+
+        # Nur schreiben, wenn die geladene DB zur aktuellen Datei-Version passt
+        if store is not None and GalacticCore._loaded_version == version:
+            store.put(date_key, version, pulse.materialize().to_plain())
+        METRICS.observe("pulse_build", "db", time.perf_counter_ns() - start)
+        return pulse
+
+    @staticmethod
+    def get_pulse(target_date: datetime.date, sections=None, session_cache=None):
         """
         Die MAGISCHE FUNKTION.
         Erstellt das 'pulse' Objekt (Data Contract), das die ganze App versorgt.
+        `sections`: Sektionen, die sofort aufgelöst werden (z.B. der Bedarf der aktiven
+        Module). Alle anderen werden erst beim ersten Zugriff nachgeschlagen.
+        Gecacht: erst `session_cache` (optional), dann der prozessweite pulse_cache,
+        dann (falls aktiv) der persistente Cache auf der Platte.
+        Geliefert wird immer ein fork() - eigenes `touched`, geteilte Daten.
         """
-        # 1. Datenbanken holen (Cached)
-        db_tzolkin, db_moon = GalacticCore.load_databases()
+        start = time.perf_counter_ns()
+        version = source_version()
 
-        # ----------------------------------------------------------------------
-        # STRANG A: TZOLKIN (Das "WER") -> Mathematik
-        # ----------------------------------------------------------------------
-        kin_num = MathEngine.get_kin(target_date.day, target_date.month, target_date.year)
-        
-        # Sonderfall: Hunab Ku (0.0. Hunab Ku)
-        is_leap_day = (kin_num == 0)
-        
-        if is_leap_day:
-            # Notfall-Daten für den Schalttag (damit die App nicht crasht)
-            tzolkin_data = {
-                "kin": 0,
-                "identity": {
-                    "name": "Hunab Ku (0.0)", 
-                    "seal": {"name": "Hunab Ku", "color": "Grün"},
-                    "tone": {"name": "Null", "id": 0}
-                },
-                "oracle": None, # Kein Orakel am Schalttag
-                "message": "Der Tag außerhalb der Zeitmatrix."
-            }
-        else:
-            # Normaler Lookup (Kin 1 = Index 0)
-            # Sicherheits-Check: Kin muss zwischen 1 und 260 liegen
-            safe_index = (kin_num - 1) % 260
-            tzolkin_data = db_tzolkin[safe_index]
-
-        # ----------------------------------------------------------------------
-        # STRANG B: 13 MOON (Das "WO") -> Kalender-Lookup
-        # ----------------------------------------------------------------------
-        # Wir suchen den Eintrag für "DD.MM"
-        search_key = f"{target_date.day:02d}.{target_date.month:02d}"
-        
-        # Linearer Scan durch die 13-Monde-DB (Schnell genug für 366 Einträge)
-        moon_data = next((item for item in db_moon if item["date_gregorian"] == search_key), None)
-
-        if not moon_data:
-            # Fallback, falls DB unvollständig
-            moon_data = {"error": f"Kein Eintrag für {search_key} gefunden."}
-
-        # ----------------------------------------------------------------------
-        # PULSE ASSEMBLIERUNG (Der Daten-Vertrag)
-        # ----------------------------------------------------------------------
-        pulse = {
-            "metadata": {
-                "date_object": target_date,
-                "date_str": target_date.strftime("%d.%m.%Y"),
-                "kin": kin_num,
-                "is_leap_day": is_leap_day,
-                "is_day_out_of_time": moon_data.get("special_markers", {}).get("is_day_out_of_time", False)
-            },
-            "tzolkin": tzolkin_data,
-            "moon": moon_data
-        }
+        def from_process_cache():
+            return GalacticCore.pulse_cache.get_or_build(
+                target_date, version, lambda: GalacticCore._build_pulse(target_date, version))
 
+        if session_cache is not None:
+            pulse = session_cache.get_or_build(target_date, version, from_process_cache)
+        else:
+            pulse = from_process_cache()
+        if sections:
+            # Auf dem geteilten Pulse -> jede weitere Sicht profitiert davon
+            pulse.materialize(sections)
+        pulse = pulse.fork()
+        METRICS.observe("get_pulse", "", time.perf_counter_ns() - start)
         return pulse
 
+    @staticmethod
+    def iter_pulses(start: datetime.date, end: datetime.date, step: int = 1):
+        """
+        Streamt Pulse für einen Datumsbereich (start bis einschließlich end).
+        Lazy (Generator): Flacher Speicher, auch für Jahrzehnte.
+        Das Kin wird über die Dreamspell-Tageszahl fortgeschrieben statt pro Datum
+        neu vom Anker aus gezählt. Tzolkin- & Mond-Einträge werden per Referenz geteilt.
+        """
+        if step < 1:
+            raise ValueError(f"step muss >= 1 sein (erhalten: {step})")
+
+        db_tzolkin, db_moon, moon_index = GalacticCore.load_databases()
+        stride = datetime.timedelta(days=step)
+
+        current = start
+        # Laufende Dreamspell-Tageszahl (ohne 29.2.) relativ zum Anker
+        delta_days = MathEngine._dreamspell_ordinal(current) - MathEngine._ANCHOR_ORDINAL
+        leap_before = MathEngine._leap_days_before(current)
+
+        while current <= end:
+            if current.month == 2 and current.day == 29:
+                kin_num = 0
+            else:
+                kin_num = (MathEngine.ANCHOR_KIN + delta_days - 1) % 260 + 1
+
+            yield GalacticCore._assemble_pulse(current, kin_num, db_tzolkin, moon_index)
+
+            # Weiterschalten: step Tage minus übersprungene 29.2. im Intervall
+            current += stride
+            next_leap_before = MathEngine._leap_days_before(current)
+            delta_days += step - (next_leap_before - leap_before)
+            leap_before = next_leap_before
+
 # ==============================================================================
 # 🛠 TERMINAL-CHECK (Nur ausführbar, wenn Datei direkt gestartet wird)
 # ==============================================================================
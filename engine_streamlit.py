@@ -0,0 +1,92 @@
+# ==============================================================================
+# 🔌 STREAMLIT-ADAPTER FÜR DEN GALACTIC CORE (V21)
+# ------------------------------------------------------------------------------
+# ZWECK:    Dünne Schicht zwischen reinem Kern (engine_core) und der UI (app.py).
+#           - Caching über st.cache_resource (eine geteilte Instanz pro Prozess)
+#           - Übersetzt CoreError in st.error + st.stop
+# ------------------------------------------------------------------------------
+# Module & App importieren GalacticCore von HIER, damit das Backend aktiv ist.
+# ==============================================================================
+
+import os
+import pickle
+import streamlit as st
+from engine_core import GalacticCore, CoreError, DatabaseNotFoundError, DatabaseCorruptError, PulseCache, thaw
+from metrics import METRICS
+
+# Speicher-Modus der Datenbanken:
+# True  = EINE eingefrorene, geteilte Instanz pro Prozess (st.cache_resource, keine Kopien)
+# False = Legacy st.cache_data (jeder Aufruf liefert eine frische Kopie) - nur zum Vergleich
+SHARED_DB = True
+
+# LRU pro Session (vor dem prozessweiten engine_core.PULSE_CACHE_SIZE). 0 = aus.
+SESSION_PULSE_CACHE_SIZE = 32
+
+# Metrik-Export der App (siehe metrics.py) - nur auf Wunsch, Standard: kein Export.
+# Einschalten per Umgebung, z.B. V21_METRICS_JSONL=metrics_v21.jsonl streamlit run app.py
+# None = dieses Format nicht schreiben. Prom-Pfad ist der Basisname -> <name>.<pid>.prom pro Worker
+METRICS_JSONL_PATH = os.environ.get("V21_METRICS_JSONL") or None
+METRICS_PROM_PATH = os.environ.get("V21_METRICS_PROM") or None
+
+# Registrierte Loader (Key -> Funktion). st.cache_* cached über den Key.
+_LOADERS = {}
+
+@st.cache_resource(show_spinner=False)
+def _shared_resource(key):
+    return _LOADERS[key]()
+
+@st.cache_data(show_spinner=False)
+def _copied_data(key):
+    # Eingefrorene Strukturen sind nicht pickle-bar -> für den Vergleich auftauen
+    return thaw(_LOADERS[key]())
+
+class StreamlitCache:
+    """Cache-Backend für GalacticCore auf Basis der Streamlit-Caches."""
+
+    def __init__(self, shared=True):
+        self.shared = shared
+        self.stats = {"calls": 0, "loads": 0, "bytes_copied": 0}
+        self._payload_bytes = {}
+
+    def get_or_load(self, key, loader):
+        _LOADERS[key] = loader
+        self.stats["calls"] += 1
+        if self.shared:
+            return _shared_resource(key)
+
+        value = _copied_data(key)
+        if key not in self._payload_bytes:
+            # Genau diese Bytes (de)serialisiert st.cache_data bei jedem Aufruf
+            self._payload_bytes[key] = len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        self.stats["bytes_copied"] += self._payload_bytes[key]
+        return value
+
+    def clear(self):
+        _shared_resource.clear()
+        _copied_data.clear()
+
+# Backend & (falls konfiguriert) Metrik-Export aktivieren (einmal pro Prozess beim Import)
+GalacticCore.set_cache_backend(StreamlitCache(shared=SHARED_DB))
+if METRICS_JSONL_PATH or METRICS_PROM_PATH:
+    METRICS.configure(jsonl_path=METRICS_JSONL_PATH, prom_path=METRICS_PROM_PATH)
+
+def session_pulse_cache():
+    """Der Pulse-Cache dieser Session (liegt in st.session_state, überlebt Reruns)."""
+    cache = st.session_state.get("_pulse_cache")
+    if cache is None:
+        cache = st.session_state["_pulse_cache"] = PulseCache(SESSION_PULSE_CACHE_SIZE)
+    return cache
+
+def get_pulse(target_date, sections=None):
+    """get_pulse mit UI-Fehlerbehandlung: Fehler werden angezeigt, der Rerun endet."""
+    try:
+        return GalacticCore.get_pulse(target_date, sections, session_cache=session_pulse_cache())
+    except DatabaseNotFoundError as e:
+        st.error(f"❌ KRITISCHER FEHLER: Datenbank nicht gefunden! {e}")
+        st.stop()
+    except DatabaseCorruptError as e:
+        st.error(f"❌ SYNTAX FEHLER: JSON ist beschädigt. {e}")
+        st.stop()
+    except CoreError as e:
+        st.error(f"❌ ENGINE FEHLER: {e}")
+        st.stop()
@@ -0,0 +1,145 @@
+# ==============================================================================
+# 🧱 FRAGMENT CACHE (Fertiges Modul-HTML nach Kin & Mondtag)
+# ------------------------------------------------------------------------------
+# ZWECK:    Fast jede Modul-Ausgabe ist eine reine Funktion eines kleinen Schlüssels
+#           (Kin, Mondtag). Über alle Nutzer gibt es nur 260 × 366 Kombinationen ->
+#           das HTML wird einmal pro Prozess gebaut und danach nur noch geliefert.
+# SCHLÜSSEL: (Modul, Kin, Mondtag, Modul-Version, *weitere Schlüssel-Argumente)
+#           - Mondtag: (Tag, Monat) wie im Mond-Index, None = hängt nicht davon ab
+#           - Modul-Version: Hash der Modul-Datei -> Hot-Reload macht alte Fragmente ungültig
+#           - Datenbank-Stand: sync(source_version()) leert den Cache bei neuer DB
+# HINWEIS:  Kein Streamlit-Import. Ein LRU pro Prozess, Statistik pro Modul.
+# ==============================================================================
+
+import functools
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+
+# Maximale Anzahl Fragmente im Prozess (0 = Cache aus, jedes Fragment wird neu gebaut)
+FRAGMENT_CACHE_SIZE = 2048
+
+class FragmentCache:
+    """Begrenzter LRU-Cache Schlüssel -> unveränderliches HTML (str oder Tupel von str)."""
+
+    def __init__(self, maxsize=FRAGMENT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.data_version = None
+        self._store = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {}  # Modul -> {"hits", "misses", "evictions"}
+
+    def _stat(self, module):
+        return self.stats.setdefault(module, {"hits": 0, "misses": 0, "evictions": 0})
+
+    def get_or_build(self, key, build):
+        """
+        Fragment aus dem Cache oder über build(). key[0] ist der Modulname (Statistik).
+        Gebaut wird AUSSERHALB des Locks: Fragmente sind deterministisch, ein doppelter
+        Build bei gleichzeitigen Sessions ist harmlos - verschachtelte Fragmente sind erlaubt.
+        """
+        with self._lock:
+            stat = self._stat(key[0])
+            html = self._store.get(key)
+            if html is not None:
+                self._store.move_to_end(key)
+                stat["hits"] += 1
+                return html
+            stat["misses"] += 1
+
+        html = build()
+        if self.maxsize > 0:
+            with self._lock:
+                self._store[key] = html
+                self._store.move_to_end(key)
+                while len(self._store) > self.maxsize:
+                    evicted, _ = self._store.popitem(last=False)
+                    self._stat(evicted[0])["evictions"] += 1
+        return html
+
+    def sync(self, data_version):
+        """Pro Rerun mit dem DB-Stand aufrufen: neue Version -> alle Fragmente verwerfen."""
+        if data_version != self.data_version:
+            with self._lock:
+                self._store.clear()
+                self.data_version = data_version
+
+    def resize(self, maxsize):
+        """Neue Maximalgröße; überzählige (älteste) Einträge fliegen sofort raus."""
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._store) > max(maxsize, 0):
+                evicted, _ = self._store.popitem(last=False)
+                self._stat(evicted[0])["evictions"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._store.clear()
+
+    def __len__(self):
+        return len(self._store)
+
+    def summary(self):
+        """Kurzreport für den Debug-Modus."""
+        with self._lock:
+            hits = sum(s["hits"] for s in self.stats.values())
+            misses = sum(s["misses"] for s in self.stats.values())
+            evictions = sum(s["evictions"] for s in self.stats.values())
+        total = hits + misses
+        rate = 100 * hits / total if total else 0.0
+        return (f"{hits} Hits / {misses} Misses ({rate:.0f}%) • "
+                f"{evictions} Evictions • {len(self)}/{self.maxsize}")
+
+    def module_summary(self):
+        """Statistik pro Modul: (modul, hits, misses, trefferquote_prozent)."""
+        with self._lock:
+            rows = []
+            for module, s in sorted(self.stats.items()):
+                total = s["hits"] + s["misses"]
+                rows.append((module, s["hits"], s["misses"], 100 * s["hits"] / total if total else 0.0))
+            return rows
+
+# Prozessweite Instanz (Fragmente sind für alle Sessions gleich)
+FRAGMENTS = FragmentCache(FRAGMENT_CACHE_SIZE)
+
+def moon_day(date):
+    """Mondtag-Schlüssel eines Datums: (Tag, Monat), wie der Mond-Index des Kerns."""
+    return (date.day, date.month)
+
+def module_version(module_name):
+    """Kurz-Hash der Modul-Datei (ändert sich mit jedem Hot-Reload mit neuem Inhalt)."""
+    module = sys.modules.get(module_name)
+    path = getattr(module, "__file__", None)
+    if not path:
+        return None
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha1(f.read()).hexdigest()[:12]
+    except OSError:
+        return None
+
+def fragment(module=None, version=None, cache=None):
+    """
+    Decorator für HTML-Builder der Form  builder(kin, moon_day, *key_args, **context).
+      - kin, moon_day & key_args bilden (mit Modul & Version) den Cache-Schlüssel
+        und müssen hashbar sein.
+      - context (Keyword-Argumente) wird NUR an den Builder gereicht, z.B. der
+        DB-Record zum Kin - er muss durch den Schlüssel eindeutig bestimmt sein.
+      - Rückgabe des Builders: str oder Tupel von str (unveränderlich!).
+    Modul & Version werden sonst aus dem definierenden Modul abgeleitet.
+    Der ungecachte Builder bleibt als `.uncached` erreichbar.
+    """
+    def decorate(build):
+        name = module or build.__module__.rsplit(".", 1)[-1]
+        ver = version if version is not None else module_version(build.__module__)
+
+        @functools.wraps(build)
+        def wrapper(kin, moon_day, *key_args, **context):
+            key = (name, kin, moon_day, ver, build.__name__) + key_args
+            target = FRAGMENTS if cache is None else cache
+            return target.get_or_build(key, lambda: build(kin, moon_day, *key_args, **context))
+
+        wrapper.uncached = build
+        return wrapper
+    return decorate
@@ -1,9 +1,38 @@
 # ==============================================================================
 # 🌀 CORE MODULE 1: MATH-ENGINE (Ultimate Logic)
 # Aufgabe: Berechnung nach 'Ultimative Dreamspell Logik.md'.
-# Iterative Zählung (Tag für Tag) mit Hunab Ku (29.2.) Filter.
+# Geschlossene Formel (O(1)) mit Hunab Ku (29.2.) Filter.
+# Die iterative Zählung (Tag für Tag) bleibt als Referenz erhalten.
 # ==============================================================================
+import collections
 import datetime
+import sys
+
+def _load_numpy():
+    """
+    numpy ist optional (kommt mit Streamlit mit) und wird erst bei der ersten
+    Batch-Anfrage importiert, damit der Import der Engine schlank bleibt.
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+# Differenz zwischen numpy-Epoche (1970-01-01) und proleptischem Ordinal (0001-01-01 = 1)
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+# Ein Eintrag der KinStructure-Tabelle (unveränderlich, Attribut-Zugriff)
+KinStructure = collections.namedtuple("KinStructure", (
+    "kin", "seal_id", "tone_id", "color", "clan", "family",
+    "time_cell", "time_cell_name", "time_cell_color",
+    "wave", "wave_start", "wave_end", "wave_position", "wave_seal_id", "wave_color",
+    "castle", "castle_position", "castle_name", "castle_label", "castle_color",
+    "harmonic", "harmonic_position", "harmonic_color",
+    "chromatic", "chromatic_position", "chromatic_color",
+    "season", "season_position", "season_name", "season_label", "season_color",
+    "spin",
+))
 
 class MathEngine:
     """Die mathematische Konstante der Zeit (Dreamspell Logic)."""
@@ -11,11 +40,76 @@ class MathEngine:
     ANCHOR_DATE = datetime.date(1986, 5, 19)
     ANCHOR_KIN = 121
 
+    # Spalten der Orakel-Tabelle (siehe ORACLE_TABLE am Dateiende)
+    ORACLE_FIELDS = ("destiny", "guide", "analog", "antipode", "occult")
+
+    # Namen & Farben der Zyklen (Quelle der Wahrheit für alle Module, siehe KIN_STRUCTURE)
+    SEAL_NAMES = ("Drache", "Wind", "Nacht", "Samen", "Schlange", "Weltenüberbrücker", "Hand",
+                  "Stern", "Mond", "Hund", "Affe", "Mensch", "Himmelswanderer", "Magier",
+                  "Adler", "Krieger", "Erde", "Spiegel", "Sturm", "Sonne")
+    COLORS = ("Rot", "Weiß", "Blau", "Gelb")
+    EARTH_FAMILIES = ("Kardinal", "Zentral", "Signal", "Portal", "Polar")
+    CLANS = ("Feuer", "Blut", "Wahrheit", "Himmel")
+    TIME_CELLS = ("Eingang", "Speicher", "Prozess", "Ausgang", "Matrix")
+    CELL_COLORS = ("Rot", "Weiß", "Blau", "Gelb", "Grün")  # Zeitzellen & Schlösser
+    CASTLE_NAMES = ("Rotes Östliches Schloss der Initiierung", "Weißes Nördliches Schloss des Überquerens",
+                    "Blaues Westliches Schloss der Verbrennung", "Gelbes Südliches Schloss des Gebens",
+                    "Grünes Zentrales Schloss des Verzauberns")
+    CASTLE_LABELS = ("Drehung", "Kreuzung", "Verbrennung", "Geben", "Verzauberung")  # Kurzform (Kacheln)
+    SEASON_NAMES = ("Lebenskraft (Ost)", "Liebe (Nord)", "Magie (West)", "Erleuchtung (Süd)")
+    SEASON_LABELS = ("Lebenskraft", "Liebe", "Magie", "Erleuchtung")
+
+    # Guide-Verschiebung des Siegels je Ton (Shift-Tabelle)
+    GUIDE_SHIFT = {
+        1: 0, 6: 0, 11: 0,
+        2: 12, 7: 12, 12: 12,
+        3: 4, 8: 4, 13: 4,
+        4: 16, 9: 16,
+        5: 8, 10: 8
+    }
+
+    @staticmethod
+    def _leap_days_before(date):
+        """
+        Zählt alle 29.2. im proleptischen Kalender, die VOR dem Datum liegen.
+        Basis für die geschlossene Formel (keine Schleife).
+        """
+        y = date.year - 1
+        count = y // 4 - y // 100 + y // 400
+        # Liegt der 29.2. des laufenden Jahres bereits hinter uns?
+        if date.month > 2 and (date.year % 4 == 0 and (date.year % 100 != 0 or date.year % 400 == 0)):
+            count += 1
+        return count
+
+    @staticmethod
+    def _dreamspell_ordinal(date):
+        """Fortlaufende Tageszahl OHNE Schalttage (Hunab Ku wird übersprungen)."""
+        return date.toordinal() - MathEngine._leap_days_before(date)
+
     @staticmethod
     def get_kin(d, m, y):
         """
         Berechnet das KIN. Schalttage (29.2.) ergeben 0 (Hunab Ku).
-        Nutzt die iterative Zählmethode für maximale Präzision.
+        Geschlossene Formel: Abstand zum Anker minus übersprungene 29.2. -> O(1).
+        """
+        # Hunab Ku Check
+        if m == 2 and d == 29:
+            return 0
+
+        target_date = datetime.date(y, m, d)
+
+        # Dreamspell-Tage zwischen Anker und Ziel (vorwärts positiv, rückwärts negativ)
+        delta_days = MathEngine._dreamspell_ordinal(target_date) - MathEngine._ANCHOR_ORDINAL
+
+        # Formel: (Start + Delta - 1) % 260 + 1
+        kin = (MathEngine.ANCHOR_KIN + delta_days - 1) % 260 + 1
+        return int(kin)
+
+    @staticmethod
+    def get_kin_iterative(d, m, y):
+        """
+        REFERENZ-IMPLEMENTIERUNG: Iterative Zählmethode (Tag für Tag).
+        Langsam (O(n)), aber trivial nachvollziehbar. Dient als Prüfstein für get_kin.
         """
         # Hunab Ku Check
         if m == 2 and d == 29:
@@ -51,6 +145,43 @@ class MathEngine:
             
         return int(kin)
 
+    @staticmethod
+    def verify_closed_form(start=datetime.date(1700, 1, 1), end=datetime.date(2300, 12, 31), spot_check_every=1499):
+        """
+        Äquivalenz-Prüfung: Vergleicht get_kin mit der iterativen Referenz für JEDEN Tag
+        im Bereich. Die Referenz läuft Tag für Tag mit (wie get_kin_iterative), zusätzlich
+        wird get_kin_iterative selbst stichprobenartig aufgerufen.
+        Gibt eine Liste der Abweichungen (datum, erwartet, erhalten) zurück (leer = identisch).
+        """
+        one_day = datetime.timedelta(days=1)
+        mismatches = []
+
+        # Startwert der laufenden Referenz (Hunab Ku hat kein Kin -> Vortag + 1)
+        seed = start
+        while seed.month == 2 and seed.day == 29:
+            seed -= one_day
+        ref_kin = MathEngine.get_kin_iterative(seed.day, seed.month, seed.year)
+        if seed != start:
+            ref_kin = ref_kin % 260 + 1
+
+        current = start
+        step = 0
+        while current <= end:
+            is_hunab_ku = current.month == 2 and current.day == 29
+            expected = 0 if is_hunab_ku else ref_kin
+            got = MathEngine.get_kin(current.day, current.month, current.year)
+            if got != expected:
+                mismatches.append((current, expected, got))
+            if spot_check_every and step % spot_check_every == 0:
+                ref = MathEngine.get_kin_iterative(current.day, current.month, current.year)
+                if ref != got:
+                    mismatches.append((current, ref, got))
+            if not is_hunab_ku:
+                ref_kin = ref_kin % 260 + 1
+            current += one_day
+            step += 1
+        return mismatches
+
     @staticmethod
     def get_ids(kin):
         """Wandelt KIN in Siegel-ID (1-20) und Ton-ID (1-13)."""
@@ -59,21 +190,199 @@ class MathEngine:
         t_id = (kin - 1) % 13 + 1
         return int(s_id), int(t_id)
 
+    @staticmethod
+    def get_structure(kin):
+        """KinStructure (Welle, Schloss, Harmonik, ...) für Kin 1-260. Kin 0 (Hunab Ku) -> None."""
+        if not kin:
+            return None
+        return MathEngine.KIN_STRUCTURE[(kin - 1) % 260]
+
+    @staticmethod
+    def _structure_entry(kin):
+        """Berechnet EINEN Eintrag der KinStructure-Tabelle (nur beim Import genutzt)."""
+        idx = kin - 1
+        seal_id = idx % 20 + 1
+        tone_id = idx % 13 + 1
+        time_cell = (seal_id - 1) // 4 + 1
+        wave = idx // 13 + 1
+        wave_start = (wave - 1) * 13 + 1
+        wave_seal_id = (wave_start - 1) % 20 + 1
+        castle = idx // 52 + 1
+        harmonic = idx // 4 + 1
+        chromatic = idx // 5 + 1
+        chromatic_seal_id = ((chromatic - 1) * 5) % 20 + 1
+        season = idx // 65 + 1
+        return KinStructure(
+            kin=kin, seal_id=seal_id, tone_id=tone_id,
+            color=MathEngine.COLORS[(seal_id - 1) % 4],
+            clan=MathEngine.CLANS[(seal_id - 1) // 5],
+            family=MathEngine.EARTH_FAMILIES[(seal_id - 1) % 5],
+            time_cell=time_cell,
+            time_cell_name=MathEngine.TIME_CELLS[time_cell - 1],
+            time_cell_color=MathEngine.CELL_COLORS[time_cell - 1],
+            wave=wave, wave_start=wave_start, wave_end=wave_start + 12, wave_position=tone_id,
+            wave_seal_id=wave_seal_id,
+            wave_color=MathEngine.COLORS[(wave_seal_id - 1) % 4],
+            castle=castle, castle_position=idx % 52 + 1,
+            castle_name=MathEngine.CASTLE_NAMES[castle - 1],
+            castle_label=MathEngine.CASTLE_LABELS[castle - 1],
+            castle_color=MathEngine.CELL_COLORS[castle - 1],
+            # Eine Harmonik = 4 Kins = eine Zeitzelle (Eingang ... Matrix)
+            harmonic=harmonic, harmonic_position=idx % 4 + 1,
+            harmonic_color=MathEngine.CELL_COLORS[time_cell - 1],
+            # Eine Chromatik = 5 Kins, beginnt & endet mit derselben Farbe
+            chromatic=chromatic, chromatic_position=idx % 5 + 1,
+            chromatic_color=MathEngine.COLORS[(chromatic_seal_id - 1) % 4],
+            season=season, season_position=idx % 65 + 1,
+            season_name=MathEngine.SEASON_NAMES[season - 1],
+            season_label=MathEngine.SEASON_LABELS[season - 1],
+            season_color=MathEngine.COLORS[season - 1],
+            spin=1 if kin <= 130 else 2,
+        )
+
+    @staticmethod
+    def check_structure_consistency(db_tzolkin):
+        """
+        Vergleicht KIN_STRUCTURE mit den Feldern der Tzolkin-DB.
+        Rückgabe: Liste (kin, feld, tabelle, db) - leer = konsistent.
+        """
+        issues = []
+        for record in db_tzolkin:
+            entry = MathEngine.get_structure(record.get("kin", 0))
+            if entry is None:
+                continue
+            identity = record.get("identity", {})
+            seal = identity.get("seal", {})
+            time_data = record.get("time", {})
+            checks = (
+                ("seal_id", entry.seal_id, seal.get("id")),
+                ("tone_id", entry.tone_id, identity.get("tone", {}).get("id")),
+                ("color", entry.color, seal.get("color")),
+                ("family", entry.family, seal.get("family")),
+                ("clan", entry.clan, identity.get("clan")),
+                ("harmonic", entry.harmonic, time_data.get("harmonic")),
+                ("chromatic", entry.chromatic, time_data.get("chromatic")),
+                ("castle_name", entry.castle_name, time_data.get("castle")),
+            )
+            for field, ours, theirs in checks:
+                if theirs is not None and ours != theirs:
+                    issues.append((entry.kin, field, ours, theirs))
+        return issues
+
+    @staticmethod
+    def _to_ordinals(dates, np):
+        """
+        Normalisiert Datumswerte (date, datetime64, proleptische Ordinale) zu einem
+        1-d int64-Array. Einzelwerte & 0-d-Arrays werden zu einem Array der Länge 1.
+        """
+        arr = np.atleast_1d(np.asarray(dates))
+        if arr.dtype.kind in "iu":
+            return arr.astype(np.int64)
+        if arr.dtype.kind != "M":
+            # Listen von datetime.date -> datetime64[D]
+            arr = np.array(arr.tolist(), dtype="datetime64[D]")
+        return arr.astype("datetime64[D]").astype(np.int64) + _EPOCH_ORDINAL
+
+    @staticmethod
+    def get_kins(dates):
+        """
+        BATCH-API: Berechnet KIN, Siegel-ID und Ton-ID für viele Daten in einem Durchgang.
+        Akzeptiert eine Sequenz/Array von datetime.date, numpy datetime64 oder
+        proleptischen Ordinalen (date.toordinal()). Schalttage (29.2.) ergeben 0 (Hunab Ku).
+        Ein Einzelwert (date, datetime64, Ordinal, 0-d-Array) zählt als Sequenz der Länge 1.
+        Rückgabe: (kins, seal_ids, tone_ids) als numpy-Arrays (ohne numpy: Listen).
+        """
+        np = _load_numpy()
+        if np is None:
+            if isinstance(dates, (int, datetime.date)):
+                dates = [dates]
+            ordinals = [d if isinstance(d, int) else d.toordinal() for d in dates]
+            kins = [MathEngine.get_kin(x.day, x.month, x.year)
+                    for x in map(datetime.date.fromordinal, ordinals)]
+            seal_ids, tone_ids = MathEngine.get_ids_batch(kins)
+            return kins, seal_ids, tone_ids
+
+        ordinals = MathEngine._to_ordinals(dates, np)
+
+        # Kalender-Zerlegung vektorisiert über datetime64
+        days = (ordinals - _EPOCH_ORDINAL).astype("datetime64[D]")
+        years_m8 = days.astype("datetime64[Y]")
+        months_m8 = days.astype("datetime64[M]")
+        year = years_m8.astype(np.int64) + 1970
+        month = (months_m8 - years_m8.astype("datetime64[M]")).astype(np.int64) + 1
+        day = (days - months_m8.astype("datetime64[D]")).astype(np.int64) + 1
+
+        # Gleiche Formel wie _leap_days_before / _dreamspell_ordinal
+        prev = year - 1
+        is_leap_year = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+        leap_days = prev // 4 - prev // 100 + prev // 400 + (is_leap_year & (month > 2))
+        delta_days = ordinals - leap_days - MathEngine._ANCHOR_ORDINAL
+
+        kins = (MathEngine.ANCHOR_KIN + delta_days - 1) % 260 + 1
+        # Hunab Ku Check
+        kins[(month == 2) & (day == 29)] = 0
+
+        seal_ids, tone_ids = MathEngine.get_ids_batch(kins)
+        return kins, seal_ids, tone_ids
+
+    @staticmethod
+    def verify_batch(start=datetime.date(1700, 1, 1), end=datetime.date(2300, 12, 31)):
+        """
+        Prüft get_kins gegen get_kin: jeder Tag im Bereich als ein Batch, dazu
+        Einzelwerte (date, Ordinal, datetime64, 0-d-Array) als Batch der Länge 1.
+        Gibt eine Liste der Abweichungen (eingabe, erwartet, erhalten) zurück (leer = identisch).
+        """
+        days = [start + datetime.timedelta(days=i) for i in range((end - start).days + 1)]
+        expected = [MathEngine.get_kin(d.day, d.month, d.year) for d in days]
+        kins, _, _ = MathEngine.get_kins(days)
+        mismatches = [(d, e, int(k)) for d, e, k in zip(days, expected, kins) if e != k]
+
+        samples = [datetime.date(1986, 5, 19), datetime.date(2024, 2, 29), datetime.date(2300, 12, 31)]
+        np = _load_numpy()
+        for day in samples:
+            scalars = [day, day.toordinal()]
+            if np is not None:
+                scalars += [np.datetime64(day, "D"), np.asarray(np.datetime64(day, "D")),
+                            np.asarray(day.toordinal())]
+            for value in scalars:
+                try:
+                    kins, _, _ = MathEngine.get_kins(value)
+                    got = [int(k) for k in kins]
+                except (TypeError, ValueError) as e:
+                    got = repr(e)
+                want = [MathEngine.get_kin(day.day, day.month, day.year)]
+                if got != want:
+                    mismatches.append((repr(value), want, got))
+        return mismatches
+
+    @staticmethod
+    def get_ids_batch(kins):
+        """Vektorisierte Form von get_ids: KIN-Array -> (Siegel-IDs, Ton-IDs). KIN 0 -> (0, 0)."""
+        np = _load_numpy()
+        if np is None:
+            pairs = [MathEngine.get_ids(k) for k in kins]
+            return [p[0] for p in pairs], [p[1] for p in pairs]
+
+        kins = np.asarray(kins, dtype=np.int64)
+        valid = kins != 0
+        seal_ids = np.where(valid, (kins - 1) % 20 + 1, 0)
+        tone_ids = np.where(valid, (kins - 1) % 13 + 1, 0)
+        return seal_ids, tone_ids
+
     @staticmethod
     def _find_kin(s_id, t_id):
-        """Hilfsfunktion: Findet KIN aus Siegel & Ton."""
-        for k in range(1, 261):
-            if (k - 1) % 20 + 1 == s_id and (k - 1) % 13 + 1 == t_id:
-                return k
-        return 0
+        """Hilfsfunktion: Findet KIN aus Siegel & Ton (Tabellen-Lookup, O(1))."""
+        if not (1 <= s_id <= 20 and 1 <= t_id <= 13):
+            return 0
+        return MathEngine.KIN_BY_SEAL_TONE[s_id - 1][t_id - 1]
 
     @staticmethod
-    def get_oracle_kin_ids(kin):
+    def _oracle_formula(kin):
         """
         Berechnet das Orakel basierend auf der 'Ultimative Dreamspell Logik'.
-        Gibt KIN-Nummern zurück (wichtig für spätere 3D-Positionierung).
+        Rückgabe als Tupel in der Reihenfolge von ORACLE_FIELDS.
+        Wird nur beim Import für ORACLE_TABLE ausgeführt (nach KIN_BY_SEAL_TONE).
         """
-        if kin == 0: return None
         s_id, t_id = MathEngine.get_ids(kin)
 
         # 1. ANALOG (Partner)
@@ -104,17 +413,47 @@ class MathEngine:
 
         # 4. GUIDE (Führung)
         # Logik aus Datei: Shift-Tabelle
-        guide_shift = {
-            1: 0, 6: 0, 11: 0,
-            2: 12, 7: 12, 12: 12,
-            3: 4, 8: 4, 13: 4,
-            4: 16, 9: 16,
-            5: 8, 10: 8
-        }
-        guide_s = (s_id + guide_shift.get(t_id, 0) - 1) % 20 + 1
+        guide_s = (s_id + MathEngine.GUIDE_SHIFT.get(t_id, 0) - 1) % 20 + 1
         # Guide hat denselben Ton
         guide_kin = MathEngine._find_kin(guide_s, t_id)
 
+        return (kin, guide_kin, analog_kin, antipode_kin, occ_kin)
+
+    @staticmethod
+    def _oracle_formula_synaptic(kin):
+        """
+        Zweite, historisch gewachsene Orakel-Formel (ehemals lokal in mod_oracle):
+        0-basierter Siegel-Index, Analog = (19 - s_idx) % 20, Okkult = 261 - Kin.
+        Wird NICHT mehr zur Anzeige genutzt, nur für check_oracle_consistency.
+        """
+        s_idx = (kin - 1) % 20
+        t_idx = (kin - 1) % 13
+
+        def find(target_s_idx):
+            return MathEngine._find_kin(target_s_idx + 1, t_idx + 1)
+
+        analog_k = find((19 - s_idx) % 20)
+        anti_k = find((s_idx + 10) % 20)
+        occ_k = 261 - kin
+        guide_k = find((s_idx + MathEngine.GUIDE_SHIFT.get(t_idx + 1, 0)) % 20)
+        return (kin, guide_k, analog_k, anti_k, occ_k)
+
+    @staticmethod
+    def get_oracle_row(kin):
+        """Liefert die vorberechnete Orakel-Zeile (destiny, guide, analog, antipode, occult)."""
+        if not 1 <= kin <= 260: return None
+        return MathEngine.ORACLE_TABLE[kin - 1]
+
+    @staticmethod
+    def get_oracle_kin_ids(kin):
+        """
+        Orakel basierend auf der 'Ultimative Dreamspell Logik' (vorberechnete Tabelle).
+        Gibt KIN-Nummern zurück (wichtig für spätere 3D-Positionierung).
+        """
+        row = MathEngine.get_oracle_row(kin)
+        if row is None: return None
+        _, guide_kin, analog_kin, antipode_kin, occ_kin = row
+
         return {
             "guide": guide_kin,
             "analog": analog_kin,
@@ -122,13 +461,108 @@ class MathEngine:
             "occult": occ_kin
         }
 
+    @staticmethod
+    def check_oracle_consistency(db_tzolkin=None):
+        """
+        Vergleicht ORACLE_TABLE mit der alternativen Formel (mod_oracle-Variante)
+        und optional mit den in der Tzolkin-DB gespeicherten Orakel-Kins.
+        Rückgabe: Liste von (quelle, kin, rolle, tabelle, abweichung).
+        """
+        issues = []
+        for kin in range(1, 261):
+            row = MathEngine.ORACLE_TABLE[kin - 1]
+            alt = MathEngine._oracle_formula_synaptic(kin)
+            for field, ours, theirs in zip(MathEngine.ORACLE_FIELDS, row, alt):
+                if ours != theirs:
+                    issues.append(("formula", kin, field, ours, theirs))
+
+        if db_tzolkin:
+            for record in db_tzolkin:
+                kin = record.get("kin", 0)
+                oracle = record.get("oracle") or {}
+                row = MathEngine.get_oracle_row(kin)
+                if row is None: continue
+                for field, ours in zip(MathEngine.ORACLE_FIELDS, row):
+                    stored = (oracle.get(field) or {}).get("kin")
+                    if stored is not None and stored != ours:
+                        issues.append(("database", kin, field, ours, stored))
+        return issues
+
+# ------------------------------------------------------------------------------
+# IMPORT-ZEIT TABELLEN (einmalig berechnet, danach nur Index-Zugriff)
+# ------------------------------------------------------------------------------
+# Anker als Dreamspell-Ordinal
+MathEngine._ANCHOR_ORDINAL = MathEngine._dreamspell_ordinal(MathEngine.ANCHOR_DATE)
+
+# Inverse Siegel/Ton -> KIN (20 x 13): KIN_BY_SEAL_TONE[s_id - 1][t_id - 1]
+# Ein Durchlauf über alle 260 Kins (jede Siegel/Ton-Kombination kommt genau einmal vor)
+_inverse = [[0] * 13 for _ in range(20)]
+for _kin in range(1, 261):
+    _inverse[(_kin - 1) % 20][(_kin - 1) % 13] = _kin
+MathEngine.KIN_BY_SEAL_TONE = tuple(tuple(row) for row in _inverse)
+del _inverse, _kin
+
+# Orakel (260 x 5): ORACLE_TABLE[kin - 1] = (destiny, guide, analog, antipode, occult)
+MathEngine.ORACLE_TABLE = tuple(MathEngine._oracle_formula(kin) for kin in range(1, 261))
+
+# Zyklus-Struktur (260 Einträge): KIN_STRUCTURE[kin - 1] -> KinStructure
+MathEngine.KIN_STRUCTURE = tuple(MathEngine._structure_entry(kin) for kin in range(1, 261))
+
 # ==============================================================================
 # 🛠 INTERAKTIVES TERMINAL (Admin-Modus)
 # ==============================================================================
 if __name__ == "__main__":
+    # Äquivalenz-Test: python math_engine.py --verify
+    if "--verify" in sys.argv:
+        print("🔬 Prüfe get_kin gegen iterative Referenz (1700-2300)...")
+        errors = MathEngine.verify_closed_form()
+        if errors:
+            for day, expected, got in errors[:20]:
+                print(f"❌ {day}: erwartet {expected}, erhalten {got}")
+            print(f"❌ {len(errors)} Abweichungen.")
+            sys.exit(1)
+        print("✅ Geschlossene Formel identisch mit Referenz (jeder Tag 1700-2300).")
+        errors = MathEngine.verify_batch()
+        if errors:
+            for value, expected, got in errors[:20]:
+                print(f"❌ get_kins({value}): erwartet {expected}, erhalten {got}")
+            print(f"❌ {len(errors)} Abweichungen im Batch.")
+            sys.exit(1)
+        print("✅ get_kins identisch mit get_kin (Batch & Einzelwerte).")
+        sys.exit(0)
+
+    # Orakel-Konsistenz: python math_engine.py --oracle-check [db.json]
+    if "--oracle-check" in sys.argv:
+        import json
+        db = None
+        db_args = [a for a in sys.argv[1:] if a.endswith(".json")]
+        if db_args:
+            with open(db_args[0], 'r', encoding='utf-8') as f:
+                db = json.load(f)
+        issues = MathEngine.check_oracle_consistency(db)
+        for source, kin, field, ours, theirs in issues:
+            print(f"⚠️ [{source}] KIN {kin} {field}: Tabelle {ours} <> {theirs}")
+        print(f"{'✅' if not issues else '⚠️'} {len(issues)} Abweichungen.")
+        sys.exit(0)
+
+    # Struktur-Konsistenz: python math_engine.py --structure-check db.json
+    if "--structure-check" in sys.argv:
+        import json
+        db_args = [a for a in sys.argv[1:] if a.endswith(".json")]
+        if not db_args:
+            print("❌ Bitte Tzolkin-DB angeben: --structure-check db.json")
+            sys.exit(1)
+        with open(db_args[0], 'r', encoding='utf-8') as f:
+            db = json.load(f)
+        issues = MathEngine.check_structure_consistency(db)
+        for kin, field, ours, theirs in issues:
+            print(f"⚠️ KIN {kin} {field}: Tabelle {ours} <> DB {theirs}")
+        print(f"{'✅' if not issues else '⚠️'} {len(issues)} Abweichungen.")
+        sys.exit(0)
+
     print("\n" + "═"*50)
     print("🌀 MATH-ENGINE (ULTIMATE LOGIC CHECK)")
-    print("Berechnung: Iterativ (Tag für Tag) ab Anker 19.5.1986")
+    print("Berechnung: Geschlossene Formel ab Anker 19.5.1986")
     print("═"*50)
 
     while True:
@@ -0,0 +1,154 @@
+# ==============================================================================
+# 🧠 MEMORY DIAG (tracemalloc pro Rerun, Pulse & Modul)
+# ------------------------------------------------------------------------------
+# ZWECK:    Opt-in-Diagnose für wachsenden Speicher auf den Hosts. Misst per
+#           tracemalloc um get_pulse, jeden Modul-Render und den Pulse-Inspector
+#           (st.json):
+#           - Spitze:    höchster Mehrverbrauch WÄHREND des Aufrufs
+#           - Behalten:  Netto-Zuwachs NACH dem Aufruf (Kopien, HTML, Deltas)
+#           - Top-Stellen (Datei:Zeile) des behaltenen Speichers - nur für EIN
+#             gewähltes Ziel, Snapshots kosten bei vielen Traces Sekunden
+#           Am Ende jedes Reruns (nach gc): gesamter getrackter Speicher + RSS.
+#           Der erste Diagnose-Rerun ist die Basis; compare_leaks() zeigt die
+#           Stellen, die seitdem gewachsen sind (Leaks, z.B. in session_state).
+# GRENZEN:  tracemalloc ist prozessweit - parallele Sessions fließen mit ein, und
+#           Allokationen kosten währenddessen spürbar mehr (Staging, nicht Prod).
+# HINWEIS:  Kein Streamlit-Import.
+# ==============================================================================
+
+import collections
+import gc
+import os
+import tracemalloc
+
+# Frames pro Allokation (1 = nur die allozierende Zeile, am billigsten)
+MEMORY_TRACE_FRAMES = 1
+MEMORY_TOP_N = 10
+# Reruns im Verlauf (gleitendes Fenster)
+MEMORY_HISTORY = 100
+
+MemorySample = collections.namedtuple("MemorySample", ["target", "peak", "retained", "sites"])
+RerunSample = collections.namedtuple("RerunSample", ["rerun", "traced", "rss"])
+
+# tracemalloc-Interna, diese Diagnose & Import-Maschinerie (Modul-Code) gehören nicht in die Top-Stellen
+_NOISE_FILES = frozenset((
+    tracemalloc.__file__,
+    __file__,
+    "<frozen importlib._bootstrap>",
+    "<frozen importlib._bootstrap_external>",
+    "<unknown>",
+))
+
+def start_tracing(frames=MEMORY_TRACE_FRAMES):
+    """tracemalloc einschalten. True = dieser Aufruf hat es gestartet (und sollte es stoppen)."""
+    if tracemalloc.is_tracing():
+        return False
+    tracemalloc.start(frames)
+    return True
+
+def stop_tracing():
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+def rss_bytes():
+    """Aktueller Resident Set Size des Prozesses (Linux /proc), sonst None."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+def site_sizes():
+    """
+    Aktueller Speicher pro Stelle: {(datei, zeile): (bytes, blöcke)}.
+    Kompakt (eine Zeile pro Stelle statt ein Objekt pro Allokation) -> taugt als Basis.
+    """
+    sizes = {}
+    for stat in tracemalloc.take_snapshot().statistics("lineno"):
+        frame = stat.traceback[0]
+        if frame.filename not in _NOISE_FILES:
+            sizes[(frame.filename, frame.lineno)] = (stat.size, stat.count)
+    return sizes
+
+def top_sites(after, before, n=MEMORY_TOP_N):
+    """Stellen mit dem größten Zuwachs zwischen zwei site_sizes(): [(datei:zeile, bytes, blöcke)]."""
+    rows = []
+    for site, (size, count) in after.items():
+        old_size, old_count = before.get(site, (0, 0))
+        if size > old_size:
+            rows.append((f"{os.path.basename(site[0])}:{site[1]}", size - old_size, count - old_count))
+    rows.sort(key=lambda row: row[1], reverse=True)
+    return rows[:n]
+
+class MemoryDiagnostics:
+    """Speicher-Messungen einer Session: letzte Messung pro Ziel + Verlauf über Reruns."""
+
+    def __init__(self, top_n=MEMORY_TOP_N, history=MEMORY_HISTORY):
+        self.top_n = top_n
+        self.site_target = None  # Ziel, für das Top-Stellen gesammelt werden
+        self.samples = {}   # Ziel -> MemorySample (letzter Rerun)
+        self.history = collections.deque(maxlen=history)
+        self.reruns = 0
+        self.baseline = None  # site_sizes() nach dem ersten Diagnose-Rerun
+        self.baseline_traced = 0
+        self.leaks = []       # Stellen, die seit baseline gewachsen sind (compare_leaks)
+
+    def measure(self, target, func, *args, **kwargs):
+        """func(*args, **kwargs) ausführen und Spitze & Behaltenes (ggf. Top-Stellen) unter `target` merken."""
+        if not tracemalloc.is_tracing():
+            return func(*args, **kwargs)
+        before = site_sizes() if target == self.site_target else None
+        start, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            sites = top_sites(site_sizes(), before, self.top_n) if before is not None else []
+            self.samples[target] = MemorySample(target, max(peak - start, 0), current - start, sites)
+
+    def end_rerun(self):
+        """Am Ende des Reruns: gc, Gesamtstand & RSS in den Verlauf. Der erste Rerun wird zur Basis."""
+        if not tracemalloc.is_tracing():
+            return None
+        gc.collect()
+        self.reruns += 1
+        traced, _ = tracemalloc.get_traced_memory()
+        sample = RerunSample(self.reruns, traced, rss_bytes())
+        self.history.append(sample)
+        if self.baseline is None:
+            self.baseline = site_sizes()
+            self.baseline_traced = traced
+        return sample
+
+    def compare_leaks(self):
+        """Stellen, die seit dem ersten Diagnose-Rerun gewachsen sind (teuer: ein Snapshot)."""
+        if self.baseline is not None and tracemalloc.is_tracing():
+            gc.collect()
+            self.leaks = top_sites(site_sizes(), self.baseline, self.top_n)
+        return self.leaks
+
+    def growth(self):
+        """(Zuwachs seit dem ersten Diagnose-Rerun, Zuwachs pro Rerun) in Bytes."""
+        if len(self.history) < 2:
+            return 0, 0.0
+        grown = self.history[-1].traced - self.baseline_traced
+        return grown, grown / (self.reruns - 1)
+
+    def reset(self):
+        self.samples.clear()
+        self.history.clear()
+        self.reruns = 0
+        self.baseline = None
+        self.baseline_traced = 0
+        self.leaks = []
+
+    def summary(self):
+        """Kurzreport für den Debug-Modus."""
+        if not self.history:
+            return "noch keine Messung"
+        last = self.history[-1]
+        grown, per_rerun = self.growth()
+        rss = f" • RSS {last.rss / 1024 / 1024:.1f} MB" if last.rss is not None else ""
+        return (f"getrackt {last.traced / 1024 / 1024:.2f} MB{rss} • seit Rerun 1: "
+                f"{grown / 1024:+.1f} KB ({per_rerun / 1024:+.1f} KB/Rerun, {self.reruns} Reruns)")
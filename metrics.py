@@ -0,0 +1,245 @@
+# ==============================================================================
+# 📈 METRICS (Laufzeit-Messung der Hot-Paths, ohne UI)
+# ------------------------------------------------------------------------------
+# ZWECK:    perf_counter_ns um DB-Load, get_pulse, Pulse-Build, Modul-Render und
+#           Import/Reload. Pro Serie (op, name): Anzahl, Summe, Maximum und ein
+#           Fenster der letzten Messungen für p50/p95/p99.
+# EXPORT:   Alle METRICS_EXPORT_SECONDS (vom messenden Thread, kein Hintergrund-Thread):
+#           - Prometheus-Textformat (atomar ersetzt; z.B. für den node_exporter
+#             textfile-Collector). Eine Datei PRO WORKER (<name>.<pid>.prom) mit
+#             Label pid - sonst überschreiben sich die Worker gegenseitig.
+#           - JSONL (angehängt, eine Zeile pro Serie und Export). Ab
+#             METRICS_JSONL_MAX_BYTES rotiert nach <datei>.1 (eine Generation).
+#           Standard: kein Export. Die App schreibt nur, wenn V21_METRICS_JSONL bzw.
+#           V21_METRICS_PROM gesetzt sind (engine_streamlit -> configure()).
+# AUSWERTEN: python metrics.py [metrics_v21.jsonl]
+# HINWEIS:  Kein Streamlit-Import.
+# ==============================================================================
+
+import atexit
+import datetime
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+
+# Messungen pro Serie, aus denen die Perzentile berechnet werden (gleitendes Fenster)
+METRICS_WINDOW = 2048
+METRICS_EXPORT_SECONDS = 15
+METRICS_JSONL_MAX_BYTES = 50 * 1024 * 1024
+QUANTILES = (0.5, 0.95, 0.99)
+PROM_METRIC = "v21_duration_seconds"
+
+class Series:
+    """Eine Zeitreihe (op, name): Gesamtzähler + Fenster der letzten Messungen."""
+
+    __slots__ = ("count", "sum_ns", "max_ns", "window")
+
+    def __init__(self, window):
+        self.count = 0
+        self.sum_ns = 0
+        self.max_ns = 0
+        self.window = deque(maxlen=window)
+
+    def observe(self, ns):
+        self.count += 1
+        self.sum_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+        self.window.append(ns)
+
+    def quantiles(self, qs=QUANTILES):
+        """Perzentile (Nearest-Rank) über das Fenster, in ns."""
+        ordered = sorted(self.window)
+        if not ordered:
+            return [0] * len(qs)
+        last = len(ordered) - 1
+        return [ordered[min(last, int(q * len(ordered)))] for q in qs]
+
+class Timer:
+    """Kontextmanager: misst den Block mit perf_counter_ns und meldet ihn der Registry."""
+
+    __slots__ = ("registry", "op", "name", "start")
+
+    def __init__(self, registry, op, name):
+        self.registry = registry
+        self.op = op
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.registry.observe(self.op, self.name, time.perf_counter_ns() - self.start)
+        return False
+
+class MetricsRegistry:
+    """Alle Serien eines Prozesses. Thread-sicher (Streamlit-Sessions laufen in Threads)."""
+
+    def __init__(self, window=METRICS_WINDOW):
+        self.window = window
+        self.enabled = True
+        self.jsonl_path = None
+        self.prom_path = None
+        self.export_seconds = METRICS_EXPORT_SECONDS
+        self.jsonl_max_bytes = METRICS_JSONL_MAX_BYTES
+        self._series = {}   # (op, name) -> Series
+        self._lock = threading.Lock()
+        self._next_export = None
+        self._cleanup_registered = False
+        self.exports = 0
+
+    def configure(self, jsonl_path=None, prom_path=None, export_seconds=METRICS_EXPORT_SECONDS,
+                  enabled=True, jsonl_max_bytes=METRICS_JSONL_MAX_BYTES):
+        """
+        Export-Ziele setzen (None = dieses Format nicht schreiben).
+        prom_path ist der Basisname: geschrieben wird worker_prom_path() (mit pid).
+        """
+        with self._lock:
+            self.enabled = enabled
+            self.jsonl_path = jsonl_path
+            self.prom_path = prom_path
+            self.export_seconds = export_seconds
+            self.jsonl_max_bytes = jsonl_max_bytes
+            self._next_export = time.monotonic() + export_seconds
+        if prom_path and not self._cleanup_registered:
+            atexit.register(self._remove_prom_file)
+            self._cleanup_registered = True
+
+    def worker_prom_path(self):
+        """Prometheus-Datei dieses Prozesses: metrics_v21.prom -> metrics_v21.<pid>.prom."""
+        if not self.prom_path:
+            return None
+        root, ext = os.path.splitext(self.prom_path)
+        return f"{root}.{os.getpid()}{ext}"
+
+    def _remove_prom_file(self):
+        """Beim sauberen Beenden: eigene Datei weg, damit keine toten Worker gescrapt werden."""
+        try:
+            os.remove(self.worker_prom_path())
+        except (OSError, TypeError):
+            pass
+
+    def timer(self, op, name=""):
+        return Timer(self, op, name)
+
+    def observe(self, op, name, ns):
+        """Eine Messung (in ns) aufnehmen; ggf. fälligen Export anstoßen."""
+        if not self.enabled:
+            return
+        with self._lock:
+            series = self._series.get((op, name))
+            if series is None:
+                series = self._series[(op, name)] = Series(self.window)
+            series.observe(ns)
+            due = self._next_export is not None and time.monotonic() >= self._next_export
+            if due:
+                self._next_export = time.monotonic() + self.export_seconds
+        if due:
+            self.export()
+
+    def snapshot(self):
+        """Aktueller Stand aller Serien als Liste von dicts (Zeiten in ms)."""
+        with self._lock:
+            items = sorted(self._series.items())
+            rows = []
+            for (op, name), s in items:
+                p50, p95, p99 = s.quantiles()
+                rows.append({
+                    "op": op, "name": name, "count": s.count,
+                    "sum_ms": s.sum_ns / 1e6, "max_ms": s.max_ns / 1e6,
+                    "p50_ms": p50 / 1e6, "p95_ms": p95 / 1e6, "p99_ms": p99 / 1e6,
+                })
+            return rows
+
+    def prometheus_text(self, rows=None):
+        """Prometheus-Textformat (Typ summary, Sekunden)."""
+        rows = self.snapshot() if rows is None else rows
+        lines = [
+            f"# HELP {PROM_METRIC} Laufzeit der V21-Hot-Paths (Quantile über die letzten {self.window} Messungen).",
+            f"# TYPE {PROM_METRIC} summary",
+        ]
+        pid = os.getpid()
+        for row in rows:
+            labels = f'op="{_escape(row["op"])}",name="{_escape(row["name"])}",pid="{pid}"'
+            for q, key in zip(QUANTILES, ("p50_ms", "p95_ms", "p99_ms")):
+                lines.append(f'{PROM_METRIC}{{{labels},quantile="{q}"}} {row[key] / 1e3:.9f}')
+            lines.append(f"{PROM_METRIC}_sum{{{labels}}} {row['sum_ms'] / 1e3:.9f}")
+            lines.append(f"{PROM_METRIC}_count{{{labels}}} {row['count']}")
+        return "\n".join(lines) + "\n"
+
+    def export(self):
+        """Schreibt Prometheus-Datei (atomar) und hängt JSONL an. Fehler werden geschluckt."""
+        rows = self.snapshot()
+        if self.prom_path:
+            try:
+                prom_path = self.worker_prom_path()
+                tmp_path = f"{prom_path}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write(self.prometheus_text(rows))
+                os.replace(tmp_path, prom_path)
+            except OSError:
+                pass
+        if self.jsonl_path:
+            stamp = {"ts": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+                     "pid": os.getpid()}
+            try:
+                self._rotate_jsonl()
+                with open(self.jsonl_path, "a", encoding="utf-8") as f:
+                    for row in rows:
+                        f.write(json.dumps({**stamp, **row}, ensure_ascii=False) + "\n")
+            except OSError:
+                pass
+        self.exports += 1
+        return rows
+
+    def _rotate_jsonl(self):
+        """Ab jsonl_max_bytes: Datei nach <datei>.1 verschieben (ersetzt die vorige Generation)."""
+        if not self.jsonl_max_bytes:
+            return
+        try:
+            if os.stat(self.jsonl_path).st_size < self.jsonl_max_bytes:
+                return
+            os.replace(self.jsonl_path, f"{self.jsonl_path}.1")
+        except FileNotFoundError:
+            pass  # Noch nicht angelegt - oder ein anderer Worker hat eben rotiert
+
+    def reset(self):
+        with self._lock:
+            self._series.clear()
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+# Prozessweite Instanz
+METRICS = MetricsRegistry()
+
+def timer(op, name=""):
+    """Kurzform: with metrics.timer("render", "mod_header"): ..."""
+    return METRICS.timer(op, name)
+
+# ==============================================================================
+# 🛠 TERMINAL: Letzten Stand aus der JSONL-Datei zeigen (langsamste p95 zuerst)
+# ==============================================================================
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else "metrics_v21.jsonl"
+    latest = {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    row = json.loads(line)
+                except ValueError:
+                    continue
+                latest[(row["pid"], row["op"], row["name"])] = row
+    except OSError as e:
+        print(f"❌ {path}: {e.strerror}")
+        sys.exit(1)
+
+    print(f"   {'PID':>7} {'op':<12} {'name':<18} {'count':>7} {'p50':>9} {'p95':>9} {'p99':>9}  Stand")
+    for row in sorted(latest.values(), key=lambda r: r["p95_ms"], reverse=True):
+        print(f"   {row['pid']:>7} {row['op']:<12} {row['name']:<18} {row['count']:>7} "
+              f"{row['p50_ms']:7.2f}ms {row['p95_ms']:7.2f}ms {row['p99_ms']:7.2f}ms  {row['ts']}")
@@ -1,4 +1,10 @@
 import streamlit as st
+from fragment_cache import fragment
+
+@fragment()
+def tone_bar_html(kin, moon_day, t_id):
+    """13 Balken, aktiv bis zur Ton-ID (hängt nur vom Ton ab -> 13 Fragmente)."""
+    return "".join([f"<div class='tm-seg {'on' if i <= t_id else ''}'></div>" for i in range(1, 14)])
 
 def render(state):
     """
@@ -89,7 +95,7 @@ def render(state):
     # 2. RENDER BAR (Visuelle Frequenz)
     # -------------------------------------------------------------------------
     # Erzeugt 13 Balken, aktiviert basierend auf Ton-ID
-    segments_html = "".join([f"<div class='tm-seg {'on' if i <= t_id else ''}'></div>" for i in range(1, 14)])
+    segments_html = tone_bar_html(None, None, t_id)
 
     st.markdown(f"""
     <div class='tone-module-container'>
@@ -1,7 +1,9 @@
 import streamlit as st
-import json
 import os
 import datetime
+from engine_core import DB_PATH_MOON
+from engine_streamlit import GalacticCore
+from fragment_cache import fragment
 
 def get_name():
     return "🌕 13-Monde (Mystic)"
@@ -9,34 +11,61 @@ def get_name():
 # ==============================================================================
 # 1. DATENBANK LADEN
 # ==============================================================================
-@st.cache_data
 def load_moon_db():
-    target = 'db_13moon_v22_enriched_FINAL.json'
-    files = [f for f in os.listdir('.') if f == target]
-    if not files: return None
-    try:
-        with open(files[0], 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except: return None
+    """
+    Nutzt den zentralen, gecachten Loader der Engine.
+    Rückgabe: (db_moon, moon_index) mit Index (Tag, Monat) -> Eintrag.
+    """
+    if not os.path.exists(DB_PATH_MOON): return None, None
+    _, db_moon, moon_index = GalacticCore.load_databases()
+    return db_moon, moon_index
+
+# ==============================================================================
+# 1b. FORTSCHRITTS-LEISTE (Fragment: hängt nur vom Tag im Mond ab -> 28 Varianten)
+# ==============================================================================
+@fragment()
+def moon_strip_html(kin, moon_day, d_num):
+    """28 Balken (Vergangenheit / HEUTE / Zukunft) mit den 4 Wochen-Labels."""
+    # Erzeugt eine durchgehende Leiste mit feinen Unterbrechungen
+    bars = []
+    for i in range(1, 29):
+        col = "#222" # Zukunft
+        if i < d_num: col = "#444" # Vergangenheit
+        if i == d_num: col = "#00FFA3" # HEUTE (Neon)
+
+        # Woche Separator (Lücke)
+        margin = "margin-right:2px;" if i % 7 == 0 else "margin-right:0px;"
+
+        bars.append(f"<div style='flex:1; height:2px; background:{col}; {margin}'></div>")
+
+    return f"""
+    <div style='display:flex; width:100%; margin-top:4px; opacity:0.9;'>
+        {"".join(bars)}
+    </div>
+    <div style='display:flex; justify-content:space-between; width:100%; margin-top:2px;'>
+        <span class='lbl' style='font-size:0.45em; color:#444;'>INITIIEREN</span>
+        <span class='lbl' style='font-size:0.45em; color:#444;'>VERFEINERN</span>
+        <span class='lbl' style='font-size:0.45em; color:#444;'>TRANSFORMIEREN</span>
+        <span class='lbl' style='font-size:0.45em; color:#444;'>REIFEN</span>
+    </div>
+    """
 
 # ==============================================================================
 # 2. RENDER ENGINE
 # ==============================================================================
 def render(kin, data, db_tz, date_obj):
     
-    db_moon = load_moon_db()
+    db_moon, moon_index = load_moon_db()
     
     if not db_moon:
         st.error("⚠️ JSON Datenbank fehlt.")
         return
 
-    # Datum Formatierung für Suche (DD.MM)
-    search_str = date_obj.strftime("%d.%m")
-    
-    # Eintrag suchen
-    entry = next((item for item in db_moon if item.get('date_gregorian') == search_str), None)
+    # Eintrag über den (Tag, Monat)-Index holen
+    entry = moon_index.get((date_obj.day, date_obj.month))
 
     if not entry:
+        search_str = date_obj.strftime("%d.%m")
         st.warning(f"Keine Daten für {search_str}")
         return
 
@@ -201,26 +230,4 @@ def render(kin, data, db_tz, date_obj):
     """, unsafe_allow_html=True)
 
     # PROGRESS BAR (Ultra Thin Neon)
-    # Erzeugt eine durchgehende Leiste mit feinen Unterbrechungen
-    bars = []
-    for i in range(1, 29):
-        col = "#222" # Zukunft
-        if i < d_num: col = "#444" # Vergangenheit
-        if i == d_num: col = "#00FFA3" # HEUTE (Neon)
-        
-        # Woche Separator (Lücke)
-        margin = "margin-right:2px;" if i % 7 == 0 else "margin-right:0px;"
-        
-        bars.append(f"<div style='flex:1; height:2px; background:{col}; {margin}'></div>")
-    
-    st.markdown(f"""
-    <div style='display:flex; width:100%; margin-top:4px; opacity:0.9;'>
-        {"".join(bars)}
-    </div>
-    <div style='display:flex; justify-content:space-between; width:100%; margin-top:2px;'>
-        <span class='lbl' style='font-size:0.45em; color:#444;'>INITIIEREN</span>
-        <span class='lbl' style='font-size:0.45em; color:#444;'>VERFEINERN</span>
-        <span class='lbl' style='font-size:0.45em; color:#444;'>TRANSFORMIEREN</span>
-        <span class='lbl' style='font-size:0.45em; color:#444;'>REIFEN</span>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(moon_strip_html(None, None, d_num), unsafe_allow_html=True)
@@ -1,4 +1,5 @@
 import streamlit as st
+from math_engine import MathEngine
 
 def get_name():
     return "🧬 Basis Navigator (Pro)"
@@ -49,64 +50,13 @@ def render(kin, data, db):
         tone_val = data['identity']['tone']['id']
         seal_color = data['identity']['seal']['color']
         
-        # --- Harmonik (4-Tage Zyklus) ---
-        h_idx = ((kin - 1) // 4) + 1
-        h_pos = ((kin - 1) % 4) + 1
-        h_cols = ["Rot", "Weiß", "Blau", "Gelb"]
-        h_col = h_cols[(h_idx - 1) % 4]
-        
-        # --- Chromatik (5-Tage Zyklus) ---
-        # Chromatiken wechseln die Farbe basierend auf dem Start-Kin
-        c_pos = ((kin - 1) % 5) + 1
-        # Farbe der Chromatik bestimmt sich oft durch das leitende Siegel
-        # Vereinfacht: Rot-Weiß-Blau-Gelb Rotation
-        c_idx_abs = (kin - 1) // 5
-        c_col = ["Rot", "Weiß", "Blau", "Gelb"][c_idx_abs % 4]
-        
-        # --- Welle (13-Tage Zyklus) ---
-        w_pos = ((kin - 1) % 13) + 1
+        # --- Zyklen aus der Tabelle des Kerns (Harmonik, Chromatik, Welle, Zelle, Schloss, Season) ---
+        s = MathEngine.get_structure(kin)
+        s_id = s.seal_id
         w_name = data['time']['wavespell']
-        # Die Farbe der Welle ist die Farbe des Siegels auf Ton 1
-        w_start_kin = kin - (w_pos - 1)
-        # Kurzer Hack um Farbe von Ton 1 zu bekommen:
-        w_col = ["Rot", "Weiß", "Blau", "Gelb"][(w_start_kin - 1) % 4]
-
-        # --- Zeitzelle (4 Siegel pro Zelle) ---
-        # 1-4 (Eingang), 5-8 (Speicher), 9-12 (Prozess), 13-16 (Ausgang), 17-20 (Matrix)
-        s_id = data['identity']['seal']['id']
-        cell_idx = (s_id - 1) // 4
-        cells = [
-            ("Eingang", "Rot"), 
-            ("Speicher", "Weiß"), 
-            ("Prozess", "Blau"), 
-            ("Ausgang", "Gelb"), 
-            ("Matrix", "Grün")
-        ]
-        cell_dat = cells[cell_idx % 5]
-
-        # --- Schloss (52-Tage Zyklus) ---
-        cas_idx = (kin - 1) // 52
-        cas_pos = ((kin - 1) % 52) + 1
-        castles = [
-            ("Drehung (Rot)", "Rot"), 
-            ("Kreuzung (Weiß)", "Weiß"), 
-            ("Verbrennung (Blau)", "Blau"), 
-            ("Geben (Gelb)", "Gelb"), 
-            ("Verzauberung (Grün)", "Grün")
-        ]
-        cas_dat = castles[cas_idx % 5]
-
-        # --- Season (65-Tage Zyklus) ---
-        # 4 Seasons im Tzolkin (260 / 4 = 65)
-        sea_idx = (kin - 1) // 65
-        sea_pos = ((kin - 1) % 65) + 1
-        seasons = [
-            ("Lebenskraft (Ost)", "Rot"),
-            ("Liebe (Nord)", "Weiß"), # In manchen Logiken Nord=Weiß
-            ("Magie (West)", "Blau"),
-            ("Erleuchtung (Süd)", "Gelb")
-        ]
-        sea_dat = seasons[sea_idx % 4]
+        cell_dat = (s.time_cell_name, s.time_cell_color)
+        cas_dat = (s.castle_label, s.castle_color)
+        sea_dat = (s.season_label, s.season_color)
 
     except Exception as e:
         st.error(f"Berechnungsfehler: {e}")
@@ -138,18 +88,18 @@ def render(kin, data, db):
 
     # Reihe 2: Kleine Zyklen
     c5, c6, c7, c8 = st.columns(4)
-    with c5: mini_card("Harmonik", f"Index {h_idx}", f"{h_pos}/4 Takt", h_col)
-    with c6: mini_card("Chromatik", f"{c_col}e", f"{c_pos}/5 Tag", c_col)
-    with c7: mini_card("Welle", w_name, f"{w_pos}/13 Ton", w_col)
+    with c5: mini_card("Harmonik", f"Index {s.harmonic}", f"{s.harmonic_position}/4 Takt", s.harmonic_color)
+    with c6: mini_card("Chromatik", f"{s.chromatic_color}e", f"{s.chromatic_position}/5 Tag", s.chromatic_color)
+    with c7: mini_card("Welle", w_name, f"{s.wave_position}/13 Ton", s.wave_color)
     with c8: mini_card("Zeitzelle", cell_dat[0], f"{((s_id-1)%4)+1}/4", cell_dat[1])
 
     # Reihe 3: Große Zyklen
     c9, c10, c11, c12 = st.columns(4)
-    with c9: mini_card("Schloss", cas_dat[0].split(' ')[0], f"{cas_pos}/52 Tag", cas_dat[1])
-    with c10: mini_card("Season", sea_dat[0].split(' ')[0], f"{sea_pos}/65 Tag", sea_dat[1])
+    with c9: mini_card("Schloss", cas_dat[0], f"{s.castle_position}/52 Tag", cas_dat[1])
+    with c10: mini_card("Season", sea_dat[0], f"{s.season_position}/65 Tag", sea_dat[1])
     with c11: 
         # Galaktischer Spin (Hälfte)
-        spin = "Erster" if kin <= 130 else "Zweiter"
+        spin = "Erster" if s.spin == 1 else "Zweiter"
         st.markdown(f"<div class='mini-box Weiß'><div class='nav-label'>Spin</div><div class='nav-val'>{spin}</div><div class='nav-sub'>{kin}/260</div></div>", unsafe_allow_html=True)
     with c12:
         # Gap Indikator
@@ -1,4 +1,5 @@
 import streamlit as st
+from math_engine import MathEngine
 
 def render(state):
     """
@@ -16,58 +17,18 @@ def render(state):
         return
 
     # -------------------------------------------------------------------------
-    # 1. MATHEMATIK ENGINE (Lokal)
+    # 1. MATHEMATIK ENGINE (Vorberechnete Orakel-Tabelle)
     # -------------------------------------------------------------------------
-    def get_oracle_ids(k):
-        # Basis-Werte (0-basiert für Mathe)
-        # Kin 1 = Index 0
-        s_idx = (k - 1) % 20
-        t_idx = (k - 1) % 13
-        
-        # Helper: Finde KIN basierend auf Siegel-Index (0-19) und Ton-Index (0-12)
-        # Wir nutzen Brute-Force über 260 Kins, das ist rasend schnell.
-        def find_kin_by_st(target_s_idx, target_t_idx):
-            for x in range(1, 261):
-                if (x-1) % 20 == target_s_idx and (x-1) % 13 == target_t_idx:
-                    return x
-            return k # Fallback
-
-        # 1. ANALOG (Partner / Support): Summe Siegel immer 19 (bei 0-Index)
-        # Bsp: Drache(0) + Sonne(19) = 19
-        analog_s = (19 - s_idx) % 20
-        analog_k = find_kin_by_st(analog_s, t_idx)
-
-        # 2. ANTIPODE (Herausforderung): Differenz 10
-        anti_s = (s_idx + 10) % 20
-        anti_k = find_kin_by_st(anti_s, t_idx)
-
-        # 3. OCCULT (Verborgene Kraft): Magische Summe 261
-        occ_k = 261 - k
-        
-        # 4. GUIDE (Führung): Abhängig vom Ton
-        # Formel: Der Ton bleibt gleich. Das Siegel verschiebt sich.
-        shifts = {
-            1:0, 6:0, 11:0,         # Kraft des eigenen Siegels
-            2:12, 7:12, 12:12,      # +12 Siegel
-            3:4, 8:4, 13:4,         # +4 Siegel
-            4:16, 9:16,             # +16 Siegel (oder -4)
-            5:8, 10:8               # +8 Siegel
-        }
-        # Ton ist hier 1-basiert für das Dictionary
-        shift = shifts.get(t_idx + 1, 0)
-        guide_s = (s_idx + shift) % 20
-        guide_k = find_kin_by_st(guide_s, t_idx)
-
-        return {
-            "destiny": k,
-            "guide": guide_k,
-            "analog": analog_k,
-            "anti": anti_k,
-            "occult": occ_k
-        }
-
-    # Berechnung durchführen
-    ids = get_oracle_ids(kin_current)
+    # Ein einziger Index-Zugriff statt Brute-Force über 260 Kins.
+    # (Die alte lokale Formel lebt als MathEngine._oracle_formula_synaptic weiter.)
+    destiny, guide, analog, anti, occult = MathEngine.get_oracle_row(kin_current)
+    ids = {
+        "destiny": destiny,
+        "guide": guide,
+        "analog": analog,
+        "anti": anti,
+        "occult": occult
+    }
 
     # -------------------------------------------------------------------------
     # 2. HELPER: DATEN HOLEN
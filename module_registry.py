@@ -0,0 +1,274 @@
+# ==============================================================================
+# 🔁 MODULE REGISTRY (Hot-Reload nur bei Änderung)
+# ------------------------------------------------------------------------------
+# ZWECK:    Importiert jedes Plugin aus `modules/` genau einmal und lädt es nur neu,
+#           wenn sich die Datei WIRKLICH geändert hat (mtime/Größe -> Inhalts-Hash).
+#           Dev-Modus erzwingt den Reload bei jedem Aufruf (altes Verhalten).
+#           Der PluginCatalog findet die Plugins & ihre Metadaten ohne Import.
+# HINWEIS:  Kein Streamlit-Import. Die App hält EINE Instanz pro Prozess.
+# ==============================================================================
+
+import ast
+import hashlib
+import importlib
+import os
+import sys
+import threading
+import time
+import warnings
+from metrics import METRICS
+
+class ModuleRegistry:
+    """Cache für Plugin-Module mit änderungsbasiertem Reload und Statistik."""
+
+    def __init__(self, package="modules", dev_mode=False):
+        self.package = package
+        self.dev_mode = dev_mode
+        self._modules = {}   # name -> Modul
+        self._stamps = {}    # name -> (mtime_ns, size, sha1)
+        self._lock = threading.Lock()
+        self.stats = {}      # name -> {"imports", "reloads", "reload_ms", "checks"}
+
+    def _stat(self, name):
+        return self.stats.setdefault(name, {"imports": 0, "reloads": 0, "reload_ms": 0.0, "checks": 0})
+
+    @staticmethod
+    def _file_stamp(path, with_hash=True):
+        st = os.stat(path)
+        digest = None
+        if with_hash:
+            with open(path, "rb") as f:
+                digest = hashlib.sha1(f.read()).hexdigest()
+        return (st.st_mtime_ns, st.st_size, digest)
+
+    def get(self, name, force_reload=None):
+        """
+        Liefert das Modul `<package>.<name>`.
+        Erster Aufruf: Import. Danach: Reload nur bei geänderter Datei oder force/dev_mode.
+        """
+        force = self.dev_mode if force_reload is None else force_reload
+        module_path = f"{self.package}.{name}"
+
+        with self._lock:
+            stat = self._stat(name)
+            module = self._modules.get(name)
+
+            if module is None:
+                start = time.perf_counter_ns()
+                module = sys.modules.get(module_path) or importlib.import_module(module_path)
+                elapsed = time.perf_counter_ns() - start
+                stat["imports"] += 1
+                stat["reload_ms"] += elapsed / 1e6
+                METRICS.observe("import", name, elapsed)
+                self._modules[name] = module
+                self._stamps[name] = self._file_stamp(module.__file__)
+                return module
+
+            stat["checks"] += 1
+            if not force and not self._changed(name, module.__file__):
+                return module
+
+            start = time.perf_counter_ns()
+            module = importlib.reload(module)
+            elapsed = time.perf_counter_ns() - start
+            stat["reloads"] += 1
+            stat["reload_ms"] += elapsed / 1e6
+            METRICS.observe("reload", name, elapsed)
+            self._modules[name] = module
+            self._stamps[name] = self._file_stamp(module.__file__)
+            return module
+
+    def _changed(self, name, path):
+        """Günstiger Check (mtime/Größe); nur wenn der abweicht, wird der Inhalt gehasht."""
+        old_mtime, old_size, old_hash = self._stamps[name]
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False  # Datei (kurz) weg -> altes Modul weiterverwenden
+        if (st.st_mtime_ns, st.st_size) == (old_mtime, old_size):
+            return False
+        new_stamp = self._file_stamp(path)
+        if new_stamp[2] == old_hash:
+            # Nur "touch" ohne Inhaltsänderung: Stempel aktualisieren, kein Reload
+            self._stamps[name] = new_stamp
+            return False
+        return True
+
+    def summary(self):
+        """Statistik für den Debug-Modus: (name, imports, reloads, reload_ms)."""
+        with self._lock:
+            return [(name, s["imports"], s["reloads"], s["reload_ms"]) for name, s in sorted(self.stats.items())]
+
+# ==============================================================================
+# 📋 PLUGIN-KATALOG (Discovery & Metadaten ohne Import)
+# ------------------------------------------------------------------------------
+# Jedes Plugin deklariert auf Modulebene ein reines Literal:
+#     PLUGIN = {"order": 10, "name": "Header", "requires": ("metadata",), "cost": "light"}
+# Der Katalog liest es per ast (OHNE das Modul zu importieren) und merkt sich die
+# Metadaten pro Datei, bis sich deren (mtime, Größe) ändert - auch bei In-place-Edits.
+# Geprüft wird höchstens alle MANIFEST_TTL_SECONDS (dazwischen kein Dateisystem-Zugriff):
+# ein os.stat aufs Verzeichnis entscheidet, ob neu gelistet werden muss (Datei dazu/weg),
+# sonst reicht ein os.stat pro bekannter Plugin-Datei.
+# Ungültige Felder (z.B. "order": "10") -> Default + Warnung statt Absturz.
+# ==============================================================================
+
+PULSE_SECTIONS = ("metadata", "tzolkin", "moon")
+COST_CLASSES = ("light", "medium", "heavy")
+# Wie lange das Manifest ohne jede Prüfung gilt (ein Rerun fragt es mehrfach ab)
+MANIFEST_TTL_SECONDS = 2.0
+
+class PluginCatalog:
+    """Gecachtes Manifest aller `mod_*.py` eines Plugin-Verzeichnisses."""
+
+    def __init__(self, directory="modules", ttl=MANIFEST_TTL_SECONDS):
+        self.directory = directory
+        self.ttl = ttl
+        self._dir_mtime = None
+        self._stamps = None   # ((name, mtime_ns, size), ...) des letzten Manifests
+        self._files = {}      # name -> (pfad, (mtime_ns, size))
+        self._meta = {}       # name -> ((mtime_ns, size), Metadaten)
+        self._manifest = ()
+        self._by_id = {}      # id -> Metadaten (für get/required_sections)
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+        self.scans = 0
+
+    @staticmethod
+    def _default_meta(name):
+        return {
+            "order": 100,
+            "name": name[4:].replace("_", " ").title(),
+            "requires": PULSE_SECTIONS,
+            "cost": "medium",
+        }
+
+    @staticmethod
+    def read_metadata(path, name):
+        """Liest das PLUGIN-Literal aus dem Quelltext. Fehlt/kaputt -> Defaults + Fehlertext."""
+        meta = PluginCatalog._default_meta(name)
+        error = None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                tree = ast.parse(f.read(), filename=path)
+            for node in tree.body:
+                if (isinstance(node, ast.Assign) and len(node.targets) == 1
+                        and isinstance(node.targets[0], ast.Name) and node.targets[0].id == "PLUGIN"):
+                    declared = ast.literal_eval(node.value)
+                    if not isinstance(declared, dict):
+                        raise ValueError("PLUGIN muss ein dict sein")
+                    meta.update(declared)
+                    break
+        except (OSError, SyntaxError, ValueError) as e:
+            error = str(e)
+
+        invalid = PluginCatalog._validate(meta, name)
+        if invalid:
+            problem = f"ungültige PLUGIN-Felder ({', '.join(invalid)}) -> Defaults"
+            error = f"{error}; {problem}" if error else problem
+        if error:
+            warnings.warn(f"Plugin {name}: {error}", stacklevel=2)
+        meta["id"] = name
+        meta["error"] = error
+        return meta
+
+    @staticmethod
+    def _validate(meta, name):
+        """Setzt Felder mit falschem Typ/Wert auf den Default zurück. Rückgabe: betroffene Felder."""
+        defaults = PluginCatalog._default_meta(name)
+        invalid = []
+        if not isinstance(meta["order"], (int, float)) or isinstance(meta["order"], bool):
+            invalid.append("order")
+            meta["order"] = defaults["order"]
+        if not isinstance(meta["name"], str):
+            invalid.append("name")
+            meta["name"] = defaults["name"]
+        if not isinstance(meta["requires"], (tuple, list)):
+            invalid.append("requires")
+            meta["requires"] = defaults["requires"]
+        meta["requires"] = tuple(s for s in meta["requires"] if s in PULSE_SECTIONS)
+        if meta["cost"] not in COST_CLASSES:
+            invalid.append("cost")
+            meta["cost"] = defaults["cost"]
+        return invalid
+
+    def _plugin_files(self):
+        """{name: (pfad, (mtime_ns, size))} aller mod_*.py - ein scandir, kein Öffnen."""
+        files = {}
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.startswith("mod_") and entry.name.endswith(".py"):
+                    st = entry.stat()
+                    files[entry.name[:-3]] = (entry.path, (st.st_mtime_ns, st.st_size))
+        return files
+
+    def _scan(self, files):
+        """Manifest neu zusammensetzen; gelesen werden nur neue oder geänderte Dateien."""
+        metas = {}
+        for name, (path, stamp) in files.items():
+            cached = self._meta.get(name)
+            metas[name] = cached if cached is not None and cached[0] == stamp else (stamp, self.read_metadata(path, name))
+        self._meta = metas
+        entries = sorted((meta for _, meta in metas.values()), key=lambda m: (m["order"], m["id"]))
+        self.scans += 1
+        return tuple(entries)
+
+    def _current_files(self):
+        """
+        Dateien & Stempel: neu listen nur, wenn sich die mtime des Verzeichnisses geändert hat
+        (Datei dazu/weg/umbenannt) - sonst ein os.stat pro bekannter Datei (In-place-Edits).
+        """
+        dir_mtime = os.stat(self.directory).st_mtime_ns
+        if dir_mtime == self._dir_mtime:
+            try:
+                return {name: (path, (st.st_mtime_ns, st.st_size))
+                        for name, (path, _) in self._files.items() for st in (os.stat(path),)}
+            except OSError:
+                pass  # Datei zwischendurch weg -> doch neu listen
+        files = self._plugin_files()
+        self._dir_mtime = dir_mtime
+        return files
+
+    def _refresh(self):
+        """Höchstens alle `ttl` Sekunden: Stempel prüfen, geänderte Plugins neu lesen."""
+        now = time.monotonic()
+        if now < self._next_check:
+            return
+        with self._lock:
+            if now < self._next_check:
+                return
+            try:
+                files = self._current_files()
+            except OSError:
+                files = {}
+                self._dir_mtime = None
+            stamps = tuple(sorted((name, *stamp) for name, (_, stamp) in files.items()))
+            if stamps != self._stamps:
+                self._manifest = self._scan(files)
+                self._by_id = {meta["id"]: meta for meta in self._manifest}
+                self._stamps = stamps
+            self._files = files
+            self._next_check = time.monotonic() + self.ttl
+
+    def manifest(self):
+        """Alle Plugins sortiert nach `order`. Fehlt das Verzeichnis -> leeres Manifest."""
+        self._refresh()
+        return self._manifest
+
+    def names(self, max_cost="heavy"):
+        """Plugin-IDs bis einschließlich Kostenklasse `max_cost` (z.B. unter Last: "medium")."""
+        limit = COST_CLASSES.index(max_cost)
+        return [m["id"] for m in self.manifest() if COST_CLASSES.index(m["cost"]) <= limit]
+
+    def get(self, name):
+        self._refresh()
+        return self._by_id.get(name)
+
+    def required_sections(self, names):
+        """Vereinigung der Pulse-Sektionen, die die gegebenen Plugins brauchen."""
+        self._refresh()
+        by_id = self._by_id
+        needed = set()
+        for name in names:
+            meta = by_id.get(name)
+            needed.update(meta["requires"] if meta else PULSE_SECTIONS)
+        return tuple(s for s in PULSE_SECTIONS if s in needed)
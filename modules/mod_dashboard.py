@@ -1,116 +1,88 @@
+import textwrap
 import streamlit as st
+from stylesheet import css_vars
+from fragment_cache import fragment
+
+# Plugin-Manifest (wird vom Host per ast gelesen, ohne Import)
+PLUGIN = {"order": 20, "name": "Dashboard", "requires": ("metadata", "tzolkin"), "cost": "medium"}
 
 # ------------------------------------------------------------------------------
 # 1. VISUAL FX ENGINE (CSS Magie)
 # ------------------------------------------------------------------------------
-def inject_fx_css(seal_color, tone_id):
+# Farben-Mapping (mit Transparenz für Glow)
+GLOW_COLORS = {
+    "Rot": "rgba(255, 62, 62, 0.7)",
+    "Weiß": "rgba(224, 224, 224, 0.7)",
+    "Blau": "rgba(42, 140, 255, 0.7)",
+    "Gelb": "rgba(255, 215, 0, 0.7)",
+    "Grün": "rgba(0, 255, 102, 0.7)"
+}
+
+def tone_animation(tone_id):
+    """Animations-Klasse für den Ton (Keyframes: styles/mod_dashboard.css)."""
+    if tone_id in [1, 5, 9, 13]: # PULSIEREN (Tore)
+        return "tone-pulse"
+    if tone_id in [2, 6, 10]: # WIPPEN (Polarität)
+        return "tone-wobble"
+    if tone_id in [3, 7, 11]: # VIBRIEREN (Fluss)
+        return "tone-vibrate"
+    return "" # LEUCHTEN (Struktur) = Basis-Animation von .tone-obj
+
+def inject_fx_css(seal_color):
     """
-    Erzeugt das Design: Leuchtende Buttons & tanzende Töne.
+    Leuchtende Buttons: nur die Glow-Farbe als CSS-Variable,
+    das eigentliche Design liegt im statischen Stylesheet.
     """
-    # Farben-Mapping (mit Transparenz für Glow)
-    colors = {
-        "Rot": "rgba(255, 62, 62, 0.7)",
-        "Weiß": "rgba(224, 224, 224, 0.7)",
-        "Blau": "rgba(42, 140, 255, 0.7)",
-        "Gelb": "rgba(255, 215, 0, 0.7)",
-        "Grün": "rgba(0, 255, 102, 0.7)"
-    }
-    glow_color = colors.get(seal_color, colors["Weiß"])
-    
-    # Animations-Logik für die Töne
-    animation_css = ""
-    if tone_id in [1, 5, 9, 13]: # PULSIEREN (Tore)
-        animation_css = "@keyframes tone-anim { 0% {transform:scale(1);} 50% {transform:scale(1.05); text-shadow:0 0 10px white;} 100% {transform:scale(1);} }"
-    elif tone_id in [2, 6, 10]: # WIPPEN (Polarität)
-        animation_css = "@keyframes tone-anim { 0% {transform:translateX(0);} 25% {transform:rotate(-2deg);} 75% {transform:rotate(2deg);} 100% {transform:translateX(0);} }"
-    elif tone_id in [3, 7, 11]: # VIBRIEREN (Fluss)
-        animation_css = "@keyframes tone-anim { 0% {transform:translateY(0);} 50% {transform:translateY(-2px); opacity:0.8;} 100% {transform:translateY(0);} }"
-    else: # LEUCHTEN (Struktur)
-        animation_css = "@keyframes tone-anim { 0% {border-color:rgba(255,255,255,0.2);} 50% {border-color:rgba(255,255,255,0.8); box-shadow:inset 0 0 15px rgba(255,255,255,0.3);} 100% {border-color:rgba(255,255,255,0.2);} }"
-
-    st.markdown(f"""
-        <style>
-        /* 1. DER EXPANDER-BUTTON (Das leuchtende Siegel) */
-        div[data-testid="stExpander"] details summary {{
-            background: linear-gradient(90deg, #111 0%, {glow_color} 150%);
-            border: 1px solid rgba(255,255,255,0.15);
-            border-radius: 8px;
-            color: white !important;
-            font-family: 'Orbitron', sans-serif;
-            font-weight: bold;
-            letter-spacing: 1px;
-            transition: all 0.4s ease;
-            margin-bottom: 5px;
-        }}
-        div[data-testid="stExpander"] details summary:hover {{
-            border-color: {glow_color};
-            box-shadow: 0 0 20px {glow_color};
-            padding-left: 25px; /* Interaktiver Ruck */
-        }}
-        
-        /* 2. DER ANIMIERTE TON */
-        {animation_css}
-        .tone-obj {{
-            display: inline-block;
-            animation: tone-anim 3s infinite ease-in-out;
-            padding: 2px 8px;
-            border-radius: 4px;
-            border: 1px solid rgba(255,255,255,0.1);
-        }}
-
-        /* 3. INHALT DESIGN (Markdown Styling im Expander) */
-        .psy-header {{ color: {glow_color}; font-family: 'Rajdhani'; font-weight: bold; font-size: 1.1rem; margin-top: 10px; margin-bottom: 5px; text-transform: uppercase; border-bottom: 1px solid rgba(255,255,255,0.1); }}
-        .psy-core {{ font-weight: bold; color: #fff; margin-bottom: 8px; font-size: 1.05rem; }}
-        .psy-list {{ font-size: 0.95rem; color: #ccc; margin-left: 10px; }}
-        .psy-box {{ background: rgba(255,255,255,0.05); border-left: 3px solid {glow_color}; padding: 10px; border-radius: 0 8px 8px 0; margin: 10px 0; }}
-        </style>
-    """, unsafe_allow_html=True)
+    glow_color = GLOW_COLORS.get(seal_color, GLOW_COLORS["Weiß"])
+    st.markdown(css_vars(seal_glow=glow_color), unsafe_allow_html=True)
 
 # ------------------------------------------------------------------------------
 # 2. CONTENT ENGINE (Die volle psychologische Auswertung)
 # ------------------------------------------------------------------------------
-def render_full_psychology(data):
+@fragment()
+def psychology_html(kin, moon_day, part, data=None):
     """
-    Rendert ALLES, was in der Datenbank steht. Keine Zusammenfassungen.
+    Die volle Psychologie (Siegel oder Ton) als EIN HTML-String für ein einziges st.markdown.
+    Reine Funktion von Kin & Teil -> Fragment-Cache. Keine Daten -> leerer String.
     """
     if not data:
-        st.caption("Daten-Link unterbrochen...")
-        return
+        return ""
+    blocks = []
 
     # --- A. LICHT (POTENZIAL) ---
     light = data.get('light_potential', {})
-    st.markdown('<div class="psy-header">✨ LICHT & POTENZIAL</div>', unsafe_allow_html=True)
-    st.markdown(f'<div class="psy-core">{light.get("core_trait", "---")}</div>', unsafe_allow_html=True)
+    blocks.append('<div class="psy-header">✨ LICHT & POTENZIAL</div>')
+    blocks.append(f'<div class="psy-core">{light.get("core_trait", "---")}</div>')
     
     # Attribute im Detail
     for attr in light.get('attributes', []):
-        st.markdown(f"""
+        blocks.append(f"""
         <div style="margin-bottom:6px;">
             <strong style="color:#eee;">◈ {attr['name']}:</strong> 
             <span style="color:#aaa;">{attr['desc']}</span>
         </div>
-        """, unsafe_allow_html=True)
+        """)
 
-    st.markdown("<br>", unsafe_allow_html=True)
+    blocks.append("<br>")
 
     # --- B. SCHATTEN (HERAUSFORDERUNG) ---
     shadow = data.get('shadow_integration', {})
-    st.markdown('<div class="psy-header">🌑 SCHATTEN & ARBEIT</div>', unsafe_allow_html=True)
-    st.markdown(f'<div class="psy-core">{shadow.get("core_fear", "---")}</div>', unsafe_allow_html=True)
+    blocks.append('<div class="psy-header">🌑 SCHATTEN & ARBEIT</div>')
+    blocks.append(f'<div class="psy-core">{shadow.get("core_fear", "---")}</div>')
     
     # Schatten-Muster
     for pattern in shadow.get('patterns', []):
-        st.markdown(f"""
+        blocks.append(f"""
         <div style="margin-bottom:6px;">
             <strong style="color:#ffcccc;">⚠ {pattern['name']}:</strong> 
             <span style="color:#aaa;">{pattern['desc']}</span>
         </div>
-        """, unsafe_allow_html=True)
+        """)
         
     # Die Neurose (Der tiefe psychologische Mechanismus)
     neurosis = shadow.get('neurosis', {})
     if neurosis:
-        st.markdown(f"""
+        blocks.append(f"""
         <div class="psy-box" style="border-color: #ff4b4b;">
             <strong style="color:#ff4b4b;">Zentrale Neurose: {neurosis.get('name', '')}</strong><br>
             <em style="font-size:0.9rem;">"{neurosis.get('mechanism', '')}"</em>
@@ -118,28 +90,42 @@ def render_full_psychology(data):
                 {''.join([f'<li>{s}</li>' for s in neurosis.get('symptoms', [])])}
             </ul>
         </div>
-        """, unsafe_allow_html=True)
+        """)
 
-    st.markdown("<br>", unsafe_allow_html=True)
+    blocks.append("<br>")
 
     # --- C. HEILUNGSWEG (TRANSFORMATION) ---
     healing = data.get('healing_path', {})
-    st.markdown('<div class="psy-header">🌿 WEG DER HEILUNG</div>', unsafe_allow_html=True)
-    st.markdown(f'<div class="psy-core">{healing.get("strategy", "---")}</div>', unsafe_allow_html=True)
+    blocks.append('<div class="psy-header">🌿 WEG DER HEILUNG</div>')
+    blocks.append(f'<div class="psy-core">{healing.get("strategy", "---")}</div>')
     
     # Praktische Übungen
     if 'practices' in healing:
         for practice in healing['practices']:
-            st.markdown(f"<div style='color:#aaddaa; margin-bottom:4px;'>✓ {practice}</div>", unsafe_allow_html=True)
+            blocks.append(f"<div style='color:#aaddaa; margin-bottom:4px;'>✓ {practice}</div>")
             
     # Die Affirmation (Der Kraftsatz)
     affirmation = healing.get('affirmation')
     if affirmation:
-        st.markdown(f"""
+        blocks.append(f"""
         <div style="margin-top:15px; text-align:center; font-style:italic; font-family:'Georgia'; color:#fff; padding:10px; border:1px dashed #555; border-radius:8px;">
             "{affirmation}"
         </div>
-        """, unsafe_allow_html=True)
+        """)
+
+    # Blöcke ohne Einrückung und ohne Leerzeilen aneinander -> ein einziger HTML-Block
+    # (eingerückte Zeilen nach einer Leerzeile wären für Markdown ein Code-Block)
+    lines = (line for block in blocks for line in textwrap.dedent(block).splitlines())
+    return "\n".join(line for line in lines if line.strip())
+
+def render_full_psychology(html):
+    """
+    Rendert ALLES, was in der Datenbank steht. Keine Zusammenfassungen.
+    """
+    if not html:
+        st.caption("Daten-Link unterbrochen...")
+        return
+    st.markdown(html, unsafe_allow_html=True)
 
 # ------------------------------------------------------------------------------
 # 3. MAIN RENDERER
@@ -158,7 +144,7 @@ def render(pulse):
     tone = tzolkin['identity']['tone']
     
     # 2. Styles injizieren
-    inject_fx_css(seal['color'], tone['id'])
+    inject_fx_css(seal['color'])
 
     # 3. Layout Grid
     c1, c2 = st.columns(2)
@@ -174,7 +160,7 @@ def render(pulse):
             st.caption(f"Code {seal['id']} • {seal.get('family', '')} • {seal.get('chakra', '')}")
             st.divider()
             # VOLLE PSYCHOLOGIE
-            render_full_psychology(seal.get('psychology'))
+            render_full_psychology(psychology_html(pulse.kin, None, "seal", data=seal.get('psychology')))
 
     # --- SPALTE 2: DER TON ---
     with c2:
@@ -186,7 +172,7 @@ def render(pulse):
             # Header Info (Animiert)
             st.markdown(f"""
                 <div style="text-align: center; margin-bottom: 15px;">
-                    <div class="tone-obj" style="font-size: 2rem; font-weight: 800; color: #fff;">
+                    <div class="tone-obj {tone_animation(tone['id'])}" style="font-size: 2rem; font-weight: 800; color: #fff;">
                         {tone['id']}
                     </div>
                     <div style="color: #aaa; font-size: 0.8rem; margin-top: 5px;">
@@ -196,4 +182,4 @@ def render(pulse):
             """, unsafe_allow_html=True)
             st.divider()
             # VOLLE PSYCHOLOGIE
-            render_full_psychology(tone.get('psychology'))
+            render_full_psychology(psychology_html(pulse.kin, None, "tone", data=tone.get('psychology')))
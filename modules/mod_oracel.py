@@ -1,154 +1,57 @@
 import streamlit as st
-import math
+from functools import lru_cache
+from math_engine import MathEngine
+from fragment_cache import fragment
+
+# Plugin-Manifest (wird vom Host per ast gelesen, ohne Import)
+PLUGIN = {"order": 30, "name": "Orakel", "requires": ("metadata", "tzolkin"), "cost": "heavy"}
 
 # ==============================================================================
 # 1. VISUAL FX ENGINE (CSS & Animationen)
 # ==============================================================================
-def inject_oracle_css():
-    st.markdown("""
-        <style>
-        /* --- ORACLE GRID LAYOUT --- */
-        /* Kompakte Expander-Buttons */
-        div[data-testid="stExpander"] {
-            border: 0px solid transparent;
-            background: transparent;
-            margin-bottom: 5px !important;
-        }
-        
-        /* Das Styling des "Knopfes" (Expander Summary) */
-        div[data-testid="stExpander"] details summary {
-            background: rgba(20, 20, 25, 0.8);
-            border: 1px solid rgba(255,255,255,0.1);
-            border-radius: 6px;
-            padding: 5px 10px !important;
-            font-family: 'Rajdhani', sans-serif;
-            font-size: 0.9rem;
-            color: #ddd !important;
-            transition: all 0.3s cubic-bezier(0.25, 0.8, 0.25, 1);
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-            min-height: 40px; /* Schön kompakt */
-        }
-
-        /* Hover-Effekte basierend auf Farben (werden per Inline-Style überschrieben, hier Basis) */
-        div[data-testid="stExpander"] details summary:hover {
-            transform: scale(1.02);
-            z-index: 10;
-        }
-
-        /* --- TON PHYSIK ANIMATIONEN --- */
-        @keyframes pulse-dot { 0% {transform:scale(1); opacity:0.7;} 50% {transform:scale(1.2); opacity:1; box-shadow: 0 0 8px currentColor;} 100% {transform:scale(1); opacity:0.7;} }
-        @keyframes wobble-bar { 0% {transform:rotate(0deg);} 25% {transform:rotate(-3deg);} 75% {transform:rotate(3deg);} 100% {transform:rotate(0deg);} }
-        @keyframes vibrate-wave { 0% {transform:translateY(0);} 50% {transform:translateY(-2px);} 100% {transform:translateY(0);} }
-        
-        .anim-pulse { animation: pulse-dot 2s infinite ease-in-out; }
-        .anim-wobble { animation: wobble-bar 3s infinite ease-in-out; }
-        .anim-vibrate { animation: vibrate-wave 0.5s infinite linear; }
-        .anim-static { border-bottom: 1px solid currentColor; }
-
-        /* --- DEEP DATA TABLE (Im Popup) --- */
-        .deep-row {
-            display: flex;
-            justify-content: space-between;
-            border-bottom: 1px solid rgba(255,255,255,0.05);
-            padding: 4px 0;
-            font-size: 0.85rem;
-        }
-        .deep-label { color: #888; font-weight: bold; }
-        .deep-val { color: #eee; text-align: right; }
-        .oracle-role-label {
-            text-align: center;
-            font-size: 0.7rem;
-            text-transform: uppercase;
-            letter-spacing: 2px;
-            color: #555;
-            margin-bottom: 2px;
-            margin-top: 5px;
-        }
-        </style>
-    """, unsafe_allow_html=True)
+# Statisch in styles/mod_oracel.css -> vom Host einmal als Stylesheet eingebunden.
 
 # ==============================================================================
 # 2. CALCULATION HELPER (Damit das Popup immer voll ist)
 # ==============================================================================
+# Chakra je Erdfamilie (Familie selbst: MathEngine.KIN_STRUCTURE)
+FAMILY_CHAKRAS = {"Kardinal": "Kehlkopf", "Zentral": "Herz", "Signal": "Solarplexus", "Portal": "Wurzel", "Polar": "Kronen"}
+
+@lru_cache(maxsize=260)
 def derive_kin_details(kin_num):
     """
-    Berechnet fehlende Details live anhand der Kin-Nummer,
-    falls die Datenbank nur Basis-Daten liefert.
+    Details zur Kin-Nummer aus der Zyklus-Tabelle des Kerns
+    (einmal pro Kin gebaut, falls die Datenbank nur Basis-Daten liefert).
     """
-    # Basis-Mathematik (0-basiert)
-    kin_idx = kin_num - 1
-    seal_id = (kin_idx % 20) + 1
-    tone_id = (kin_idx % 13) + 1
-    
-    # 1. Farbe
-    # 1,6,11,16=Rot | 2,7,12,17=Weiß | 3,8,13,18=Blau | 4,9,14,19=Gelb
-    colors = ["Gelb", "Rot", "Weiß", "Blau"] # Modulo 4 Trick: 1%4=1(Rot)...
-    color = colors[seal_id % 4]
-    
-    # 2. Familie (Erd-Familien)
-    families = ["Polar", "Kardinal", "Zentral", "Signal", "Tor"]
-    # Formel Mapping ist komplexer, hier vereinfachte Logik für Display
-    # Rot=1, Weiß=2, Blau=3, Gelb=4. 
-    # Wir nutzen eine Lookup-Map für Siegel 1-20
-    seal_map = {
-        1:"Drache", 2:"Wind", 3:"Nacht", 4:"Samen", 5:"Schlange",
-        6:"Weltenüberbrücker", 7:"Hand", 8:"Stern", 9:"Mond", 10:"Hund",
-        11:"Affe", 12:"Mensch", 13:"Himmelswanderer", 14:"Magier", 15:"Adler",
-        16:"Krieger", 17:"Erde", 18:"Spiegel", 19:"Sturm", 20:"Sonne"
-    }
-    seal_name = seal_map.get(seal_id, "Unbekannt")
-    
-    # Familie Mapping (Bar, Polar...)
-    fam_idx = (seal_id - 1) % 5 
-    family = families[fam_idx]
-    
-    # Chakra Mapping
-    chakras = ["Kronen", "Wurzel", "Sakral", "Solarplexus", "Herz", "Kehlkopf", "Dritte Auge"]
-    # Vereinfachtes Mapping (Da echte Logik komplex) -> Wir nehmen 5er Zyklus
-    chakra_map = ["Kronen", "Wurzel", "Herz", "Solarplexus", "Kehlkopf"]
-    chakra = chakra_map[(seal_id-1)%5]
-    
-    # Harmonik (Zolkin hat 65 Harmoniken à 4 Kins)
-    harmonic = (kin_idx // 4) + 1
-    
-    # Welle (13er Zyklus)
-    wave_start = (kin_idx // 13) * 13 + 1
-    
-    # Planet (Beispielhaft)
-    planets = ["Pluto", "Neptun", "Uranus", "Saturn", "Jupiter", "Maldek", "Mars", "Erde", "Venus", "Merkur"]
-    planet = planets[(seal_id - 1) % 10]
-
+    s = MathEngine.get_structure(kin_num)
+    if not s: return None
     return {
         "kin": kin_num,
-        "seal_id": seal_id,
-        "seal_name": seal_name,
-        "tone_id": tone_id,
-        "color": color,
-        "family": family,
-        "chakra": chakra,
-        "planet": planet,
-        "harmonic": harmonic,
-        "wave": f"Welle {wave_start}",
-        "clan": "Feuer" if harmonic <= 13 else "Blut" # (Vereinfacht)
+        "seal_id": s.seal_id,
+        "seal_name": MathEngine.SEAL_NAMES[s.seal_id - 1],
+        "tone_id": s.tone_id,
+        "color": s.color,
+        "family": s.family,
+        "chakra": FAMILY_CHAKRAS[s.family],
+        "harmonic": s.harmonic,
+        "wave": f"Welle {s.wave_start}",
+        "clan": s.clan
     }
 
 # ==============================================================================
 # 3. RENDER ATOM (Ein einzelner Orakel-Button)
 # ==============================================================================
-def render_oracle_card(role, kin_data, is_destiny=False):
+@fragment()
+def oracle_card_html(kin_num, moon_day, role, kin_data=None):
     """
-    Zeichnet den kleinen Flux-Button mit dem riesigen Pop-up.
+    HTML des Orakel-Buttons (reine Funktion von Kin & Rolle -> Fragment-Cache):
+    (Rollen-Label, Expander-Titel, Popup-Kopf, Tabellenzeilen).
+    Ohne Details (Kin 0 / fehlt) nur der Platzhalter, Titel = None.
     """
-    if not kin_data:
-        st.markdown(f"<div class='oracle-role-label'>{role}</div><div style='text-align:center; opacity:0.3'>---</div>", unsafe_allow_html=True)
-        return
-
-    # Daten Validierung (Fallback auf Berechnung wenn DB leer)
-    kin_num = kin_data.get('kin', 0)
     details = derive_kin_details(kin_num)
-    
+    if not details:
+        return (f"<div class='oracle-role-label'>{role}</div><div style='text-align:center; opacity:0.3'>---</div>", None, None, ())
+
     # Wenn DB Namen hat, nutze sie, sonst berechnete
     name_display = kin_data.get('seal', {}).get('name', details['seal_name'])
     tone_display = kin_data.get('tone', {}).get('name', f"Ton {details['tone_id']}")
@@ -156,13 +59,13 @@ def render_oracle_card(role, kin_data, is_destiny=False):
 
     # CSS Farben
     color_map = {
-        "Rot": "255, 62, 62", 
-        "Weiß": "220, 220, 220", 
-        "Blau": "42, 140, 255", 
+        "Rot": "255, 62, 62",
+        "Weiß": "220, 220, 220",
+        "Blau": "42, 140, 255",
         "Gelb": "255, 215, 0"
     }
     rgb = color_map.get(color_display, "200,200,200")
-    
+
     # Animation Class bestimmen
     tid = details['tone_id']
     anim_class = "anim-static"
@@ -170,23 +73,13 @@ def render_oracle_card(role, kin_data, is_destiny=False):
     elif tid in [2,6,10]: anim_class = "anim-wobble"
     elif tid in [3,7,11]: anim_class = "anim-vibrate"
 
-    # Style für den Button (Border Glow)
-    border_style = f"border-left: 3px solid rgba({rgb}, 1);" if not is_destiny else f"border: 1px solid rgba({rgb}, 0.8); box-shadow: 0 0 10px rgba({rgb}, 0.2);"
-
-    # --- HTML INJECTION FÜR DEN BUTTON STYLE ---
-    # Wir nutzen einen Trick: Inline Style im Container um das Summary zu färben
-    st.markdown(f"""
-    <style>
-    /* Spezifischer Hack für diesen Aufruf */
-    </style>
+    # --- ROLLEN-LABEL ÜBER DEM BUTTON ---
+    role_html = f"""
     <div class='oracle-role-label' style='color:rgba({rgb},0.8);'>{role}</div>
-    """, unsafe_allow_html=True)
-    
-    # Der Expander IST der Button
-    label_html = f"**KIN {kin_num}** | {name_display}"
-    with st.expander(f"KIN {kin_num} • {name_display}"):
-        # --- DAS MINUTIÖSE POPUP (Inhalt) ---
-        st.markdown(f"""
+    """
+
+    # --- DAS MINUTIÖSE POPUP (Inhalt) ---
+    popup_html = f"""
         <div style="text-align:center; margin-bottom:10px;">
             <div style="font-size:1.5rem; font-weight:bold; color:rgba({rgb},1); text-shadow:0 0 15px rgba({rgb},0.4);">
                 {name_display}
@@ -198,30 +91,48 @@ def render_oracle_card(role, kin_data, is_destiny=False):
                 ● Ton {details['tone_id']}
             </div>
         </div>
-        """, unsafe_allow_html=True)
-        
-        # Die Daten-Tabelle
-        rows = [
-            ("Galaktische Signatur", f"Kin {kin_num}"),
-            ("Solares Siegel", f"{details['seal_name']} (Code {details['seal_id']})"),
-            ("Galaktischer Ton", f"{tone_display} ({details['tone_id']})"),
-            ("Farbe / Energie", color_display),
-            ("Welle (Purpose)", details['wave']),
-            ("Erd-Familie", details['family']),
-            ("Chakra", details['chakra']),
-            ("Planet", details['planet']),
-            ("Harmonik", f"H-{details['harmonic']}"),
-            ("Clan", f"{details['clan']}-Clan"),
-        ]
-        
-        for label, val in rows:
-            st.markdown(f"""
+        """
+
+    # Die Daten-Tabelle
+    rows = [
+        ("Galaktische Signatur", f"Kin {kin_num}"),
+        ("Solares Siegel", f"{details['seal_name']} (Code {details['seal_id']})"),
+        ("Galaktischer Ton", f"{tone_display} ({details['tone_id']})"),
+        ("Farbe / Energie", color_display),
+        ("Welle (Purpose)", details['wave']),
+        ("Erd-Familie", details['family']),
+        ("Chakra", details['chakra']),
+        ("Planet", kin_data.get('seal', {}).get('planet', '---')),
+        ("Harmonik", f"H-{details['harmonic']}"),
+        ("Clan", f"{details['clan']}-Clan"),
+    ]
+    row_html = tuple(f"""
             <div class='deep-row'>
                 <span class='deep-label'>{label}</span>
                 <span class='deep-val'>{val}</span>
             </div>
-            """, unsafe_allow_html=True)
-            
+            """ for label, val in rows)
+
+    return (role_html, f"KIN {kin_num} • {name_display}", popup_html, row_html)
+
+def render_oracle_card(role, kin_data, is_destiny=False):
+    """
+    Zeichnet den kleinen Flux-Button mit dem riesigen Pop-up.
+    """
+    # Daten Validierung (Fallback auf Berechnung wenn DB leer)
+    kin_num = kin_data.get('kin', 0) if kin_data else 0
+    role_html, title, popup_html, row_html = oracle_card_html(kin_num, None, role, kin_data=kin_data)
+
+    st.markdown(role_html, unsafe_allow_html=True)
+    if title is None:
+        return
+
+    # Der Expander IST der Button
+    with st.expander(title):
+        st.markdown(popup_html, unsafe_allow_html=True)
+        for row in row_html:
+            st.markdown(row, unsafe_allow_html=True)
+
         # Plasma (Optional, wenn in pulse vorhanden für diesen Tag)
         # Hier generisch, da Plasma eigentlich Tages-abhängig ist, nicht Kin-abhängig (außer im Synchronotron)
 
@@ -229,8 +140,6 @@ def render_oracle_card(role, kin_data, is_destiny=False):
 # 4. MAIN RENDERER (Das Gitter)
 # ==============================================================================
 def render(pulse):
-    inject_oracle_css()
-    
     meta = pulse['metadata']
     if meta['is_leap_day']:
         st.info("Kein Orakel am Tag außerhalb der Zeit.")
@@ -1,202 +1,98 @@
 import streamlit as st
+from stylesheet import css_vars
+from functools import lru_cache
+from types import MappingProxyType
+from math_engine import MathEngine
+
+# Plugin-Manifest (wird vom Host per ast gelesen, ohne Import)
+PLUGIN = {"order": 50, "name": "Zeit-Struktur", "requires": (), "cost": "medium"}
 
 # ==============================================================================
 # 1. VISUAL FX ENGINE (Dual Time-Chip CSS)
 # ==============================================================================
 def inject_time_css(wave_color, castle_color, progress_pct):
-    st.markdown(f"""
-        <style>
-        /* --- SHARED CHIP BASE --- */
-        .time-chip {{
-            background-color: rgba(15, 15, 20, 0.95);
-            border: 1px solid rgba(255,255,255,0.1);
-            border-radius: 4px;
-            color: #e0e0e0;
-            font-family: 'Rajdhani', sans-serif;
-            font-weight: bold;
-            text-transform: uppercase;
-            font-size: 0.85rem;
-            padding: 8px 10px;
-            min-height: 40px;
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-            position: relative;
-            overflow: hidden;
-        }}
-
-        /* --- LEFT: WAVE CHIP (Animated Flux) --- */
-        @keyframes subtle-flux {{
-            0% {{ background-position: 0% 50%; }}
-            50% {{ background-position: 100% 50%; }}
-            100% {{ background-position: 0% 50%; }}
-        }}
-        
-        div[data-testid="column"]:nth-of-type(1) div[data-testid="stExpander"] details summary {{
-            border-left: 4px solid {wave_color} !important;
-            background: linear-gradient(90deg, rgba(15,15,20,0.95) 0%, rgba(40,40,50,0.95) 100%); 
-            color: #fff !important;
-            font-family: 'Orbitron', sans-serif; /* Tech Font für Welle */
-            border-radius: 4px;
-        }}
-        
-        /* Progress Bar im Wave Chip (Unten) */
-        div[data-testid="column"]:nth-of-type(1) div[data-testid="stExpander"] details summary::after {{
-            content: '';
-            position: absolute;
-            bottom: 0;
-            left: 0;
-            height: 3px;
-            background: {wave_color};
-            width: {progress_pct}%;
-            box-shadow: 0 0 10px {wave_color};
-            transition: width 1s ease;
-        }}
-
-        /* --- RIGHT: CASTLE CHIP (Solid Fortress) --- */
-        div[data-testid="column"]:nth-of-type(2) div[data-testid="stExpander"] details summary {{
-            border-right: 4px solid {castle_color} !important;
-            background-color: rgba(15, 15, 20, 0.95) !important;
-            /* Feines Gitter-Muster für Schloss-Look */
-            background-image: linear-gradient(rgba(255,255,255,0.03) 1px, transparent 1px),
-            linear-gradient(90deg, rgba(255,255,255,0.03) 1px, transparent 1px);
-            background-size: 10px 10px;
-            
-            color: #e0e0e0 !important;
-            font-family: 'Orbitron', sans-serif;
-            border-radius: 4px;
-            text-align: right !important;
-            flex-direction: row-reverse;
-        }}
-
-        /* --- CONTENT STYLING --- */
-        .deep-panel {{
-            background: rgba(255,255,255,0.03);
-            padding: 12px;
-            margin-top: 5px;
-            font-size: 0.85rem;
-            border-radius: 4px;
-            border: 1px solid rgba(255,255,255,0.05);
-        }}
-        
-        .section-title {{
-            font-size: 0.75rem;
-            text-transform: uppercase;
-            color: #888;
-            margin-bottom: 4px;
-            display: block;
-            letter-spacing: 1px;
-        }}
-        
-        .highlight-val {{
-            font-size: 1rem;
-            font-weight: bold;
-            color: #fff;
-            margin-bottom: 10px;
-            display: block;
-        }}
-
-        .timeline-row {{
-            display: flex;
-            justify-content: space-between;
-            padding: 4px 0;
-            border-bottom: 1px solid rgba(255,255,255,0.05);
-        }}
-        </style>
-    """, unsafe_allow_html=True)
+    """Farben & Wellen-Fortschritt als CSS-Variablen (Design: styles/mod_time_struct.css)."""
+    st.markdown(css_vars(wave_color=wave_color, castle_color=castle_color,
+                         wave_progress=f"{progress_pct:.1f}%"), unsafe_allow_html=True)
 
 # ==============================================================================
 # 2. DATA LOGIC (Deep Dive Calculation)
 # ==============================================================================
+HEX = {"Rot": "#FF3E3E", "Weiß": "#E0E0E0", "Blau": "#2A8CFF", "Gelb": "#FFD700", "Grün": "#00FF66"}
+
+# Mission des Tones (Coaching Aspekt)
+TONE_MISSIONS = {
+    1: "Zweck: Was ist das Ziel? Ziehe es an.",
+    2: "Herausforderung: Was steht im Weg? Stabilisiere dich.",
+    3: "Dienst: Wie komme ich ins Tun? Aktiviere den Fluss.",
+    4: "Form: Wie sieht der Plan aus? Definiere die Maße.",
+    5: "Strahlkraft: Woher nehme ich die Ressource? Ermächtige dich.",
+    6: "Gleichgewicht: Wie organisiere ich mich? Finde die Balance.",
+    7: "Einstimmung: Wie verbinde ich mich? Kanalisiere die Info.",
+    8: "Integrität: Lebe ich, was ich glaube? Harmonisiere dich.",
+    9: "Absicht: Der letzte Impuls. Realisiere die Bewegung.",
+    10: "Manifestation: Das Ergebnis wird sichtbar. Perfektioniere es.",
+    11: "Befreiung: Was muss gehen? Lasse los (Dissonanz).",
+    12: "Zusammenkunft: Das Fazit. Verstehe das Ganze.",
+    13: "Präsenz: Der Übergang. Feiere den magischen Flug."
+}
+
+# Schlösser (Index = castle - 1): Kurzname, Thema, Akt, Richtung
+CASTLES = (
+    ("Rotes Schloss", "Wende", "Geburt / Initiierung", "Osten"),
+    ("Weißes Schloss", "Kreuzen", "Tod / Läuterung", "Norden"),
+    ("Blaues Schloss", "Brennen", "Magie / Wandel", "Westen"),
+    ("Gelbes Schloss", "Geben", "Reife / Intelligenz", "Süden"),
+    ("Grünes Schloss", "Zauber", "Matrix / Sync", "Zentrum")
+)
+
+# Ergebnisse hängen nur vom Kin ab -> einmal pro Kin bauen (max. 260 Einträge).
+# Der lru_cache teilt sie zwischen allen Sessions -> nur lesbar (MappingProxyType/Tupel)
+@lru_cache(maxsize=260)
 def get_wave_data(kin):
-    kin_idx = kin - 1
-    
-    # 1. Basis-Werte
-    wave_start_idx = (kin_idx // 13) * 13
-    wave_start_kin = wave_start_idx + 1
-    current_tone = (kin_idx % 13) + 1
-    progress = (current_tone / 13) * 100
-    
-    # 2. Farbe & Name (Start-Siegel)
-    start_seal_id = wave_start_idx % 20
-    seal_names = ["Drache", "Wind", "Nacht", "Samen", "Schlange", "Weltenüberbrücker", "Hand", "Stern", "Mond", "Hund", "Affe", "Mensch", "Himmelswanderer", "Magier", "Adler", "Krieger", "Erde", "Spiegel", "Sturm", "Sonne"]
-    
-    colors = ["Rot", "Weiß", "Blau", "Gelb"]
-    wave_color_name = colors[start_seal_id % 4]
-    wave_color_hex = {"Rot":"#FF3E3E", "Weiß":"#E0E0E0", "Blau":"#2A8CFF", "Gelb":"#FFD700"}[wave_color_name]
-    
-    # 3. Mission des Tones (Coaching Aspekt)
-    tone_missions = {
-        1: "Zweck: Was ist das Ziel? Ziehe es an.",
-        2: "Herausforderung: Was steht im Weg? Stabilisiere dich.",
-        3: "Dienst: Wie komme ich ins Tun? Aktiviere den Fluss.",
-        4: "Form: Wie sieht der Plan aus? Definiere die Maße.",
-        5: "Strahlkraft: Woher nehme ich die Ressource? Ermächtige dich.",
-        6: "Gleichgewicht: Wie organisiere ich mich? Finde die Balance.",
-        7: "Einstimmung: Wie verbinde ich mich? Kanalisiere die Info.",
-        8: "Integrität: Lebe ich, was ich glaube? Harmonisiere dich.",
-        9: "Absicht: Der letzte Impuls. Realisiere die Bewegung.",
-        10: "Manifestation: Das Ergebnis wird sichtbar. Perfektioniere es.",
-        11: "Befreiung: Was muss gehen? Lasse los (Dissonanz).",
-        12: "Zusammenkunft: Das Fazit. Verstehe das Ganze.",
-        13: "Präsenz: Der Übergang. Feiere den magischen Flug."
-    }
-    
-    return {
-        "name": f"{seal_names[start_seal_id]}",
-        "fullname": f"Welle des {seal_names[start_seal_id]}n",
-        "tone": current_tone,
-        "progress": progress,
-        "start": wave_start_kin,
-        "end": wave_start_kin + 12,
-        "color": wave_color_hex,
-        "mission": tone_missions.get(current_tone, "Sein."),
-        "purpose_kin": f"Kin {wave_start_kin}",
-        "goal_kin": f"Kin {wave_start_kin + 12}"
-    }
+    s = MathEngine.get_structure(kin)
+    seal_name = MathEngine.SEAL_NAMES[s.wave_seal_id - 1]
+    return MappingProxyType({
+        "name": seal_name,
+        "fullname": f"Welle des {seal_name}n",
+        "tone": s.wave_position,
+        "progress": s.wave_position / 13 * 100,
+        "start": s.wave_start,
+        "end": s.wave_end,
+        "color": HEX[s.wave_color],
+        "mission": TONE_MISSIONS.get(s.wave_position, "Sein."),
+        "purpose_kin": f"Kin {s.wave_start}",
+        "goal_kin": f"Kin {s.wave_end}"
+    })
 
+@lru_cache(maxsize=260)
 def get_castle_data(kin):
-    kin_idx = kin - 1
-    castle_idx = kin_idx // 52
-    
-    castles = [
-        {"name": "Rotes Schloss", "sub": "Wende", "act": "Geburt / Initiierung", "dir": "Osten", "color": "#FF3E3E"},
-        {"name": "Weißes Schloss", "sub": "Kreuzen", "act": "Tod / Läuterung", "dir": "Norden", "color": "#E0E0E0"},
-        {"name": "Blaues Schloss", "sub": "Brennen", "act": "Magie / Wandel", "dir": "Westen", "color": "#2A8CFF"},
-        {"name": "Gelbes Schloss", "sub": "Geben", "act": "Reife / Intelligenz", "dir": "Süden", "color": "#FFD700"},
-        {"name": "Grünes Schloss", "sub": "Zauber", "act": "Matrix / Sync", "dir": "Zentrum", "color": "#00FF66"}
-    ]
-    c = castles[castle_idx]
-    
-    day_in_castle = (kin_idx % 52) + 1
-    
-    # Die 4 Wellen im Schloss berechnen
+    s = MathEngine.get_structure(kin)
+    name, sub, act, direction = CASTLES[s.castle - 1]
+
+    # Die 4 Wellen im Schloss
+    first_wave = (s.castle - 1) * 4 + 1
     waves_in_castle = []
-    castle_start_kin = (castle_idx * 52) + 1
-    w_colors = ["Rot", "Weiß", "Blau", "Gelb"]
-    
-    current_wave_idx = (day_in_castle - 1) // 13
-    
-    for i in range(4):
-        w_start = castle_start_kin + (i * 13)
-        waves_in_castle.append({
-            "label": f"{w_colors[i]}e Welle",
-            "range": f"{w_start}-{w_start+12}",
-            "active": (i == current_wave_idx)
-        })
-        
-    return {**c, "day": day_in_castle, "sub_waves": waves_in_castle}
+    for wave in range(first_wave, first_wave + 4):
+        w = MathEngine.get_structure((wave - 1) * 13 + 1)
+        waves_in_castle.append(MappingProxyType({
+            "label": f"{w.wave_color}e Welle",
+            "range": f"{w.wave_start}-{w.wave_end}",
+            "active": (wave == s.wave)
+        }))
+
+    return MappingProxyType({"name": name, "sub": sub, "act": act, "dir": direction, "color": HEX[s.castle_color],
+                             "day": s.castle_position, "sub_waves": tuple(waves_in_castle)})
 
 # ==============================================================================
 # 3. RENDERER
 # ==============================================================================
 def render(pulse):
-    meta = pulse['metadata']
-    if meta['is_leap_day']: return
+    if pulse.is_leap_day: return
     
     # Daten
-    wave = get_wave_data(meta['kin'])
-    castle = get_castle_data(meta['kin'])
+    wave = get_wave_data(pulse.kin)
+    castle = get_castle_data(pulse.kin)
     
     # Style
     inject_time_css(wave['color'], castle['color'], wave['progress'])
@@ -0,0 +1,141 @@
+# ==============================================================================
+# 🔥 PROFILER (cProfile pro Modul, über mehrere Reruns gesammelt)
+# ------------------------------------------------------------------------------
+# ZWECK:    Opt-in für langsame Reruns (Staging): get_pulse und jeder Modul-Render
+#           laufen unter cProfile. Die Stats werden pro Ziel über N Reruns
+#           aufsummiert -> Top-N Funktionen nach kumulierter Zeit.
+# EXPORT:   .pstats (marshal, wie pstats.Stats.dump_stats) -> z.B. snakeviz,
+#           flameprof oder gprof2dot für die Flame-/Call-Graph-Ansicht.
+# GRENZEN:  - Es profiliert immer nur EIN Thread gleichzeitig (ab Python 3.12 ist
+#             cProfile prozessweit); parallele Sessions laufen dann unprofiliert.
+#           - Profilierte Läufe sind langsamer (Faktor 2-5) - auch in den Metriken.
+# AUSWERTEN: python profiler.py profil.pstats [N]
+# HINWEIS:  Kein Streamlit-Import.
+# ==============================================================================
+
+import cProfile
+import marshal
+import os
+import pstats
+import sys
+import threading
+
+# Reruns, über die gesammelt wird (danach eingefroren bis reset())
+PROFILE_RERUNS = 10
+PROFILE_TOP_N = 15
+
+# Ein Profiler pro Prozess aktiv (cProfile verträgt keine zwei gleichzeitig)
+_ACTIVE = threading.Lock()
+
+class ProfileSession:
+    """Gesammelte cProfile-Stats einer Session: Ziel (get_pulse, Modulname) -> pstats.Stats."""
+
+    def __init__(self, reruns=PROFILE_RERUNS):
+        self.reruns = reruns
+        self.captured = 0   # bereits profilierte Reruns
+        self.skipped = 0    # Aufrufe ohne Profil (anderer Thread profilierte gerade)
+        self.stats = {}     # Ziel -> pstats.Stats
+
+    @property
+    def collecting(self):
+        return self.captured < self.reruns
+
+    def begin_rerun(self):
+        """Am Anfang jedes Reruns aufrufen. False = N Reruns erreicht, es wird nicht mehr profiliert."""
+        if not self.collecting:
+            return False
+        self.captured += 1
+        return True
+
+    def run(self, target, func, *args, **kwargs):
+        """
+        func(*args, **kwargs) ausführen und unter `target` profilieren.
+        Nur in Reruns aufrufen, für die begin_rerun() True geliefert hat.
+        """
+        if not _ACTIVE.acquire(blocking=False):
+            self.skipped += 1
+            return func(*args, **kwargs)
+        profile = cProfile.Profile()
+        try:
+            return profile.runcall(func, *args, **kwargs)
+        finally:
+            _ACTIVE.release()
+            self._add(target, profile)
+
+    def _add(self, target, profile):
+        current = self.stats.get(target)
+        if current is None:
+            self.stats[target] = pstats.Stats(profile)
+        else:
+            current.add(profile)
+
+    def targets(self):
+        return list(self.stats)
+
+    def top(self, target, n=PROFILE_TOP_N):
+        """
+        Top-N Funktionen nach kumulierter Zeit als Liste von dicts:
+        function, calls ("gesamt/primitiv" bei Rekursion), tottime_ms, cumtime_ms.
+        """
+        stats = self.stats.get(target)
+        if stats is None:
+            return []
+        rows = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:n]
+        return [{
+            "function": label(func),
+            "calls": str(nc) if nc == cc else f"{nc}/{cc}",
+            "tottime_ms": round(tt * 1e3, 3),
+            "cumtime_ms": round(ct * 1e3, 3),
+        } for func, (cc, nc, tt, ct, _callers) in rows]
+
+    def total_ms(self, target):
+        """Gesamtzeit eines Ziels (Summe der Eigenzeiten aller Funktionen)."""
+        stats = self.stats.get(target)
+        return stats.total_tt * 1e3 if stats is not None else 0.0
+
+    def dump(self, target=None):
+        """.pstats-Bytes eines Ziels (None = alle Ziele zusammen). Lesbar mit pstats.Stats(pfad)."""
+        if target is not None:
+            return marshal.dumps(self.stats[target].stats)
+        merged = pstats.Stats()
+        for stats in self.stats.values():
+            merged.add(stats)
+        return marshal.dumps(merged.stats)
+
+    def reset(self):
+        self.captured = 0
+        self.skipped = 0
+        self.stats.clear()
+
+    def summary(self):
+        """Kurzreport für den Debug-Modus."""
+        state = "sammelt" if self.collecting else "fertig"
+        note = f" • {self.skipped} Aufrufe ohne Profil (paralleler Profiler)" if self.skipped else ""
+        return f"{self.captured}/{self.reruns} Reruns ({state}) • {len(self.stats)} Ziele{note}"
+
+def label(func):
+    """(datei, zeile, name) -> 'name (datei.py:zeile)'; Builtins ohne Datei."""
+    filename, line, name = func
+    if filename == "~":
+        return name
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+# ==============================================================================
+# 🛠 TERMINAL: Heruntergeladene .pstats-Datei auswerten
+# ==============================================================================
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Aufruf: python profiler.py profil.pstats [N]")
+        sys.exit(1)
+    try:
+        loaded = pstats.Stats(sys.argv[1])
+    except (OSError, ValueError, EOFError) as e:
+        print(f"❌ {sys.argv[1]}: {e}")
+        sys.exit(1)
+    session = ProfileSession()
+    session.stats["datei"] = loaded
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else PROFILE_TOP_N
+    print(f"🔥 Top {n} nach kumulierter Zeit ({sys.argv[1]}, gesamt {session.total_ms('datei'):.1f}ms)")
+    print(f"   {'cumtime':>10} {'tottime':>10} {'calls':>10}  Funktion")
+    for row in session.top("datei", n):
+        print(f"   {row['cumtime_ms']:8.2f}ms {row['tottime_ms']:8.2f}ms {row['calls']:>10}  {row['function']}")
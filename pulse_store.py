@@ -0,0 +1,127 @@
+# ==============================================================================
+# 💽 PULSE STORE (Persistenter Pulse-Cache auf der Platte)
+# ------------------------------------------------------------------------------
+# ZWECK:    Fertige Pulse überleben Neustarts & Deploys. Alle Worker-Prozesse
+#           eines Hosts teilen sich EINE sqlite3-Datei (WAL-Modus).
+# SCHLÜSSEL: (Datum, Inhalts-Hash der JSON-DBs). Ändert sich eine DB, passt der
+#           Hash nicht mehr -> Miss.
+# AUFRÄUMEN: Einträge ANDERER Versionen werden erst gelöscht, wenn sie älter als
+#           STALE_SECONDS sind - beim Rolling Deploy laufen Worker mit alter und
+#           neuer DB/Python-Version parallel auf derselben Datei und dürfen sich
+#           nicht gegenseitig die Einträge wegräumen. Geprüft alle PURGE_INTERVAL.
+# FORMAT:   marshal (schnell, aber an die Python-Version gebunden -> Teil des Hashes)
+# ==============================================================================
+
+import marshal
+import sqlite3
+import sys
+import threading
+import time
+
+# Alles, was ein kaputter/gesperrter Cache werfen kann -> wie ein Miss behandeln
+CACHE_ERRORS = (sqlite3.Error, OSError, ValueError, EOFError, TypeError)
+
+# Fremde Versionen, die so lange nicht geschrieben wurden, gelten als verwaist
+STALE_SECONDS = 24 * 3600
+PURGE_INTERVAL = 3600
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pulses (
+    date     TEXT NOT NULL,
+    version  TEXT NOT NULL,
+    payload  BLOB NOT NULL,
+    created  REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (date, version)
+)
+"""
+
+class PersistentPulseCache:
+    """
+    sqlite3-Cache Datum -> serialisierter Pulse (plain dict/list/str/int).
+    Eine Verbindung pro Thread; Schreibfehler (Platte voll, gesperrt) werden
+    geschluckt - der Cache ist ein Beschleuniger, keine Quelle der Wahrheit.
+    """
+
+    def __init__(self, path, timeout=5.0, stale_seconds=STALE_SECONDS):
+        self.path = path
+        self.timeout = timeout
+        self.stale_seconds = stale_seconds
+        self._local = threading.local()
+        self._next_purge = 0.0
+        self.stats = {"hits": 0, "misses": 0, "writes": 0, "purged": 0, "errors": 0}
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(SCHEMA)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(pulses)")}
+            if "created" not in columns:
+                # Datei aus einer älteren Version: Alt-Einträge zählen als uralt (created = 0)
+                conn.execute("ALTER TABLE pulses ADD COLUMN created REAL NOT NULL DEFAULT 0")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _version_key(version):
+        return f"{version}:py{sys.version_info[0]}.{sys.version_info[1]}"
+
+    def _purge_stale(self, conn, key):
+        """
+        Höchstens alle PURGE_INTERVAL: Einträge anderer Versionen löschen, die älter als
+        stale_seconds sind. Die eigene Version und frisch geschriebene fremde bleiben.
+        """
+        now = time.time()
+        if now < self._next_purge:
+            return
+        self._next_purge = now + PURGE_INTERVAL
+        cursor = conn.execute("DELETE FROM pulses WHERE version != ? AND created < ?",
+                              (key, now - self.stale_seconds))
+        self.stats["purged"] += max(cursor.rowcount, 0)
+
+    def get(self, date_key, version):
+        """Gespeicherter Pulse (plain dict) oder None."""
+        key = self._version_key(version)
+        try:
+            conn = self._connect()
+            self._purge_stale(conn, key)
+            row = conn.execute(
+                "SELECT payload FROM pulses WHERE date = ? AND version = ?", (date_key, key)
+            ).fetchone()
+            data = marshal.loads(row[0]) if row else None
+        except CACHE_ERRORS:
+            self.stats["errors"] += 1
+            data = None
+        self.stats["hits" if data is not None else "misses"] += 1
+        return data
+
+    def put(self, date_key, version, data):
+        """Speichert einen Pulse (plain dict). Fehler werden nur gezählt."""
+        try:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO pulses (date, version, payload, created) VALUES (?, ?, ?, ?)",
+                (date_key, self._version_key(version), marshal.dumps(data), time.time()),
+            )
+            self.stats["writes"] += 1
+        except CACHE_ERRORS:
+            self.stats["errors"] += 1
+
+    def clear(self):
+        try:
+            self._connect().execute("DELETE FROM pulses")
+        except CACHE_ERRORS:
+            self.stats["errors"] += 1
+
+    def __len__(self):
+        try:
+            return self._connect().execute("SELECT COUNT(*) FROM pulses").fetchone()[0]
+        except CACHE_ERRORS:
+            return 0
+
+    def summary(self):
+        """Kurzreport für den Debug-Modus."""
+        return (f"{self.stats['hits']} Hits / {self.stats['misses']} Misses • "
+                f"{self.stats['writes']} geschrieben • {len(self)} Einträge")
@@ -0,0 +1,164 @@
+# ==============================================================================
+# 🎨 STYLESHEET (Ein statisches, minifiziertes CSS für die ganze App)
+# ------------------------------------------------------------------------------
+# ZWECK:    Alle Styles liegen als Quell-CSS in styles/ (base.css + <plugin>.css).
+#           Der Build-Schritt fasst sie in Plugin-Reihenfolge zu EINER minifizierten
+#           Datei static/v21.min.css zusammen (doppelte Regeln fliegen raus).
+# AUSLIEFERUNG: Streamlit serviert static/ (server.enableStaticServing) -> der Host
+#           sendet pro Rerun nur noch ein <link>-Tag; das CSS lädt der Browser EINMAL.
+#           Ohne Static-Serving: Fallback auf einen (minifizierten) <style>-Block.
+# FARBEN:   Dynamische Werte setzen die Module als CSS-Variablen (css_vars), z.B.
+#           <style>:root{--wave-color:#FF3E3E}</style> statt ganzer f-String-Blöcke.
+# BUILD:    python stylesheet.py
+# HINWEIS:  Kein Streamlit-Import.
+# ==============================================================================
+
+import collections
+import hashlib
+import os
+import re
+import sys
+
+# Relativ zu dieser Datei: Streamlit serviert static/ neben dem Haupt-Skript (app.py)
+ROOT = os.path.dirname(os.path.abspath(__file__))
+SOURCE_DIR = os.path.join(ROOT, "styles")
+PLUGIN_DIR = os.path.join(ROOT, "modules")
+BASE_SOURCE = "base.css"
+OUTPUT_PATH = os.path.join(ROOT, "static", "v21.min.css")
+STATIC_URL = "app/static/v21.min.css"
+
+Stylesheet = collections.namedtuple("Stylesheet", ["css", "version", "sources", "source_bytes", "served"])
+
+# Strings bleiben beim Minifizieren unangetastet (url('...'), content: '')
+_STRING = re.compile(r"""("(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')""")
+_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_SPACE = re.compile(r"\s+")
+_TIGHT = re.compile(r"\s*([{};,>])\s*")
+
+def minify(css):
+    """Kommentare & Whitespace raus; Leerzeichen in Strings bleiben erhalten."""
+    parts = _STRING.split(_COMMENT.sub("", css))
+    for i in range(0, len(parts), 2):  # gerade Indizes = außerhalb von Strings
+        text = _SPACE.sub(" ", parts[i])
+        text = _TIGHT.sub(r"\1", text)
+        parts[i] = text.replace(": ", ":")
+    return "".join(parts).replace(";}", "}").strip()
+
+def split_rules(css):
+    """Zerlegt minifiziertes CSS in Top-Level-Regeln (inkl. @keyframes-Blöcken)."""
+    rules, depth, start = [], 0, 0
+    for i, char in enumerate(_STRING.sub(lambda m: "_" * len(m.group(0)), css)):
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                rules.append(css[start:i + 1])
+                start = i + 1
+        elif char == ";" and depth == 0:  # @import ...;
+            rules.append(css[start:i + 1])
+            start = i + 1
+    if css[start:].strip():
+        rules.append(css[start:])
+    return rules
+
+def dedupe(rules):
+    """
+    Identische Regeln nur einmal (die LETZTE bleibt stehen). Kaskaden-neutral:
+    die spätere Kopie hat ohnehin das letzte Wort.
+    """
+    seen = set()
+    kept = []
+    for rule in reversed(rules):
+        if rule not in seen:
+            seen.add(rule)
+            kept.append(rule)
+    return kept[::-1]
+
+def source_paths(source_dir=SOURCE_DIR, plugin_dir=PLUGIN_DIR):
+    """base.css zuerst, dann <plugin>.css in Render-Reihenfolge, dann der Rest (alphabetisch)."""
+    from module_registry import PluginCatalog
+
+    try:
+        available = sorted(n for n in os.listdir(source_dir) if n.endswith(".css"))
+    except OSError:
+        return []
+    ordered = [BASE_SOURCE] if BASE_SOURCE in available else []
+    for meta in PluginCatalog(plugin_dir).manifest():
+        if f"{meta['id']}.css" in available:
+            ordered.append(f"{meta['id']}.css")
+    ordered += [n for n in available if n not in ordered]
+    return [os.path.join(source_dir, n) for n in ordered]
+
+def compile_css(paths):
+    """Liest & minifiziert alle Quellen zu einem String. Rückgabe: (css, Quell-Bytes)."""
+    chunks, source_bytes = [], 0
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+        source_bytes += len(text.encode("utf-8"))
+        chunks.extend(split_rules(minify(text)))
+    return "".join(dedupe(chunks)), source_bytes
+
+def build(output_path=OUTPUT_PATH, source_dir=SOURCE_DIR, plugin_dir=PLUGIN_DIR):
+    """
+    Kompiliert das Stylesheet und schreibt es (atomar, nur bei Änderung) nach output_path.
+    `served` ist False, wenn die Datei nicht geschrieben werden konnte (read-only) ->
+    der Host muss dann inline ausliefern.
+    """
+    paths = source_paths(source_dir, plugin_dir)
+    css, source_bytes = compile_css(paths)
+    data = css.encode("utf-8")
+    version = hashlib.sha256(data).hexdigest()[:12]
+
+    served = True
+    try:
+        with open(output_path, "rb") as f:
+            current = f.read() == data
+    except OSError:
+        current = False
+    if not current:
+        try:
+            os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+            tmp_path = output_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, output_path)
+        except OSError:
+            served = False
+    return Stylesheet(css, version, tuple(paths), source_bytes, served)
+
+# ==============================================================================
+# 🧩 HTML-SCHNIPSEL (für Host & Module)
+# ==============================================================================
+def link_tag(sheet):
+    """Verweis auf die statische Datei; ?v=<hash> erzwingt Neuladen nach einem Build."""
+    return f'<link rel="stylesheet" href="{STATIC_URL}?v={sheet.version}">'
+
+def style_tag(sheet):
+    """Fallback ohne Static-Serving: das ganze (minifizierte) CSS inline."""
+    return f"<style>{sheet.css}</style>"
+
+def css_vars(**values):
+    """
+    Dynamische Werte als CSS-Variablen auf :root.
+    css_vars(wave_color="#FF3E3E", wave_progress="46%") -> <style>:root{--wave-color:#FF3E3E;--wave-progress:46%}</style>
+    """
+    decls = ";".join(f"--{name.replace('_', '-')}:{value}" for name, value in values.items())
+    return f"<style>:root{{{decls}}}</style>"
+
+# ==============================================================================
+# 🛠 BUILD-SCHRITT
+# ==============================================================================
+if __name__ == "__main__":
+    sheet = build()
+    if not sheet.sources:
+        print(f"❌ Keine Quellen in {os.path.relpath(SOURCE_DIR)}/")
+        sys.exit(1)
+    if not sheet.served:
+        print(f"❌ {os.path.relpath(OUTPUT_PATH)} konnte nicht geschrieben werden")
+        sys.exit(1)
+    out_bytes = len(sheet.css.encode("utf-8"))
+    print(f"✅ Stylesheet geschrieben: {os.path.relpath(OUTPUT_PATH)} (v={sheet.version})")
+    print(f"   -> Quellen: {len(sheet.sources)} Dateien, {sheet.source_bytes / 1024:.1f} KB | "
+          f"minifiziert: {out_bytes / 1024:.1f} KB")